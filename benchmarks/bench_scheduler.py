@@ -0,0 +1,164 @@
+"""
+    Benchmarks for the scheduler hot paths.
+
+    For every algorithm of algorithm_factory and every workload size, measures in an isolated
+    worker process:
+    - process generation throughput (ProcessGenerator, processes/s)
+    - simulation throughput, driving the headless Scheduler with the event engine or the
+      tick loop (runSchedulingCycle): scheduling decisions/s and completed processes/s
+    - peak resident memory of the worker
+
+    Results are written as JSON so runs can be compared over time:
+
+        python benchmarks/bench_scheduler.py --sizes 1e3 1e4 1e5 1e6 --out bench.json
+"""
+import argparse
+import copy
+import datetime
+import json
+import os
+import platform
+import resource
+import signal
+import subprocess
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from algorithms.algorithm_factory import AVAILABLE_ALGORITHMS
+from config.config import Config
+from event_engine import EventEngine
+from processes.arrival_cursor import createArrivalCursor
+from processes.process_generation import ProcessGenerator
+from scheduler_core import Scheduler
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config.json")
+
+def _onTimeout(signum, frame):
+    raise TimeoutError("benchmark case exceeded its time limit")
+
+# Config generating about numProcesses processes with the base arrival rate
+def workloadConfig(baseConfig, algorithm, numProcesses):
+    config = copy.deepcopy(baseConfig)
+    config["scheduling"]["schedulingAlgorithm"] = algorithm
+    processGeneration = config["processGeneration"]
+    processGeneration["useProcessGeneration"] = True
+    processGeneration["maxTime"] = numProcesses / processGeneration["arrival"]["lambda"]
+
+    return config
+
+def runTickBased(scheduler, processes):
+    arrivals = createArrivalCursor(processes)
+    currentTime = 0
+
+    while not arrivals.isExhausted() or scheduler.hasRunningProcesses():
+        currentTime += 1
+        newProcesses = arrivals.popDue(currentTime)
+        if newProcesses:
+            scheduler.receiveNewProcesses(newProcesses)
+        scheduler.runSchedulingCycle()
+
+    return currentTime
+
+# Runs one case, meant to be called in a fresh worker process so peak memory is per case
+def runCase(baseConfig, algorithm, numProcesses, engine, timeout):
+    result = {"algorithm": algorithm, "size": numProcesses, "engine": engine}
+
+    if timeout:
+        signal.signal(signal.SIGALRM, _onTimeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        config = Config(workloadConfig(baseConfig, algorithm, numProcesses))
+
+        start = time.perf_counter()
+        processes = ProcessGenerator(config.processGenerationConfig).generate_process_table()
+        generationSeconds = time.perf_counter() - start
+
+        scheduler = Scheduler(config.schedulingConfig)
+
+        start = time.perf_counter()
+        if engine == "tick":
+            simulatedTime = runTickBased(scheduler, processes)
+        else:
+            eventEngine = EventEngine(scheduler, processes)
+            eventEngine.run()
+            simulatedTime = eventEngine.now
+        simulationSeconds = time.perf_counter() - start
+
+        finished = scheduler.metrics.count + scheduler.deadlineMissCount
+        result.update({
+            "status": "ok",
+            "processes": len(processes),
+            "generationSeconds": generationSeconds,
+            "generatedPerSecond": len(processes) / generationSeconds if generationSeconds else None,
+            "simulationSeconds": simulationSeconds,
+            "simulatedTime": simulatedTime,
+            "schedulingDecisions": scheduler.processSwitchCount,
+            "decisionsPerSecond": scheduler.processSwitchCount / simulationSeconds if simulationSeconds else None,
+            "processesPerSecond": finished / simulationSeconds if simulationSeconds else None,
+        })
+    except TimeoutError as e:
+        result.update({"status": "timeout", "error": str(e)})
+    except Exception as e:
+        result.update({"status": "failed", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peakMemoryMB"] = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    return result
+
+def gitCommit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the scheduler hot paths")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="base config the workloads are derived from")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e3, 1e4, 1e5, 1e6], help="number of processes per workload")
+    parser.add_argument("--algorithms", nargs="+", default=AVAILABLE_ALGORITHMS)
+    parser.add_argument("--engine", choices=["event", "tick"], default="event")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds allowed per case")
+    parser.add_argument("--out", default="bench.json", help="JSON file the results are written to")
+    args = parser.parse_args(argv)
+
+    with open(args.config, 'r') as file:
+        baseConfig = json.load(file)
+
+    results = []
+
+    for algorithm in args.algorithms:
+        for size in args.sizes:
+            # A fresh process per case keeps peak memory measurements independent
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(runCase, baseConfig, algorithm, int(size), args.engine, args.timeout).result()
+
+            results.append(result)
+            print(f"{algorithm:40s} {int(size):>9d} {result['status']:8s} "
+                  f"{result.get('decisionsPerSecond') or 0:>12.0f} decisions/s "
+                  f"{result.get('processesPerSecond') or 0:>12.0f} processes/s "
+                  f"{result['peakMemoryMB']:>8.1f} MB", file=sys.stderr)
+
+    report = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": gitCommit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "engine": args.engine,
+        "results": results,
+    }
+
+    with open(args.out, 'w') as file:
+        json.dump(report, file, indent=2)
+
+if __name__ == "__main__":
+    main()
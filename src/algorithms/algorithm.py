@@ -2,22 +2,94 @@ from abc import ABC, abstractmethod
 from processes.process import Process
 from typing import List, Optional
 
+from .process_heap import ProcessHeap
+
 class Algorithm(ABC):
+    # Whether processes should be dropped when their deadline expires
+    uses_deadlines = False
+    # Time quantum of quantum based algorithms, None if processes run until they finish or are preempted
+    time_quantum = None
+    # Reason reported when should_preempt() takes the running process off the CPU
+    preemption_reason = None
+    # Whether schedule() takes the process off the ready queue (Round Robin)
+    # or leaves it queued while it runs until it completes or is preempted
+    schedule_dequeues = False
+    # Seconds between two calls to boost(), None if the algorithm has no periodic work
+    boost_interval = None
+
     def __init__(self):
-        pass 
-    
+        pass
+
     # Selects the next process to be executed.
     # Returns None if there isn't any process to be executed
     @abstractmethod
     def schedule(self) -> Optional[Process]:
         pass
-    
+
     # Called when a new process arrives
     @abstractmethod
     def process_arrival(self, process: Process) -> None:
         pass
-    
+
     # Called when a process finished his execution
     @abstractmethod
     def process_completion(self, process: Process) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    # Called when the running process is taken off the CPU before finishing.
+    # Algorithms whose schedule() keeps the process queued don't need to do anything
+    def process_preemption(self, process: Process, reason: str) -> None:
+        pass
+
+    # Called when the ready set changed, returns True if a waiting process
+    # should take the CPU from the current one. Non-preemptive algorithms never preempt
+    def should_preempt(self, current: Process) -> bool:
+        return False
+
+    # Time quantum of the process about to run, algorithms with one quantum per queue level override it
+    def quantum_for(self, process: Process) -> Optional[float]:
+        return self.time_quantum
+
+    # Periodic work of the algorithm (priority boost of feedback queues), every boost_interval seconds
+    def boost(self) -> None:
+        pass
+
+    # Order of the process for this algorithm, lower runs first. With several CPUs, the CPU
+    # running the process with the highest rank is the one preempted
+    def rank(self, process: Process) -> float:
+        return 0
+
+    # Number of processes waiting in the ready queue
+    def waiting_count(self) -> int:
+        return len(self.ready_queue)
+
+    """
+        Multi-CPU scheduling, where the running processes are held by the CPUs:
+        take() dispatches the next process and always removes it from the ready queue,
+        a preempted process comes back with give_back() and a released periodic one
+        with process_arrival(). Heap queues keep the place of the taken process among
+        equal keys, so one CPU schedules exactly like the single CPU scheduler.
+    """
+    def take(self) -> Optional[Process]:
+        process = self.schedule()
+        if process is not None and not self.schedule_dequeues:
+            if isinstance(self.ready_queue, ProcessHeap):
+                self.ready_queue.hold(process)
+            else:
+                self.ready_queue.remove(process)
+
+        return process
+
+    # Takes the next waiting process for good, to move it to the ready queue of another CPU
+    def steal(self) -> Optional[Process]:
+        process = self.take()
+        if process is not None and isinstance(self.ready_queue, ProcessHeap):
+            self.ready_queue.discard(process)
+
+        return process
+
+    def give_back(self, process: Process, reason: str) -> None:
+        if self.schedule_dequeues:
+            self.process_preemption(process, reason)
+        else:
+            self.process_arrival(process)
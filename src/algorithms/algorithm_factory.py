@@ -4,29 +4,55 @@ from algorithms.priority import PriorityNonPreemptive, PriorityPreemptive
 from algorithms.round_robin import RoundRobin
 from algorithms.rate_monotonic import RateMonotonic
 from algorithms.earliest_deadline import EarliestDeadline
+from algorithms.multilevel_queue import MultilevelQueueScheduling
+from algorithms.completely_fair import CompletelyFair
 
 from config.types.scheduling import SchedulingConfig
 
+# Names accepted by create_algorithm, as shown in the scheduling panel
+AVAILABLE_ALGORITHMS = [
+    "First-Come, First-Served",
+    "Shortest Job First",
+    "Priority Scheduling (Non-Preemptive)",
+    "Priority Scheduling (Preemptive)",
+    "Round Robin",
+    "Multilevel Queue Scheduling",
+    "Completely Fair Scheduler",
+    "Rate Monotonic",
+    "Earliest Deadline First",
+]
+
 def create_algorithm(config: SchedulingConfig):
     algorithmName = config.scheduleAlgorithm.upper()
     
     match algorithmName:
-        case "FIRST-COME, FIRST-SERVED":
+        case "FIRST-COME, FIRST-SERVED" | "FCFS":
             return FCFS()
-        case "SHORTEST JOB FIRST":
+        case "SHORTEST JOB FIRST" | "SJF":
             return ShortestJob()
         case "PRIORITY SCHEDULING (NON-PREEMPTIVE)":
             return PriorityNonPreemptive()
         case "PRIORITY SCHEDULING (PREEMPTIVE)":
             return PriorityPreemptive()
-        case "ROUND ROBIN":
+        case "ROUND ROBIN" | "RR":
             if config and config.timeQuantum:
                 return RoundRobin(time_quantum=config.timeQuantum)
             else:
                 raise ValueError("Time quantum must be specified for Round Robin scheduling")
-        case "RATE MONOTONIC":
+        case "MULTILEVEL QUEUE SCHEDULING" | "MLFQ":
+            if config and config.timeQuantum:
+                return MultilevelQueueScheduling(time_quantum=config.timeQuantum, levels=config.queueLevels,
+                                                 boost_interval=config.boostInterval)
+            else:
+                raise ValueError("Time quantum must be specified for Multilevel Queue scheduling")
+        case "COMPLETELY FAIR SCHEDULER" | "CFS":
+            if config and config.timeQuantum:
+                return CompletelyFair(time_quantum=config.timeQuantum)
+            else:
+                raise ValueError("Time quantum must be specified for Completely Fair scheduling")
+        case "RATE MONOTONIC" | "RM":
             return RateMonotonic()
-        case "EARLIEST DEADLINE FIRST":
+        case "EARLIEST DEADLINE FIRST" | "EDF":
             return EarliestDeadline()
         case _:
             raise ValueError(f"Unknown scheduling algorithm: {algorithmName}")
\ No newline at end of file
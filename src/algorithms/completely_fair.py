@@ -0,0 +1,130 @@
+from .algorithm import Algorithm
+from .process_heap import ProcessHeap
+from processes.process import Process
+from typing import Dict, Optional, Tuple
+
+# Weight of a process running at priority 0, its virtual runtime advances at real speed
+NICE_0_WEIGHT = 1024
+# Linux weights of nice 0 to 9, every step gets about 25% less CPU than the one above
+PRIORITY_WEIGHTS = [1024, 820, 655, 526, 423, 335, 272, 215, 172, 137]
+# The slice of a process is never shorter than this fraction of the scheduling latency
+MIN_GRANULARITY_RATIO = 1 / 8
+# A waking process preempts the running one when it is behind it by more than this fraction of the latency
+WAKEUP_GRANULARITY_RATIO = 1 / 6
+
+def priorityWeight(priority) -> float:
+    if 0 <= priority < len(PRIORITY_WEIGHTS):
+        return PRIORITY_WEIGHTS[priority]
+    return NICE_0_WEIGHT / 1.25 ** priority
+
+"""
+    Completely Fair Scheduler (CFS): every process gets a share of the CPU proportional to
+    its weight, derived from its priority like the Linux nice levels.
+
+    - a running process accumulates virtual runtime, its run time scaled by NICE_0_WEIGHT / weight,
+      so heavier processes age slower
+    - the waiting process with the least virtual runtime runs next
+    - its slice is its weighted share of the scheduling latency (time_quantum), stretched so no
+      slice gets shorter than the minimum granularity when many processes are runnable.
+      The slice is fixed when the process is dispatched, processes leaving meanwhile don't stretch it
+    - a waiting process whose virtual runtime is behind the running one's by more than the
+      wakeup granularity preempts it
+    - new processes start at the smallest virtual runtime seen, so they neither
+      starve nor monopolize the CPU
+
+    Waiting processes are kept in a ProcessHeap keyed by virtual runtime: O(log n) insert and
+    pick-min, and the minimum stays at the top, so nothing scans the waiting processes.
+"""
+class CompletelyFair(Algorithm):
+    preemption_reason = "wakeup"
+    schedule_dequeues = True
+
+    def __init__(self, time_quantum: float):
+        super().__init__()
+        # Scheduling latency: the period in which every runnable process should run once
+        self.time_quantum = time_quantum
+        self.minGranularity = time_quantum * MIN_GRANULARITY_RATIO
+        self.wakeupGranularity = time_quantum * WAKEUP_GRANULARITY_RATIO
+
+        self.vruntimes: Dict[Process, float] = {}
+        self.ready_queue = ProcessHeap(key=lambda process: self.vruntimes[process])
+        # Never decreases, newcomers start there
+        self.minVruntime = 0.0
+        # Weight of every process in the system, waiting or running
+        self.totalWeight = 0.0
+        # (remaining time, slice) of the running processes when they were dispatched
+        self.dispatches: Dict[Process, Tuple[float, float]] = {}
+
+    def schedule(self) -> Optional[Process]:
+        process = self.ready_queue.pop()
+        if process is None:
+            return None
+
+        self.minVruntime = max(self.minVruntime, self.vruntimes[process])
+        self.dispatches[process] = (process.remaining_time, self.slice(process))
+        return process
+
+    def process_arrival(self, process: Process) -> None:
+        self.vruntimes[process] = max(self.vruntimes.get(process, 0.0), self.minVruntime)
+        self.totalWeight += priorityWeight(process.priority)
+        self.ready_queue.push(process)
+
+    def process_completion(self, process: Process) -> int:
+        self.leave(process)
+        return 1
+
+    # Charges the slice it just ran and puts it back among the waiting processes
+    def process_preemption(self, process: Process, reason: str) -> None:
+        self.vruntimes[process] = self.currentVruntime(process)
+        del self.dispatches[process]
+        self.ready_queue.push(process)
+
+    # Virtual runtime including what a running process executed since its dispatch
+    def currentVruntime(self, process: Process) -> float:
+        dispatch = self.dispatches.get(process)
+        if dispatch is None:
+            return self.vruntimes[process]
+
+        ran = dispatch[0] - process.remaining_time
+        return self.vruntimes[process] + ran * NICE_0_WEIGHT / priorityWeight(process.priority)
+
+    # Weighted share of the latency, which grows past it once the minimum granularity doesn't fit
+    def slice(self, process: Process) -> float:
+        period = max(self.time_quantum, len(self.vruntimes) * self.minGranularity)
+        return period * priorityWeight(process.priority) / self.totalWeight
+
+    # The slice given at dispatch for a running process, its current share otherwise
+    def quantum_for(self, process: Process) -> Optional[float]:
+        dispatch = self.dispatches.get(process)
+        if dispatch is not None:
+            return dispatch[1]
+        if process not in self.vruntimes:
+            return self.time_quantum
+
+        return self.slice(process)
+
+    # The wakeup granularity is scaled like the virtual runtime of the waiting process,
+    # so light processes need to be further behind to preempt
+    def should_preempt(self, current: Process) -> bool:
+        best = self.ready_queue.peek()
+        if best is None or current not in self.dispatches:
+            return False
+
+        granularity = self.wakeupGranularity * NICE_0_WEIGHT / priorityWeight(best.priority)
+        return self.currentVruntime(current) - self.vruntimes[best] > granularity
+
+    def rank(self, process: Process) -> float:
+        return self.currentVruntime(process)
+
+    # A migrated process starts over at the smallest virtual runtime of its new CPU
+    def steal(self) -> Optional[Process]:
+        process = self.take()
+        if process is not None:
+            self.leave(process)
+
+        return process
+
+    def leave(self, process: Process) -> None:
+        self.vruntimes.pop(process, None)
+        self.dispatches.pop(process, None)
+        self.totalWeight -= priorityWeight(process.priority)
@@ -1,32 +1,43 @@
 from .algorithm import Algorithm
+from .process_heap import ProcessHeap
 from processes.process import Process
 from typing import List, Optional
 
 class EarliestDeadline(Algorithm):
+    uses_deadlines = True
+    preemption_reason = "earlier deadline"
+
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = ProcessHeap(key=lambda process: process.deadline)
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
         
-        earliest_deadline_process = min(self.ready_queue, key=lambda process: process.deadline)
+        earliest_deadline_process = self.ready_queue.peek()
         return earliest_deadline_process  
       
     def process_arrival(self, process: Process) -> None:
         # When a process arrives, calculate its absolute deadline
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
+
+    def should_preempt(self, current: Process) -> bool:
+        earliest_deadline_process = self.ready_queue.peek()
+        return earliest_deadline_process is not None and earliest_deadline_process.deadline < current.deadline
+
+    def rank(self, process: Process) -> float:
+        return process.deadline
     
     def process_completion(self, process: Process) -> int:
         if process.completionTime > process.deadline:
             self.deadline_miss(process)
             return -1
         else:
-            self.ready_queue.remove(process)
+            self.ready_queue.discard(process)
 
             return 1
     
     
     def deadline_miss(self, process: Process) -> None:
-        self.ready_queue.remove(process)
\ No newline at end of file
+        self.ready_queue.discard(process)
\ No newline at end of file
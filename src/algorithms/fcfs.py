@@ -1,11 +1,12 @@
 from algorithms.algorithm import Algorithm
 from processes.process import Process
 from typing import List, Optional
+from collections import deque
 
 class FCFS(Algorithm):
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = deque()
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
@@ -15,7 +16,8 @@ class FCFS(Algorithm):
     def process_arrival(self, process: Process) -> None:
         self.ready_queue.append(process)
     
+    # The running process is always the head of the queue, unless it was taken off it (multi-CPU)
     def process_completion(self, process: Process) -> int:
-        if process in self.ready_queue:
-            self.ready_queue.remove(process)
+        if self.ready_queue and self.ready_queue[0] is process:
+            self.ready_queue.popleft()
         return 1
\ No newline at end of file
@@ -1,5 +1,142 @@
 from .algorithm import Algorithm
+from processes.process import Process
+from typing import Dict, Optional, Tuple
+from collections import deque
 
+"""
+    Multilevel feedback queue (MLFQ).
+
+    - one FIFO queue per level, level 0 runs first and new processes start there
+    - the quantum doubles at every level: a process using its whole quantum is demoted one
+      level, so CPU bound processes sink while short ones stay on top
+    - every boost_interval seconds every process goes back to level 0, so none starves
+    - a process waiting on a higher level than the running one preempts it
+
+    Like the Linux O(1) scheduler, a bitmap has bit i set while level i has waiting processes:
+    the highest non-empty level is its lowest set bit, found in constant time whatever the
+    number of waiting processes.
+
+    Boosting doesn't touch the processes either: each level is a chain of FIFO segments, so the
+    lower levels are appended to level 0 segment by segment, and the levels are stored with
+    the boost epoch they were set in, older ones count as level 0. Every operation is O(1)
+    in the number of processes, a boost is O(levels).
+
+    A running process keeps the quantum it was dispatched with until it leaves the CPU, so the
+    quantum events already scheduled stay valid. Boosted meanwhile, it goes back to level 0
+    without being demoted for a quantum it got on a lower level.
+"""
 class MultilevelQueueScheduling(Algorithm):
-    def schedule(self):
-        return
\ No newline at end of file
+    preemption_reason = "higher level"
+    schedule_dequeues = True
+
+    def __init__(self, time_quantum: float, levels: int = 8, boost_interval: Optional[float] = None):
+        super().__init__()
+        if levels < 1:
+            raise ValueError("Multilevel queue scheduling needs at least one level")
+
+        # Segments of every level, new processes join the last one
+        self.queues = [deque([deque()]) for _ in range(levels)]
+        self.counts = [0] * levels
+        self.bitmap = 0
+        self.waiting = 0
+        # Quantum of level 0, the one of every level below is twice the one above
+        self.time_quantum = time_quantum
+        self.quanta = [time_quantum * 2 ** level for level in range(levels)]
+        self.boost_interval = boost_interval or None
+        # (boost epoch, level) of every process in the system, waiting or running
+        self.levels: Dict[Process, Tuple[int, int]] = {}
+        self.epoch = 0
+        # Quantum of the running processes, fixed when they were dispatched
+        self.dispatchQuanta: Dict[Process, float] = {}
+
+    def schedule(self) -> Optional[Process]:
+        if not self.bitmap:
+            return None
+
+        level = self.topLevel()
+        segments = self.queues[level]
+        while not segments[0]:
+            segments.popleft()
+        process = segments[0].popleft()
+
+        self.counts[level] -= 1
+        if not self.counts[level]:
+            self.bitmap &= ~(1 << level)
+        self.waiting -= 1
+
+        self.dispatchQuanta[process] = self.quanta[level]
+        return process
+
+    # Highest level with waiting processes, -1 when none is waiting
+    def topLevel(self) -> int:
+        return (self.bitmap & -self.bitmap).bit_length() - 1
+
+    def levelOf(self, process: Process) -> int:
+        epoch, level = self.levels[process]
+        return level if epoch == self.epoch else 0
+
+    def enqueue(self, process: Process, level: int) -> None:
+        self.levels[process] = (self.epoch, level)
+        self.queues[level][-1].append(process)
+        self.counts[level] += 1
+        self.bitmap |= 1 << level
+        self.waiting += 1
+
+    def process_arrival(self, process: Process) -> None:
+        self.enqueue(process, 0)
+
+    # The running process was already taken off its queue by schedule()
+    def process_completion(self, process: Process) -> int:
+        self.levels.pop(process, None)
+        self.dispatchQuanta.pop(process, None)
+        return 1
+
+    # Demoted when it used its whole quantum, back to the end of its level otherwise.
+    # A process boosted while it ran goes back to level 0
+    def process_preemption(self, process: Process, reason: str) -> None:
+        del self.dispatchQuanta[process]
+        epoch, level = self.levels[process]
+        if epoch != self.epoch:
+            level = 0
+        elif reason == "quantum":
+            level = min(level + 1, len(self.queues) - 1)
+
+        self.enqueue(process, level)
+
+    def quantum_for(self, process: Process) -> Optional[float]:
+        quantum = self.dispatchQuanta.get(process)
+        if quantum is not None:
+            return quantum
+
+        return self.quanta[self.levelOf(process)] if process in self.levels else self.time_quantum
+
+    def should_preempt(self, current: Process) -> bool:
+        return self.bitmap != 0 and self.topLevel() < self.levelOf(current)
+
+    def rank(self, process: Process) -> float:
+        return self.levelOf(process)
+
+    def waiting_count(self) -> int:
+        return self.waiting
+
+    # A migrated process starts over at level 0 of its new CPU
+    def steal(self) -> Optional[Process]:
+        process = self.take()
+        if process is not None:
+            del self.levels[process]
+            del self.dispatchQuanta[process]
+
+        return process
+
+    # Every process goes back to level 0, the waiting ones after those already there, in level order
+    def boost(self) -> None:
+        top = self.queues[0]
+        for level in range(1, len(self.queues)):
+            if self.counts[level]:
+                top.extend(self.queues[level])
+                self.queues[level] = deque([deque()])
+                self.counts[0] += self.counts[level]
+                self.counts[level] = 0
+
+        self.bitmap = 1 if self.waiting else 0
+        self.epoch += 1
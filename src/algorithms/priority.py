@@ -1,43 +1,51 @@
 from .algorithm import Algorithm
+from .process_heap import ProcessHeap
 from processes.process import Process
 from typing import List, Optional
 
 class PriorityNonPreemptive(Algorithm):
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = ProcessHeap(key=lambda process: process.priority)
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
         
-        highest_priority = min(self.ready_queue, key=lambda process: process.priority)
+        highest_priority = self.ready_queue.peek()
         return highest_priority
     
     def process_arrival(self, process: Process) -> None:
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
     
     def process_completion(self, process: Process) -> int:
-        if process in self.ready_queue:
-            self.ready_queue.remove(process)
+        self.ready_queue.discard(process)
         return 1
     
 class PriorityPreemptive(Algorithm):
+    preemption_reason = "priority"
+
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = ProcessHeap(key=lambda process: process.priority)
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
         
-        highest_priority = min(self.ready_queue, key=lambda process: process.priority)
+        highest_priority = self.ready_queue.peek()
         return highest_priority
     
     def process_arrival(self, process: Process) -> None:
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
     
     def process_completion(self, process: Process) -> int:
-        if process in self.ready_queue:
-            self.ready_queue.remove(process)
+        self.ready_queue.discard(process)
         return 1
+
+    def should_preempt(self, current: Process) -> bool:
+        highest_priority = self.ready_queue.peek()
+        return highest_priority is not None and highest_priority.priority < current.priority
+
+    def rank(self, process: Process) -> float:
+        return process.priority
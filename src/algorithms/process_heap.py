@@ -0,0 +1,82 @@
+import heapq
+import itertools
+
+from processes.process import Process
+from typing import Callable, Iterator, Optional
+
+"""
+    Indexed binary heap of processes ordered by a key (burst time, priority, period, deadline...).
+
+    - push / remove / pop are O(log n), peek is O(1) amortized
+    - removing a specific process uses lazy deletion: its entry is only marked as removed
+      and discarded once it reaches the top of the heap
+    - ties are broken by insertion order, so equal keys are served first-come, first-served
+    - hold() takes the top process out but keeps its place among equal keys: pushed back,
+      it is ordered as if it never left (a running process going back to the queue)
+
+    Iterating over the heap yields the queued processes in no particular order.
+"""
+class ProcessHeap:
+    REMOVED = None
+
+    def __init__(self, key: Callable[[Process], float]):
+        self.key = key
+        self.heap = []
+        self.entries = {}
+        self.sequence = itertools.count()
+        # Insertion order of the held processes
+        self.held = {}
+
+    def push(self, process: Process) -> None:
+        if process in self.entries:
+            return
+
+        sequence = self.held.pop(process, None)
+        entry = [self.key(process), next(self.sequence) if sequence is None else sequence, process]
+        self.entries[process] = entry
+        heapq.heappush(self.heap, entry)
+
+    def remove(self, process: Process) -> None:
+        entry = self.entries.pop(process)
+        entry[-1] = ProcessHeap.REMOVED
+
+        # Rebuild when most entries are stale so memory stays proportional to the live processes
+        if len(self.heap) > 2 * len(self.entries) + 32:
+            self.heap = [entry for entry in self.heap if entry[-1] is not ProcessHeap.REMOVED]
+            heapq.heapify(self.heap)
+
+    def hold(self, process: Process) -> None:
+        if self.peek() is not process:
+            raise ValueError("Only the top process can be held")
+
+        # Popped for real, a stale entry with the same key and sequence could not be told apart
+        self.held[process] = heapq.heappop(self.heap)[1]
+        del self.entries[process]
+
+    def discard(self, process: Process) -> None:
+        self.held.pop(process, None)
+        if process in self.entries:
+            self.remove(process)
+
+    def peek(self) -> Optional[Process]:
+        while self.heap and self.heap[0][-1] is ProcessHeap.REMOVED:
+            heapq.heappop(self.heap)
+
+        return self.heap[0][-1] if self.heap else None
+
+    def pop(self) -> Optional[Process]:
+        process = self.peek()
+        if process is not None:
+            heapq.heappop(self.heap)
+            del self.entries[process]
+
+        return process
+
+    def __contains__(self, process: Process) -> bool:
+        return process in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Process]:
+        return iter(list(self.entries))
@@ -1,23 +1,33 @@
 from .algorithm import Algorithm
+from .process_heap import ProcessHeap
 from processes.process import Process
 from typing import List, Optional
 from collections import deque
 
 class RateMonotonic(Algorithm):
+    preemption_reason = "period priority"
+
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = ProcessHeap(key=lambda process: process.period)
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
         # verificar a priopriodade por periodo
         
-        highest_priority = min(self.ready_queue, key=lambda process: process.period)
+        highest_priority = self.ready_queue.peek()
         return highest_priority
     
     def process_arrival(self, process: Process) -> None:
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
+
+    def should_preempt(self, current: Process) -> bool:
+        highest_priority = self.ready_queue.peek()
+        return highest_priority is not None and highest_priority.period < current.period
+
+    def rank(self, process: Process) -> float:
+        return process.period
     
     def process_completion(self, process: Process) -> int:
         if (process.executionsNumber > process.period):
@@ -27,12 +37,10 @@ class RateMonotonic(Algorithm):
             process.executionsNumber += 1
             return 0
         else:
-            if process in self.ready_queue:
-                self.ready_queue.remove(process)
+            self.ready_queue.discard(process)
             return 1
         
     def deadline_miss(self, process: Process) -> None:
-        if process in self.ready_queue:
-                self.ready_queue.remove(process)
+        self.ready_queue.discard(process)
             
             
\ No newline at end of file
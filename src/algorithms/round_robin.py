@@ -5,6 +5,8 @@ from collections import deque
 
 
 class RoundRobin(Algorithm):
+    schedule_dequeues = True
+
     def __init__(self, time_quantum: float):
         super().__init__()
         self.ready_queue = deque()
@@ -20,8 +22,11 @@ class RoundRobin(Algorithm):
     def process_arrival(self, process: Process) -> None:
         self.ready_queue.append(process)
     
+    # The running process was already taken off the queue by schedule()
     def process_completion(self, process: Process) -> int:
-        if process in self.ready_queue:
-            self.ready_queue.remove(process)
         return 1
+
+    # The preempted process goes back to the end of the queue
+    def process_preemption(self, process: Process, reason: str) -> None:
+        self.ready_queue.append(process)
             
\ No newline at end of file
@@ -1,23 +1,23 @@
 from algorithms.algorithm import Algorithm
+from algorithms.process_heap import ProcessHeap
 from processes.process import Process
 from typing import List, Optional
 
 class ShortestJob(Algorithm):
     def __init__(self):
         super().__init__()
-        self.ready_queue = []
+        self.ready_queue = ProcessHeap(key=lambda process: process.burstTime)
     
     def schedule(self) -> Optional[Process]:
         if not self.ready_queue:
             return None
         # Get the shortestJob from the queue
-        shortestJob = min(self.ready_queue, key=lambda process: process.burstTime)
+        shortestJob = self.ready_queue.peek()
         return shortestJob
     
     def process_arrival(self, process: Process) -> None:
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
     
     def process_completion(self, process: Process) -> int:
-        if process in self.ready_queue:
-            self.ready_queue.remove(process)
+        self.ready_queue.discard(process)
         return 1
\ No newline at end of file
@@ -1,21 +1,90 @@
 from PyQt6.QtCore import pyqtSignal, QObject, QThread, QDateTime
 
 from typing import List
+import time
 
 from config.types.clock import ClockConfig
 from scheduler import SchedulerWorker
 from processes.process import Process
+from processes.arrival_cursor import createArrivalCursor
 
+from multicore import createEventEngine
 from global_clock import GlobalClock
 class ClockWorker(QObject):
     updateClockDisplay = pyqtSignal(int, int, int, int)
     updateSimulationTimeUI = pyqtSignal()
+    simulationFinished = pyqtSignal()
 
     def __init__(self, config: ClockConfig, scheduler: SchedulerWorker, processList: List[Process]):
         super().__init__()
         self.processList = processList
         self.config = config
         self.scheduler = scheduler
+        self.lastFrameTime = 0
+
+    def run(self):
+        # At max speed the UI shows the sampled times as they come instead of extrapolating them
+        GlobalClock.setSpeed(0 if self.config.maxSpeed else self.config.tick)
+
+        if self.config.engine == "tick":
+            self.runTickBased()
+        else:
+            self.runEventBased()
+
+        self.scheduler.finish()
+        self.simulationFinished.emit()
+
+    """
+        Event based simulation: virtual time jumps between events and the thread only
+        sleeps as much as needed to keep virtual time in line with real time * tick.
+
+        Samples the scheduler every sampleInterval simulated seconds (one by default) so the UI
+        keeps updating at the same rate as in the tick based simulation.
+
+        At max speed it never sleeps, the samples still happen at the same simulated times
+        but only maxFrameRate of them per real second reach the UI.
+    """
+    def runEventBased(self):
+        realTimePerUnit = 1 / self.config.tick
+        engine = createEventEngine(self.scheduler, self.processList, sampleInterval=self.config.sampleInterval, onSample=self.onSample)
+
+        startRealTime = time.monotonic()
+
+        while engine.hasPendingEvents():
+            nextTime = engine.peekTime()
+            if nextTime is None:
+                break
+
+            if not self.config.maxSpeed:
+                sleepTime = startRealTime + nextTime * realTimePerUnit - time.monotonic()
+                if sleepTime > 0:
+                    QThread.msleep(int(sleepTime * 1000))
+
+            engine.step()
+
+        self.onSample(engine.now, force=True)
+
+    def onSample(self, currentTime, force=False):
+        GlobalClock.setSimulationTime(int(currentTime * 1000))
+
+        if self.frameDue(force):
+            self.updateSimulationTimeUI.emit()
+            if self.config.maxSpeed:
+                # Lets the GUI thread take the GIL to handle the frame
+                time.sleep(0)
+        self.scheduler.emitUpdateUISignals(force)
+
+    # Paced simulations update the UI on every sample, at max speed at most maxFrameRate times per second
+    def frameDue(self, force=False):
+        if not self.config.maxSpeed or force:
+            return True
+
+        now = time.monotonic()
+        if now - self.lastFrameTime < 1 / self.config.maxFrameRate:
+            return False
+
+        self.lastFrameTime = now
+        return True
 
     def runTickBased(self):
         baseTick_ms = 1000  # 1 second as base unit
@@ -25,29 +94,27 @@ class ClockWorker(QObject):
         simulationTick_ms = int(baseTick_ms)  
         
         total_ms = 0
-        
-        while (len(self.processList) > 0 or self.scheduler.hasRunningProcesses()):
+        arrivals = createArrivalCursor(self.processList)
+
+        while (not arrivals.isExhausted() or self.scheduler.hasRunningProcesses()):
             GlobalClock.setSimulationTime(total_ms)
-            self.updateSimulationTimeUI.emit()
+            if self.frameDue():
+                self.updateSimulationTimeUI.emit()
 
             total_ms += simulationTick_ms
-            newProcess = self.checkNewArrivals(total_ms / 1000)
-            if newProcess:
-                self.processList.pop(0)
-                self.scheduler.receiveNewProcess(newProcess)
+            newProcesses = self.checkNewArrivals(arrivals, total_ms / 1000)
+            if newProcesses:
+                self.scheduler.receiveNewProcesses(newProcesses)
                 
             self.scheduler.runSchedulingCycle()
             
-            QThread.msleep(realTimeSleep_ms)
-
-    def checkNewArrivals(self, currentClock):
-        if self.processList:
-            currentProcess = self.processList[0]
-        else:
-            return None
+            if not self.config.maxSpeed:
+                QThread.msleep(realTimeSleep_ms)
 
-        if currentProcess.arrivalTime <= currentClock:
-            return currentProcess
+        if self.config.maxSpeed:
+            self.onSample(total_ms / 1000, force=True)
 
-        return None
+    # Every process due until currentClock, handed to the scheduler as one batch
+    def checkNewArrivals(self, arrivals, currentClock):
+        return arrivals.popDue(currentClock)
     
\ No newline at end of file
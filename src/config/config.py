@@ -11,4 +11,6 @@ class Config:
         self.processGenerationConfig = ProcessGenerationConfig(self.config["processGeneration"])
         self.clockConfig = ClockConfig(self.config["clock"])
         self.schedulingConfig = SchedulingConfig(self.config["scheduling"])
+        # Optional path of a binary trace of every scheduler event
+        self.tracePath = self.config.get("trace")
 
@@ -1,4 +1,15 @@
 
 class ClockConfig:
     def __init__(self, config_dict):
-        self.tick = config_dict["tick"]
\ No newline at end of file
+        self.tick = config_dict["tick"]
+        # "event" jumps between simulation events, "tick" advances in fixed steps
+        self.engine = config_dict.get("engine", "event")
+        # Runs the simulation as fast as possible instead of pacing it with tick
+        self.maxSpeed = config_dict.get("maxSpeed", False)
+        # Simulated seconds between two UI samples, and how many of them reach the UI per real second at most
+        self.sampleInterval = config_dict.get("sampleInterval", 1)
+        self.maxFrameRate = config_dict.get("maxFrameRate", 30)
+        # Sliding window (seconds) and smoothing of the dN/dt lines of the over-time graphs
+        self.rateWindow = config_dict.get("rateWindow", 7.5)
+        self.rateSmoothing = config_dict.get("rateSmoothing", "none")
+        self.rateSmoothingSpan = config_dict.get("rateSmoothingSpan", 5)
\ No newline at end of file
@@ -19,6 +19,11 @@ class PeriodsConfig:
 class ProcessGenerationConfig:
     def __init__(self, config_dict):
         self.useProcessGeneration = config_dict["useProcessGeneration"]
+        # Keeps generated processes in a compact ProcessTable until they arrive
+        self.useProcessTable = config_dict.get("useProcessTable", False)
+        # Generates processes on demand, in chunks of streamChunkSize, instead of all up front
+        self.streamProcesses = config_dict.get("streamProcesses", False)
+        self.streamChunkSize = config_dict.get("streamChunkSize", 4096)
         self.seed = config_dict["seed"]
         self.maxTime = config_dict["maxTime"]
         self.arrival = ArrivalConfig(config_dict["arrival"])
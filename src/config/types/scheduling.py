@@ -1,4 +1,14 @@
 class SchedulingConfig:
     def __init__(self, config_dict):
         self.scheduleAlgorithm = config_dict["schedulingAlgorithm"]
-        self.timeQuantum = config_dict["timeQuantum"]
\ No newline at end of file
+        self.timeQuantum = config_dict["timeQuantum"]
+        # Simulated CPUs and, with more than one, whether they share one run queue ("global")
+        # or each has its own ("partitioned")
+        self.cpus = config_dict.get("cpus", 1)
+        self.cpuScheduling = config_dict.get("cpuScheduling", "global")
+        # Seconds between two load balancing passes of partitioned scheduling, 0 disables them
+        self.loadBalanceInterval = config_dict.get("loadBalanceInterval", 0)
+        # Multilevel queue scheduling: number of levels, and seconds between two boosts
+        # of every process back to the highest level (0 never boosts)
+        self.queueLevels = config_dict.get("queueLevels", 8)
+        self.boostInterval = config_dict.get("boostInterval", 50)
@@ -0,0 +1,146 @@
+import heapq
+import itertools
+
+from typing import Callable, Iterable, Optional
+
+from processes.arrival_cursor import createArrivalCursor
+
+# Event kinds, the value breaks ties between events happening at the same time
+# (e.g. a process completing exactly at its deadline is considered completed,
+# processes arriving at a boost join level 0 after the boosted ones, like in the tick loop)
+COMPLETION = 0
+QUANTUM_EXPIRY = 1
+BOOST = 2
+ARRIVAL = 3
+DEADLINE = 4
+SAMPLE = 5
+
+"""
+    Discrete-event simulation engine.
+
+    Instead of advancing time in fixed ticks, keeps a priority queue of future events
+    (arrivals, completions, quantum expiries, deadline timers, periodic boosts of the
+    algorithm and optional UI samples)
+    and jumps the virtual time straight to the next one.
+
+    Only the next arrival is kept in the queue, all processes arriving at that time are
+    taken from an arrival cursor and admitted as one batch. The processes can be a list,
+    a ProcessTable or a lazy stream of chunks pulled on demand.
+
+    Completion and quantum events are scheduled every time a process is dispatched and are
+    tagged with the dispatch number, so events from a process that was meanwhile preempted
+    are simply ignored when popped (lazy invalidation).
+"""
+class EventEngine:
+    def __init__(self, scheduler, processList: Iterable, sampleInterval: Optional[float] = None,
+                 onSample: Optional[Callable[[float], None]] = None):
+        self.scheduler = scheduler
+        self.now = 0.0
+        self.events = []
+        self.sequence = itertools.count()
+
+        self.sampleInterval = sampleInterval
+        self.onSample = onSample
+
+        self.arrivals = createArrivalCursor(processList)
+        self.lastDispatch = scheduler.processSwitchCount
+
+        self._scheduleNextArrival()
+
+        if sampleInterval:
+            self.push(sampleInterval, SAMPLE, None)
+
+        if scheduler.algorithm.boost_interval:
+            self.push(scheduler.algorithm.boost_interval, BOOST, None)
+
+    def push(self, time, kind, payload):
+        heapq.heappush(self.events, (time, kind, next(self.sequence), payload))
+
+    # Simulation is over when every process arrived and the scheduler has nothing left to run
+    def hasPendingEvents(self):
+        return not self.arrivals.isExhausted() or self.scheduler.hasRunningProcesses()
+
+    def peekTime(self) -> Optional[float]:
+        return self.events[0][0] if self.events else None
+
+    # Pops the next event, moves virtual time to it and handles it
+    def step(self):
+        if not self.events:
+            return False
+
+        time, kind, _, payload = heapq.heappop(self.events)
+
+        if time > self.now:
+            self.scheduler.advanceTime(time - self.now)
+            self.now = time
+
+        if kind == ARRIVAL:
+            newProcesses = self.arrivals.popDue(time)
+            self.scheduler.receiveNewProcesses(newProcesses)
+            self.scheduler.checkPreemption()
+
+            if self.scheduler.algorithm.uses_deadlines:
+                for process in newProcesses:
+                    self.push(max(process.deadline, self.now), DEADLINE, process)
+
+            self._scheduleNextArrival()
+
+        elif kind == COMPLETION or kind == QUANTUM_EXPIRY:
+            self.handleDispatchEvent(payload)
+
+        elif kind == DEADLINE:
+            self.scheduler.deadlineExpired(payload)
+
+        elif kind == SAMPLE:
+            if self.onSample:
+                self.onSample(self.now)
+            if self.hasPendingEvents():
+                self.push(self.now + self.sampleInterval, SAMPLE, None)
+
+        elif kind == BOOST:
+            self.scheduler.boostPriorities()
+            if self.hasPendingEvents():
+                self.push(self.now + self.scheduler.algorithm.boost_interval, BOOST, None)
+
+        else:
+            self.handleOtherEvent(kind, payload)
+
+        self._scheduleDispatchEvents()
+        return True
+
+    # Runs the whole simulation as fast as possible
+    def run(self):
+        while self.hasPendingEvents() and self.step():
+            pass
+
+    # Completion or quantum expiry of the dispatch `payload`, stale if the process was meanwhile preempted
+    def handleDispatchEvent(self, payload):
+        if payload == self.lastDispatch:
+            self.scheduler.handleCurrentProcess()
+
+    # Event kinds added by subclasses
+    def handleOtherEvent(self, kind, payload):
+        pass
+
+    def _scheduleNextArrival(self):
+        nextArrival = self.arrivals.nextArrivalTime()
+        if nextArrival is not None:
+            self.push(nextArrival, ARRIVAL, None)
+
+    # When a new process got the CPU, schedule the moment it completes and,
+    # for quantum based algorithms, the moment its quantum expires
+    def _scheduleDispatchEvents(self):
+        dispatch = self.scheduler.processSwitchCount
+        if dispatch == self.lastDispatch:
+            return
+
+        self.lastDispatch = dispatch
+        current = self.scheduler.currentProcess
+        if not current:
+            return
+
+        self.push(self.now + max(current.remaining_time, 0), COMPLETION, dispatch)
+
+        quantumLeft = self.scheduler.quantumTimeLeft()
+        if quantumLeft is not None and quantumLeft < current.remaining_time:
+            self.push(self.now + max(quantumLeft, 0), QUANTUM_EXPIRY, dispatch)
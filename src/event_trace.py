@@ -0,0 +1,171 @@
+import mmap
+import struct
+
+import numpy as np
+
+from typing import Iterator, List, NamedTuple, Optional
+
+from processes.process import Process
+
+TRACE_MAGIC = b"SCHEDTRC"
+TRACE_VERSION = 1
+
+# magic, version, record size, number of reasons, reserved, number of records
+HEADER = struct.Struct("<8sHHHHQ")
+# Reason strings, code 0 is "no reason" and code n is stored in slot n - 1
+REASON_SLOTS = 15
+REASON_SIZE = 32
+HEADER_SIZE = 512
+
+# time (virtual seconds), pid, kind (scheduler event kind), reason code, cpu
+RECORD = struct.Struct("<dIBBH")
+RECORD_DTYPE = np.dtype([("time", "<f8"), ("pid", "<u4"), ("kind", "u1"), ("reason", "u1"), ("cpu", "<u2")])
+
+# Records packed in memory before they are copied to the mapped file in one go
+BUFFER_RECORDS = 4096
+# The mapped file grows by at least this many records at a time
+GROWTH_RECORDS = 1 << 16
+
+class TraceRecord(NamedTuple):
+    time: float
+    pid: int
+    kind: int
+    reason: Optional[str]
+    cpu: int
+
+"""
+    Records every scheduler event into an append-only binary trace file.
+
+    The file is a 512 byte header (record count and the table of preemption reasons) followed by
+    16 byte records. Records are packed into a small buffer by the listener and the buffer is
+    copied into the memory-mapped file when it fills up, so recording an event costs a single
+    struct.pack_into on the scheduler thread. The mapping grows in large steps and the file is
+    truncated to its records on close().
+
+    The header record count is updated on every flush, a trace of a run that never called close()
+    can still be read up to its last flush.
+
+    Attach with scheduler.addListener(recorder.record).
+"""
+class TraceRecorder:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "w+b")
+        self.capacity = GROWTH_RECORDS
+        self.file.truncate(HEADER_SIZE + self.capacity * RECORD.size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+        self.reasonCodes = {None: 0}
+        self.count = 0
+        self.buffer = bytearray(BUFFER_RECORDS * RECORD.size)
+        self.buffered = 0
+        self.closed = False
+
+        self._writeHeader()
+
+    def record(self, kind, time, process: Process, reason: Optional[str], cpu):
+        code = self.reasonCodes.get(reason)
+        if code is None:
+            code = self._addReason(reason)
+
+        RECORD.pack_into(self.buffer, self.buffered * RECORD.size, time, process.pid, kind, code, cpu)
+        self.buffered += 1
+
+        if self.buffered == BUFFER_RECORDS:
+            self.flush()
+
+    def _addReason(self, reason: str) -> int:
+        encoded = reason.encode("utf-8")
+        if len(self.reasonCodes) > REASON_SLOTS:
+            raise ValueError(f"Trace can't hold more than {REASON_SLOTS} preemption reasons: {reason}")
+        if len(encoded) > REASON_SIZE:
+            raise ValueError(f"Preemption reason is longer than {REASON_SIZE} bytes: {reason}")
+
+        code = len(self.reasonCodes)
+        self.reasonCodes[reason] = code
+        offset = HEADER.size + (code - 1) * REASON_SIZE
+        self.map[offset:offset + REASON_SIZE] = encoded.ljust(REASON_SIZE, b"\0")
+        self._writeHeader()
+
+        return code
+
+    def _writeHeader(self):
+        HEADER.pack_into(self.map, 0, TRACE_MAGIC, TRACE_VERSION, RECORD.size, len(self.reasonCodes) - 1, 0, self.count)
+
+    # Copies the buffered records to the mapped file
+    def flush(self):
+        if not self.buffered:
+            return
+
+        if self.count + self.buffered > self.capacity:
+            self._grow(self.count + self.buffered)
+
+        start = HEADER_SIZE + self.count * RECORD.size
+        size = self.buffered * RECORD.size
+        self.map[start:start + size] = memoryview(self.buffer)[:size]
+
+        self.count += self.buffered
+        self.buffered = 0
+        self._writeHeader()
+
+    # Remaps the file with room for at least `records` records, it grows by its own size
+    # but never by less than GROWTH_RECORDS or more than 16 times that
+    def _grow(self, records):
+        while self.capacity < records:
+            self.capacity += max(GROWTH_RECORDS, min(self.capacity, 16 * GROWTH_RECORDS))
+
+        self.map.close()
+        self.file.truncate(HEADER_SIZE + self.capacity * RECORD.size)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+
+        self.flush()
+        self.map.flush()
+        self.map.close()
+        self.file.truncate(HEADER_SIZE + self.count * RECORD.size)
+        self.file.close()
+
+"""
+    Reads a trace written by TraceRecorder.
+
+    The records are a NumPy structured array over the memory-mapped file (fields time, pid,
+    kind, reason, cpu), so even multi-million event traces are analyzed without loading them
+    into Python objects. Iterating yields TraceRecords with the reasons decoded.
+"""
+class TraceReader:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, recordSize, reasonCount, _, count = HEADER.unpack_from(self.map, 0)
+        if magic != TRACE_MAGIC or version != TRACE_VERSION or recordSize != RECORD.size:
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} scheduler trace")
+
+        self.reasons: List[Optional[str]] = [None]
+        for slot in range(reasonCount):
+            offset = HEADER.size + slot * REASON_SIZE
+            self.reasons.append(self.map[offset:offset + REASON_SIZE].rstrip(b"\0").decode("utf-8"))
+
+        self.records = np.frombuffer(self.map, dtype=RECORD_DTYPE, count=count, offset=HEADER_SIZE)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index) -> TraceRecord:
+        time, pid, kind, reason, cpu = self.records[index]
+        return TraceRecord(float(time), int(pid), int(kind), self.reasons[reason], int(cpu))
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        for index in range(len(self.records)):
+            yield self[index]
+
+    def close(self):
+        # The array is a view of the mapping, it has to go before the mapping can be closed
+        self.records = None
+        self.map.close()
+        self.file.close()
@@ -4,16 +4,25 @@ class GlobalClock():
     currentTime_ms = 0
     simulationTime_ms = 0
     lastRealTime = 0
+    # Simulated ms per real ms between two reported times, 0 shows the last reported time as is
+    speed = 1
 
     def updateGlobalTime():
+        # The simulation didn't report any time yet
+        if GlobalClock.lastRealTime == 0:
+            return
+
         nowRealTime = QDateTime.currentMSecsSinceEpoch()
         timeElapsed = nowRealTime - GlobalClock.lastRealTime
 
-        GlobalClock.currentTime_ms = GlobalClock.simulationTime_ms + timeElapsed
+        GlobalClock.currentTime_ms = GlobalClock.simulationTime_ms + int(timeElapsed * GlobalClock.speed)
 
     def setSimulationTime(time):
         GlobalClock.lastRealTime = QDateTime.currentMSecsSinceEpoch()
         GlobalClock.simulationTime_ms = time 
 
+    def setSpeed(speed):
+        GlobalClock.speed = speed
+
     def getTime():
         return GlobalClock.currentTime_ms
\ No newline at end of file
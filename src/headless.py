@@ -0,0 +1,76 @@
+import sys
+
+from config.config import Config
+from scheduler_core import Scheduler
+from multicore import MultiCoreScheduler, createScheduler, createEventEngine
+from processes.process_generation import ProcessGenerator
+
+"""
+    Runs a simulation without the GUI.
+
+    Drives the same algorithms, scheduler and event engine as the GUI, but without PyQt6 or
+    matplotlib and without any real-time sleeps, so it runs at full CPU speed.
+"""
+class HeadlessSimulation:
+    def __init__(self, config, tracePath=None):
+        config = Config(config)
+        self.config = config
+
+        processGenerator = ProcessGenerator(config.processGenerationConfig)
+        self.scheduler = createScheduler(config.schedulingConfig)
+        tracePath = tracePath or config.tracePath
+        if tracePath:
+            self.scheduler.recordTrace(tracePath)
+        self.engine = createEventEngine(self.scheduler, processGenerator.generate_processes())
+
+    def run(self):
+        self.engine.run()
+        self.scheduler.finish()
+        return collectMetrics(self.scheduler, self.engine.now)
+
+# Aggregate metrics over the completed processes, the same ones the GUI panels show
+def collectMetrics(scheduler: Scheduler, simulatedTime):
+    metrics = {
+        "algorithm": scheduler.schedulingConfig.scheduleAlgorithm,
+        "simulatedTime": simulatedTime,
+        "completedProcesses": scheduler.metrics.count,
+        "deadlineMisses": scheduler.deadlineMissCount,
+        "processSwitchCount": scheduler.processSwitchCount,
+    }
+
+    if isinstance(scheduler, MultiCoreScheduler):
+        metrics["cpus"] = len(scheduler.cpus)
+        metrics["cpuScheduling"] = scheduler.schedulingConfig.cpuScheduling
+        metrics["utilization"] = scheduler.utilization(simulatedTime)
+        metrics["migrations"] = scheduler.migrationCount
+
+    for name, statistic in scheduler.metrics.snapshot().items():
+        metrics[name] = {
+            "avg": statistic.mean,
+            "min": statistic.min,
+            "max": statistic.max,
+            "variance": statistic.variance,
+            "p50": statistic.quantiles[0.5],
+            "p95": statistic.quantiles[0.95],
+            "p99": statistic.quantiles[0.99],
+        }
+
+    return metrics
+
+def printMetrics(metrics, file=sys.stdout):
+    print(f"Algorithm: {metrics['algorithm']}", file=file)
+    print(f"Simulated time: {metrics['simulatedTime']:.2f}", file=file)
+    print(f"Total processes completed: {metrics['completedProcesses']}", file=file)
+    print(f"Deadline misses: {metrics['deadlineMisses']}", file=file)
+    if "cpus" in metrics:
+        print(f"CPUs: {metrics['cpus']} ({metrics['cpuScheduling']}), utilization: {metrics['utilization']:.1%}, "
+              f"migrations: {metrics['migrations']}", file=file)
+
+    for name, label in [("completionTime", "Completion"), ("turnaroundTime", "Turnaround"),
+                        ("waitingTime", "Waiting"), ("responseTime", "Response")]:
+        values = metrics[name]
+        print(f"Average {label} time: {values['avg']:.2f} (min: {values['min']:.2f}, max: {values['max']:.2f}, "
+              f"p50: {values['p50']:.2f}, p95: {values['p95']:.2f}, p99: {values['p99']:.2f})", file=file)
+
+    print(f"Turnaround variance: {metrics['turnaroundTime']['variance']:.2f}", file=file)
+    print(f"Process switch count: {metrics['processSwitchCount']}", file=file)
@@ -0,0 +1,201 @@
+import math
+
+import numpy as np
+
+from typing import Dict, List, NamedTuple
+
+from processes.process import Process
+
+# Quantiles tracked for every series, enough for a box plot and the p50/p95/p99 reports
+QUANTILES = (0.25, 0.5, 0.75, 0.95, 0.99)
+# Every quantile estimate is within this relative error of a value of the right rank
+RELATIVE_ACCURACY = 0.01
+# Values closer to zero than this are counted as zero
+MIN_MAGNITUDE = 1e-9
+# Completions buffered before being folded into the statistics in one NumPy batch
+BATCH_SIZE = 4096
+
+class StatisticSnapshot(NamedTuple):
+    count: int
+    mean: float
+    variance: float
+    min: float
+    max: float
+    quantiles: Dict[float, float]
+
+# Counts of consecutive bucket indexes, growing to fit the indexes seen
+class _BucketStore:
+    __slots__ = ("offset", "counts")
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, indexes: np.ndarray):
+        if not len(indexes):
+            return
+
+        low, high = int(indexes.min()), int(indexes.max())
+        if not len(self.counts):
+            self.offset = low
+            self.counts = np.zeros(high - low + 1, dtype=np.int64)
+        elif low < self.offset or high >= self.offset + len(self.counts):
+            newLow = min(low, self.offset)
+            newHigh = max(high, self.offset + len(self.counts) - 1)
+            counts = np.zeros(newHigh - newLow + 1, dtype=np.int64)
+            counts[self.offset - newLow:self.offset - newLow + len(self.counts)] = self.counts
+            self.offset = newLow
+            self.counts = counts
+
+        self.counts += np.bincount(indexes - self.offset, minlength=len(self.counts))
+
+    def indexes(self) -> np.ndarray:
+        return np.arange(self.offset, self.offset + len(self.counts))
+
+"""
+    Quantile sketch with relative accuracy (DDSketch, Masson et al. 2019).
+
+    Magnitudes are counted in logarithmic buckets, bucket i holding (gamma^(i-1), gamma^i],
+    so any quantile is estimated within RELATIVE_ACCURACY whatever the distribution.
+    Every quantile of a series is read from the same buckets, which are updated a whole batch
+    at a time: a few NumPy calls per batch instead of Python work per value and quantile.
+    Memory is the number of buckets, logarithmic in the range of the values.
+"""
+class QuantileSketch:
+    __slots__ = ("gamma", "logGamma", "positive", "negative", "zeros", "count")
+
+    def __init__(self, relativeAccuracy=RELATIVE_ACCURACY):
+        self.gamma = (1 + relativeAccuracy) / (1 - relativeAccuracy)
+        self.logGamma = math.log(self.gamma)
+        self.positive = _BucketStore()
+        self.negative = _BucketStore()
+        self.zeros = 0
+        self.count = 0
+
+    def addMany(self, values: np.ndarray):
+        self.count += len(values)
+
+        nonZero = np.abs(values) > MIN_MAGNITUDE
+        values = values[nonZero]
+        self.zeros += len(nonZero) - len(values)
+
+        indexes = np.ceil(np.log(np.abs(values)) / self.logGamma).astype(np.int64)
+        negative = values < 0
+        self.positive.add(indexes[~negative])
+        self.negative.add(indexes[negative])
+
+    # Value standing for a bucket, the relative error to anything in it is at most the accuracy
+    def _bucketValues(self, indexes: np.ndarray) -> np.ndarray:
+        return 2 * np.power(self.gamma, indexes.astype(np.float64)) / (self.gamma + 1)
+
+    def quantiles(self, ps) -> List[float]:
+        if not self.count:
+            return [0.0] * len(ps)
+
+        # Buckets in increasing value order: negatives by decreasing magnitude, zero, positives
+        counts = np.concatenate((self.negative.counts[::-1], [self.zeros], self.positive.counts))
+        values = np.concatenate((-self._bucketValues(self.negative.indexes()[::-1]), [0.0],
+                                 self._bucketValues(self.positive.indexes())))
+
+        # Linear interpolation between the neighbouring ranks, like numpy's default
+        ranks = np.asarray(ps, dtype=np.float64) * (self.count - 1)
+        lower = np.floor(ranks)
+        upper = np.minimum(lower + 1, self.count - 1)
+        cumulative = np.cumsum(counts)
+        lowerValues = values[np.searchsorted(cumulative, lower, side="right")]
+        upperValues = values[np.searchsorted(cumulative, upper, side="right")]
+        return (lowerValues + (ranks - lower) * (upperValues - lowerValues)).tolist()
+
+"""
+    Running mean/variance, min, max and quantiles of a series.
+
+    Values come in NumPy batches, merged with the parallel variance update of Chan et al.,
+    no values are kept once folded in.
+"""
+class RunningStatistic:
+    __slots__ = ("count", "mean", "m2", "min", "max", "points", "sketch")
+
+    def __init__(self, quantiles=QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.points = tuple(quantiles)
+        self.sketch = QuantileSketch()
+
+    def addMany(self, values: np.ndarray):
+        n = len(values)
+        if not n:
+            return
+
+        batchMean = float(values.mean())
+        batchM2 = float(np.square(values - batchMean).sum())
+        total = self.count + n
+        delta = batchMean - self.mean
+        self.mean += delta * n / total
+        self.m2 += batchM2 + delta * delta * self.count * n / total
+        self.count = total
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.sketch.addMany(values)
+
+    # Population variance, like the statistics shown by the panels
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    def snapshot(self) -> StatisticSnapshot:
+        if not self.count:
+            return StatisticSnapshot(0, 0.0, 0.0, 0.0, 0.0, {p: 0.0 for p in self.points})
+
+        # The estimates are kept within the observed range and in order
+        quantiles = {}
+        previous = self.min
+        for p, value in zip(self.points, self.sketch.quantiles(self.points)):
+            previous = min(max(value, previous), self.max)
+            quantiles[p] = previous
+
+        return StatisticSnapshot(self.count, self.mean, self.variance, self.min, self.max, quantiles)
+
+"""
+    Completion metrics of a simulation, owned by the scheduler.
+
+    A completed process only appends its four values to a buffer, every BATCH_SIZE completions
+    (and before every snapshot) the buffer is folded into the statistics with NumPy.
+    The panels, graphs and headless runner read snapshots instead of going over the
+    whole completed list on every update.
+"""
+class CompletionMetrics:
+    SERIES = ("completionTime", "turnaroundTime", "waitingTime", "responseTime")
+
+    def __init__(self):
+        self.statistics = {name: RunningStatistic() for name in CompletionMetrics.SERIES}
+        # One (completion, turnaround, waiting, response) tuple per completion not folded in yet
+        self.pending = []
+
+    def addProcess(self, process: Process):
+        self.pending.append((process.completionTime, process.turnaroundTime, process.waitingTime,
+                             (process.firstScheduling / 1000) - process.arrivalTime))
+        if len(self.pending) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+
+        columns = np.array(self.pending, dtype=np.float64).T
+        self.pending = []
+        for statistic, values in zip(self.statistics.values(), columns):
+            statistic.addMany(values)
+
+    @property
+    def count(self):
+        return self.statistics["completionTime"].count + len(self.pending)
+
+    # Immutable copy, safe to hand to the GUI thread.
+    # Folds the pending completions in, so only the thread owning the metrics may call it
+    def snapshot(self):
+        self.flush()
+        return {name: statistic.snapshot() for name, statistic in self.statistics.items()}
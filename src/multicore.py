@@ -0,0 +1,417 @@
+import heapq
+
+from typing import Dict, List, Optional, Tuple
+
+from algorithms.algorithm import Algorithm
+from algorithms.algorithm_factory import create_algorithm
+from config.types.scheduling import SchedulingConfig
+from event_engine import EventEngine, COMPLETION, QUANTUM_EXPIRY, SAMPLE
+from processes.process import Process
+from scheduler_core import (Scheduler, TIME_EPSILON, PROCESS_ARRIVED, PROCESS_DISPATCHED, PROCESS_PREEMPTED,
+                            PROCESS_COMPLETED, PROCESS_RELEASED, DEADLINE_MISSED, PROCESS_MIGRATED)
+
+# Ways of sharing the processes between the CPUs
+CPU_SCHEDULING_MODES = ["global", "partitioned"]
+
+# Event kind of the periodic load balancing, handled after every kind of the event engine
+LOAD_BALANCE = SAMPLE + 1
+
+class CPU:
+    __slots__ = ("index", "algorithm", "current", "dispatchTime", "dispatchCount", "busyTime", "idle")
+
+    def __init__(self, index, algorithm: Algorithm):
+        self.index = index
+        # Run queue the CPU takes its processes from, shared by every CPU with global scheduling
+        self.algorithm = algorithm
+        self.current: Optional[Process] = None
+        # The running process is only charged for its execution when it leaves the CPU
+        # or its completion/quantum event is due, never on every event
+        self.dispatchTime = 0.0
+        self.dispatchCount = 0
+        self.busyTime = 0.0
+        self.idle = False
+
+"""
+    Scheduler of N CPUs (SMP), running any of the single CPU algorithms.
+
+    - global: one run queue shared by every CPU, an idle CPU takes the best waiting process and a
+      better process arriving preempts the CPU running the worst one (highest Algorithm.rank())
+    - partitioned: one run queue per CPU, each with its own algorithm instance. Arriving processes
+      join the least loaded CPU and, every loadBalanceInterval seconds, waiting processes migrate
+      from the most to the least loaded CPUs
+
+    Running processes are held by the CPUs and taken off the run queues (Algorithm.take()).
+    Their execution is accounted lazily, when they leave the CPU or one of their events is due,
+    so the work per event doesn't grow with the number of CPUs. Idle CPUs are kept in a heap,
+    only preemption checks of global scheduling look at every CPU.
+
+    Events are published with the index of the CPU involved.
+"""
+class MultiCoreScheduler(Scheduler):
+    def __init__(self, schedulingConfig: SchedulingConfig):
+        Scheduler.__init__(self, schedulingConfig)
+        self.initializeCpus()
+
+    def initializeCpus(self):
+        config = self.schedulingConfig
+        if config.cpuScheduling not in CPU_SCHEDULING_MODES:
+            raise ValueError(f"Unknown CPU scheduling mode: {config.cpuScheduling}")
+        if config.cpus < 1:
+            raise ValueError("There must be at least one CPU")
+
+        self.partitioned = config.cpuScheduling == "partitioned"
+        self.cpus = [CPU(index, create_algorithm(config) if self.partitioned and index > 0 else self.algorithm)
+                     for index in range(config.cpus)]
+        self.preemptive = type(self.algorithm).should_preempt is not Algorithm.should_preempt
+        self.loadBalanceInterval = config.loadBalanceInterval if self.partitioned else 0
+        self.nextLoadBalance = self.loadBalanceInterval
+
+        # Indexes of the idle CPUs of global scheduling, the lowest one is dispatched first
+        self.idleCpus = []
+        for cpu in self.cpus:
+            self._markIdle(cpu)
+
+        # CPU running each running process, and with partitioned scheduling the CPU owning each process
+        self.runningOn: Dict[int, CPU] = {}
+        self.queueOf: Dict[int, CPU] = {}
+        # Run queues that got new processes since the last preemption check (partitioned)
+        self.changedCpus = set()
+        # Dispatches since the engine last asked, with the dispatch number they had
+        self.newDispatches: List[Tuple[CPU, int]] = []
+        self.migrationCount = 0
+
+    # Only the virtual time moves, the running processes are accounted lazily
+    def advanceTime(self, elapsed):
+        self.current_time += elapsed
+
+    def _account(self, cpu: CPU):
+        elapsed = self.current_time - cpu.dispatchTime
+        if elapsed > 0:
+            cpu.current.remaining_time -= elapsed
+            cpu.current.time_in_current_quantum += elapsed
+            cpu.busyTime += elapsed
+        cpu.dispatchTime = self.current_time
+
+    # Tick-based step: every busy CPU executes its process for one time unit
+    def runSchedulingCycle(self, elapsed=1):
+        self.advanceTime(elapsed)
+        self.updateUITime += elapsed
+
+        for cpu in self.cpus:
+            if cpu.current:
+                self.handleCpu(cpu)
+        self._checkScheduling()
+        self.checkPreemption()
+
+        if self.nextBoost is not None and self.current_time >= self.nextBoost:
+            self.boostPriorities()
+            self.nextBoost += self.algorithm.boost_interval
+        if self.loadBalanceInterval and self.current_time >= self.nextLoadBalance:
+            self.balanceLoad()
+            self.nextLoadBalance += self.loadBalanceInterval
+        # Only the event engine schedules events for the dispatches
+        self.newDispatches.clear()
+
+        if self.updateUITime >= 1:
+            self.emitUpdateUISignals()
+            self.updateUITime = 0
+
+    # Completion or quantum expiry event of a dispatch, ignored if the CPU meanwhile switched process
+    def handleDispatchEvent(self, cpuIndex, dispatchCount):
+        cpu = self.cpus[cpuIndex]
+        if cpu.current and cpu.dispatchCount == dispatchCount:
+            self.handleCpu(cpu)
+
+    # Completes the process of the CPU if it has no remaining time left, preempts it if its quantum expired
+    def handleCpu(self, cpu: CPU):
+        self._account(cpu)
+        process = cpu.current
+
+        if process.remaining_time <= TIME_EPSILON:
+            self._complete(cpu)
+        else:
+            quantum = cpu.algorithm.quantum_for(process)
+            if quantum is not None and quantum - process.time_in_current_quantum <= TIME_EPSILON:
+                self._preempt(cpu, "quantum")
+
+    def receiveNewProcesses(self, newProcesses: List[Process]):
+        for newProcess in newProcesses:
+            self.readyProcesses[newProcess.pid] = newProcess
+            cpu = self._enqueue(newProcess)
+            if self.listeners:
+                self._publish(PROCESS_ARRIVED, newProcess, cpu=cpu.index)
+        self.readySetChanged = True
+
+        self._checkScheduling()
+
+    # Puts a process in a run queue, the shared one (reported as CPU 0) or the least loaded CPU's
+    def _enqueue(self, process: Process) -> CPU:
+        if not self.partitioned:
+            self.algorithm.process_arrival(process)
+            return self.cpus[0]
+
+        cpu = min(self.cpus, key=self._load)
+        self._enqueueOn(cpu, process)
+        return cpu
+
+    def _enqueueOn(self, cpu: CPU, process: Process):
+        cpu.algorithm.process_arrival(process)
+        self.queueOf[process.pid] = cpu
+        self.changedCpus.add(cpu)
+
+    def _load(self, cpu: CPU) -> int:
+        return cpu.algorithm.waiting_count() + (cpu.current is not None)
+
+    # Global scheduling: idle CPUs take waiting processes, lowest CPU index first.
+    # Partitioned CPUs take one once their own queue got the whole batch of new processes
+    def _checkScheduling(self):
+        if self.partitioned:
+            for cpu in sorted(self.changedCpus, key=lambda cpu: cpu.index):
+                if cpu.current is None:
+                    self._dispatch(cpu)
+            return
+
+        while self.idleCpus and self.algorithm.waiting_count():
+            self._dispatch(self.cpus[heapq.heappop(self.idleCpus)])
+
+    def _markIdle(self, cpu: CPU):
+        if cpu.idle:
+            return
+
+        cpu.idle = True
+        if not self.partitioned:
+            heapq.heappush(self.idleCpus, cpu.index)
+
+    # Gives the CPU its next process, or leaves it idle when its run queue is empty
+    def _dispatch(self, cpu: CPU) -> bool:
+        process = cpu.algorithm.take()
+        if process is None:
+            self._markIdle(cpu)
+            return False
+
+        if process.firstScheduling is None:
+            process.firstScheduling = self.current_time * 1000
+
+        self.processSwitchCount += 1
+        cpu.idle = False
+        cpu.current = process
+        cpu.dispatchTime = self.current_time
+        cpu.dispatchCount += 1
+        self.runningOn[process.pid] = cpu
+        self.newDispatches.append((cpu, cpu.dispatchCount))
+
+        if self.listeners:
+            self._publish(PROCESS_DISPATCHED, process, cpu=cpu.index)
+        return True
+
+    # Called by the engine to schedule the events of the new dispatches
+    def takeDispatches(self) -> List[Tuple[CPU, int]]:
+        dispatches = self.newDispatches
+        self.newDispatches = []
+        return dispatches
+
+    def _release(self, cpu: CPU) -> Process:
+        process = cpu.current
+        cpu.current = None
+        del self.runningOn[process.pid]
+        return process
+
+    def _complete(self, cpu: CPU):
+        process = self._release(cpu)
+        process.remaining_time = 0
+        process.completionTime = self.current_time
+        process.turnaroundTime = process.completionTime - process.arrivalTime
+        process.waitingTime = process.turnaroundTime - process.burstTime
+
+        completed = cpu.algorithm.process_completion(process)
+
+        if completed == 1:
+            self.metrics.addProcess(process)
+            if self.listeners:
+                self._publish(PROCESS_COMPLETED, process, cpu=cpu.index)
+        elif completed == 0:
+            # Periodic process still has executions left, its next job joins the run queue again
+            process.remaining_time = process.burstTime
+            process.time_in_current_quantum = 0
+            cpu.algorithm.process_arrival(process)
+            if self.listeners:
+                self._publish(PROCESS_RELEASED, process, cpu=cpu.index)
+        else:
+            self.deadlineMissCount += 1
+            if self.listeners:
+                self._publish(DEADLINE_MISSED, process, cpu=cpu.index)
+
+        if completed != 0:
+            self.readyProcesses.pop(process.pid, None)
+            self.queueOf.pop(process.pid, None)
+
+        self._dispatch(cpu)
+
+    def _preempt(self, cpu: CPU, reason: str):
+        process = self._release(cpu)
+        process.time_in_current_quantum = 0
+        cpu.algorithm.give_back(process, reason)
+        if self.listeners:
+            self._publish(PROCESS_PREEMPTED, process, reason, cpu.index)
+
+        self._dispatch(cpu)
+
+    """
+        Preempts the CPUs whose process should give way to a waiting one, when the run queues changed.
+
+        Global scheduling preempts the CPU running the process with the highest rank, as long as
+        the best waiting process beats it, so every preemption costs one pass over the CPUs. Partitioned scheduling only checks the CPUs whose own
+        run queue got new processes.
+        The CPUs checked are accounted first, ranks may depend on how long their process has run (CFS).
+    """
+    def checkPreemption(self):
+        if not self.readySetChanged:
+            return
+        self.readySetChanged = False
+
+        if not self.preemptive:
+            self.changedCpus.clear()
+            return
+
+        if self.partitioned:
+            for cpu in self.changedCpus:
+                if not cpu.current:
+                    continue
+                self._account(cpu)
+                if cpu.algorithm.should_preempt(cpu.current):
+                    self._preempt(cpu, cpu.algorithm.preemption_reason)
+            self.changedCpus.clear()
+            return
+
+        for cpu in self.cpus:
+            if cpu.current:
+                self._account(cpu)
+
+        rank = self.algorithm.rank
+        while True:
+            # Whatever waits can only beat the running processes in rank order, the worst one first
+            victim = max((cpu for cpu in self.cpus if cpu.current), key=lambda cpu: rank(cpu.current), default=None)
+            if victim is None or not self.algorithm.should_preempt(victim.current):
+                return
+
+            self._preempt(victim, self.algorithm.preemption_reason)
+
+    # Boosts every run queue, any CPU may now have to give way to a boosted process
+    def boostPriorities(self):
+        for algorithm in dict.fromkeys(cpu.algorithm for cpu in self.cpus):
+            algorithm.boost()
+
+        if self.partitioned:
+            self.changedCpus.update(self.cpus)
+        self.readySetChanged = True
+        self.checkPreemption()
+
+    def deadlineExpired(self, process: Process):
+        if not self.algorithm.uses_deadlines or process.pid not in self.readyProcesses:
+            return
+
+        cpu = self.runningOn.get(process.pid)
+        if cpu:
+            self._account(cpu)
+        if process.remaining_time <= 0:
+            return
+
+        queueCpu = cpu or self.queueOf.get(process.pid) or self.cpus[0]
+        if cpu:
+            self._release(cpu)
+
+        queueCpu.algorithm.deadline_miss(process)
+        del self.readyProcesses[process.pid]
+        self.queueOf.pop(process.pid, None)
+        self.deadlineMissCount += 1
+        if self.listeners:
+            self._publish(DEADLINE_MISSED, process, cpu=queueCpu.index)
+
+        if cpu:
+            self._dispatch(cpu)
+
+    """
+        Partitioned scheduling: moves waiting processes from the most to the least loaded CPUs
+        until their loads (waiting processes, plus one when busy) differ by at most one.
+
+        Each migration looks at every CPU once, whatever the length of the run queues,
+        and at most one migration per CPU happens per pass.
+    """
+    def balanceLoad(self):
+        if not self.partitioned:
+            return
+
+        for _ in range(len(self.cpus)):
+            busiest = max(self.cpus, key=self._load)
+            idlest = min(self.cpus, key=self._load)
+            if self._load(busiest) - self._load(idlest) <= 1 or not busiest.algorithm.waiting_count():
+                break
+
+            process = busiest.algorithm.steal()
+            self.migrationCount += 1
+            if self.listeners:
+                self._publish(PROCESS_MIGRATED, process, cpu=idlest.index)
+            self._enqueueOn(idlest, process)
+
+        self._checkScheduling()
+        self.readySetChanged = True
+        self.checkPreemption()
+
+    def hasRunningProcesses(self):
+        return len(self.readyProcesses) > 0
+
+    def runningProcesses(self) -> List[Process]:
+        return [cpu.current for cpu in self.cpus if cpu.current]
+
+    # Fraction of the CPU time spent running processes, over every CPU
+    def utilization(self, simulatedTime) -> float:
+        if simulatedTime <= 0:
+            return 0.0
+        return sum(cpu.busyTime for cpu in self.cpus) / (len(self.cpus) * simulatedTime)
+
+"""
+    Event engine driving a MultiCoreScheduler: completion and quantum events are tagged with the
+    CPU and its dispatch number, and partitioned scheduling gets periodic load balancing events.
+"""
+class MultiCoreEventEngine(EventEngine):
+    def __init__(self, scheduler: MultiCoreScheduler, processList, sampleInterval=None, onSample=None):
+        super().__init__(scheduler, processList, sampleInterval, onSample)
+
+        if scheduler.loadBalanceInterval:
+            self.push(scheduler.loadBalanceInterval, LOAD_BALANCE, None)
+
+    def handleDispatchEvent(self, payload):
+        self.scheduler.handleDispatchEvent(*payload)
+
+    def handleOtherEvent(self, kind, payload):
+        if kind == LOAD_BALANCE:
+            self.scheduler.balanceLoad()
+            if self.hasPendingEvents():
+                self.push(self.now + self.scheduler.loadBalanceInterval, LOAD_BALANCE, None)
+
+    def _scheduleDispatchEvents(self):
+        for cpu, dispatchCount in self.scheduler.takeDispatches():
+            # Dispatches already replaced in the same step don't get events
+            if cpu.dispatchCount != dispatchCount or not cpu.current:
+                continue
+
+            process = cpu.current
+            payload = (cpu.index, dispatchCount)
+            self.push(self.now + max(process.remaining_time, 0), COMPLETION, payload)
+
+            quantum = cpu.algorithm.quantum_for(process)
+            if quantum is not None:
+                quantumLeft = quantum - process.time_in_current_quantum
+                if quantumLeft < process.remaining_time:
+                    self.push(self.now + max(quantumLeft, 0), QUANTUM_EXPIRY, payload)
+
+# Single CPU Scheduler, or MultiCoreScheduler when more than one CPU is configured
+def createScheduler(schedulingConfig: SchedulingConfig) -> Scheduler:
+    if schedulingConfig.cpus > 1:
+        return MultiCoreScheduler(schedulingConfig)
+    return Scheduler(schedulingConfig)
+
+# Event engine matching the scheduler
+def createEventEngine(scheduler: Scheduler, processList, sampleInterval=None, onSample=None) -> EventEngine:
+    engineClass = MultiCoreEventEngine if isinstance(scheduler, MultiCoreScheduler) else EventEngine
+    return engineClass(scheduler, processList, sampleInterval, onSample)
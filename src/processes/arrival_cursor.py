@@ -0,0 +1,100 @@
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .process import Process
+from .process_table import ProcessTable
+
+"""
+    Hands out processes in arrival order.
+
+    The process list is sorted once by arrival time and consumed through an index,
+    so admitting every process due at a given time is a bisect over the arrival times
+    instead of popping from the front of a list one process at a time.
+
+    A ProcessTable can be given instead of a list, its rows only become Process objects
+    when they are due.
+"""
+class ArrivalCursor:
+    def __init__(self, processList: Union[List[Process], ProcessTable]):
+        self.table = None
+        self.index = 0
+
+        if isinstance(processList, ProcessTable):
+            self.table = processList
+            self.processes = np.argsort(processList.arrival, kind="stable")
+            self.arrivalTimes = processList.arrival[self.processes]
+        else:
+            self.processes = sorted(processList, key=lambda process: process.arrivalTime)
+            self.arrivalTimes = [process.arrivalTime for process in self.processes]
+
+    # Returns every process that arrived until currentTime (inclusive)
+    def popDue(self, currentTime) -> List[Process]:
+        if self.table is not None:
+            end = int(np.searchsorted(self.arrivalTimes, currentTime, side="right"))
+            due = [self.table.process(row) for row in self.processes[self.index:end]]
+        else:
+            end = bisect_right(self.arrivalTimes, currentTime, lo=self.index)
+            due = self.processes[self.index:end]
+
+        self.index = end
+        return due
+
+    def nextArrivalTime(self) -> Optional[float]:
+        if self.index < len(self.arrivalTimes):
+            return float(self.arrivalTimes[self.index])
+
+        return None
+
+    def remaining(self) -> int:
+        return len(self.processes) - self.index
+
+    def isExhausted(self) -> bool:
+        return self.index >= len(self.processes)
+
+"""
+    Same interface as ArrivalCursor over a lazy stream of arrival-ordered chunks
+    (lists or ProcessTables), pulling the next chunk only when the current one is consumed.
+"""
+class StreamingArrivalCursor:
+    def __init__(self, chunks: Iterator[Union[List[Process], ProcessTable]]):
+        self.chunks = chunks
+        self.cursor = None
+        self._nextChunk()
+
+    def _nextChunk(self):
+        self.cursor = None
+
+        for chunk in self.chunks:
+            if len(chunk) > 0:
+                self.cursor = ArrivalCursor(chunk)
+                return
+
+    def popDue(self, currentTime) -> List[Process]:
+        due = []
+
+        while self.cursor is not None:
+            due.extend(self.cursor.popDue(currentTime))
+            if not self.cursor.isExhausted():
+                break
+            self._nextChunk()
+
+        return due
+
+    def nextArrivalTime(self) -> Optional[float]:
+        return self.cursor.nextArrivalTime() if self.cursor is not None else None
+
+    # Only the processes of the chunk currently loaded are known
+    def remaining(self) -> int:
+        return self.cursor.remaining() if self.cursor is not None else 0
+
+    def isExhausted(self) -> bool:
+        return self.cursor is None
+
+# Builds the right cursor for a process list, a ProcessTable or a lazy stream of chunks
+def createArrivalCursor(processes: Union[List[Process], ProcessTable, Iterable]):
+    if isinstance(processes, (list, ProcessTable)):
+        return ArrivalCursor(processes)
+
+    return StreamingArrivalCursor(iter(processes))
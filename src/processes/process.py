@@ -1,14 +1,21 @@
 import random
 class Process:
-    def __init__(self, pid, arrivalTime, burstTime, priority, period, deadline):
+    # Fixed attribute layout, no per-instance __dict__
+    __slots__ = (
+        "pid", "arrivalTime", "firstScheduling", "burstTime", "priority", "period", "deadline",
+        "remaining_time", "time_in_current_quantum", "waitingTime", "turnaroundTime",
+        "startTime", "completionTime", "executionsNumber", "status"
+    )
+
+    # With randomDeadline=False, deadline is taken as the absolute deadline instead of drawing one
+    def __init__(self, pid, arrivalTime, burstTime, priority, period, deadline, randomDeadline=True):
         self.pid = pid
         self.arrivalTime = arrivalTime
         self.firstScheduling = None
         self.burstTime = burstTime
         self.priority = priority
         self.period = period
-        randomDeadline = random.randint(25, 175)
-        self.deadline = arrivalTime + randomDeadline
+        self.deadline = arrivalTime + random.randint(25, 175) if randomDeadline else deadline
         self.remaining_time = burstTime
         self.time_in_current_quantum = 0
         self.waitingTime = 0
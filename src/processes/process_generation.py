@@ -1,34 +1,115 @@
 # process_generator.py
 import numpy as np
-import random
 import json 
 
 from .process import Process
+from .process_table import ProcessTable
 from config.types.process_generation import ProcessGenerationConfig
 
+# Columns of a workload, each drawn from its own random stream
+WORKLOAD_COLUMNS = ("arrival", "burst", "deadline", "priority", "period")
+
 class ProcessGenerator:
     def __init__(self, config: ProcessGenerationConfig):
         self.config = config
         self.last_PID = 0
     
+    # Builds the workload the way the configuration asks for it
+    def generate_processes(self):
+        if not self.config.useProcessGeneration:
+            return self.get_static_processes()
+        if self.config.streamProcesses:
+            return self.stream_process_tables(self.config.streamChunkSize)
+        if self.config.useProcessTable:
+            return self.generate_process_table()
+
+        return self.generate_random_processes()
+
+    """
+        Independent random generators for the columns of a workload, by column name.
+
+        They are spawned from one SeedSequence of config.seed: the workload stays reproducible,
+        but arrivals, bursts, deadlines, priorities and periods no longer share the same draws.
+    """
+    def generators(self):
+        streams = np.random.SeedSequence(self.config.seed).spawn(len(WORKLOAD_COLUMNS))
+        return {column: np.random.default_rng(stream) for column, stream in zip(WORKLOAD_COLUMNS, streams)}
+
     def generate_random_processes(self):
         processList = []
+        rngs = self.generators()
 
-        arrivalTimes = self.generate_arrivalTimes(self.config.arrival.lam, self.config.maxTime)
+        arrivalTimes = self.generate_arrivalTimes(self.config.arrival.lam, self.config.maxTime, rngs["arrival"]).tolist()
         numProcesses = len(arrivalTimes) - 1
 
-        burstTimes = self.generate_burstTimes(self.config.burst.lam, numProcesses)
-        priorityList = self.generate_priorities(self.config.priorities.values, self.config.priorities.weights, numProcesses)
-        periodList = self.generate_periods(self.config.periods.values, self.config.periods.weights, numProcesses)
-        deadlineList = self.generate_deadline(self.config.deadline.values, self.config.deadline.weights, numProcesses)
-
+        burstTimes = self.generate_burstTimes(self.config.burst.lam, numProcesses, rngs["burst"]).tolist()
+        priorityList = self.generate_priorities(self.config.priorities.values, self.config.priorities.weights, numProcesses, rngs["priority"]).tolist()
+        periodList = self.generate_periods(self.config.periods.values, self.config.periods.weights, numProcesses, rngs["period"]).tolist()
+        # Same deadline rule as Process: arrival time plus 25 to 175 time units, from the seeded stream
+        deadlineList = (np.asarray(arrivalTimes[:numProcesses]) + rngs["deadline"].integers(25, 176, size=numProcesses)).tolist()
 
         for i in range(numProcesses):
-            process = Process(self.generate_pid(), arrivalTimes[i], burstTimes[i], priorityList[i], periodList[i], deadlineList[i])
+            process = Process(self.generate_pid(), arrivalTimes[i], burstTimes[i], priorityList[i], periodList[i], deadlineList[i],
+                              randomDeadline=False)
             processList.append(process)
         
         return processList
 
+    # Same distributions as generate_random_processes but stored column-wise in a ProcessTable,
+    # deadlines included since the rows don't draw them when materialized
+    def generate_process_table(self):
+        rngs = self.generators()
+
+        arrivalTimes = self.generate_arrivalTimes(self.config.arrival.lam, self.config.maxTime, rngs["arrival"])
+        numProcesses = len(arrivalTimes) - 1
+        arrivalTimes = arrivalTimes[:numProcesses]
+
+        burstTimes = self.generate_burstTimes(self.config.burst.lam, numProcesses, rngs["burst"])
+        priorityList = self.generate_priorities(self.config.priorities.values, self.config.priorities.weights, numProcesses, rngs["priority"])
+        periodList = self.generate_periods(self.config.periods.values, self.config.periods.weights, numProcesses, rngs["period"])
+
+        # Same deadline rule as Process: arrival time plus 25 to 175 time units
+        deadlineList = arrivalTimes + rngs["deadline"].integers(25, 176, size=numProcesses)
+
+        table = ProcessTable.fromColumns(arrivalTimes, burstTimes, priorityList, periodList, deadlineList, firstPid=self.last_PID + 1)
+        self.last_PID += numProcesses
+
+        return table
+
+    """
+        Lazily generates the workload in arrival order, as ProcessTable chunks of at most chunkSize processes.
+
+        Only one chunk lives in memory at a time, so the memory used doesn't depend on maxTime.
+        Each distribution keeps its own generator across chunks, so the stream is still
+        reproducible through config.seed.
+    """
+    def stream_process_tables(self, chunkSize=4096):
+        arrivalScale = 1 / self.config.arrival.lam
+        burstScale = 1 / self.config.burst.lam
+        rngs = self.generators()
+
+        lastArrival = 0
+
+        while lastArrival < self.config.maxTime:
+            arrivalTimes = lastArrival + np.cumsum(rngs["arrival"].exponential(scale=arrivalScale, size=chunkSize))
+            lastArrival = arrivalTimes[-1]
+
+            # Arrivals are sorted, only the ones before maxTime are kept
+            arrivalTimes = arrivalTimes[:np.searchsorted(arrivalTimes, self.config.maxTime, side="left")]
+            numProcesses = len(arrivalTimes)
+            if numProcesses == 0:
+                break
+
+            burstTimes = rngs["burst"].exponential(scale=burstScale, size=numProcesses)
+            priorityList = self.generate_priorities(self.config.priorities.values, self.config.priorities.weights, numProcesses, rngs["priority"])
+            periodList = self.generate_periods(self.config.periods.values, self.config.periods.weights, numProcesses, rngs["period"])
+            deadlineList = arrivalTimes + rngs["deadline"].integers(25, 176, size=numProcesses)
+
+            table = ProcessTable.fromColumns(arrivalTimes, burstTimes, priorityList, periodList, deadlineList, firstPid=self.last_PID + 1)
+            self.last_PID += numProcesses
+
+            yield table
+
     def get_static_processes(self):
         JSONProcesses = []
 
@@ -38,7 +119,8 @@ class ProcessGenerator:
         processList = []
 
         for jsonProcess in JSONProcesses:
-            process = Process(jsonProcess["pid"], jsonProcess["arrivalTime"], jsonProcess["burstTime"], jsonProcess["priority"])
+            process = Process(jsonProcess["pid"], jsonProcess["arrivalTime"], jsonProcess["burstTime"], jsonProcess["priority"],
+                              jsonProcess.get("period", 1), jsonProcess.get("deadline", 0))
             processList.append(process)
 
         return processList
@@ -51,21 +133,29 @@ class ProcessGenerator:
         with parameter lambda (lam).
 
         The arrival time of a process is the lastArrivalTime + inter-arrival time
+
+        Inter-arrival times are drawn in blocks sized to the expected number of arrivals
+        and accumulated with cumsum, extending block by block until maxTime is passed.
+        Like drawing one at a time, the result ends with the first arrival at or after maxTime
     """    
-    def generate_arrivalTimes(self, lam, maxTime):
+    def generate_arrivalTimes(self, lam, maxTime, rng: np.random.Generator):
         t_max = maxTime 
         scale = 1 / lam 
-        rng = np.random.default_rng(seed=self.config.seed)
-        
-        arrivalTimes = []
+
+        blockSize = int(lam * t_max * 1.1) + 16
+        blocks = []
         lastArrival = 0
 
         while lastArrival < t_max:
-            dt = rng.exponential(scale=scale)
-            lastArrival += dt 
-            arrivalTimes.append(lastArrival)
+            block = lastArrival + np.cumsum(rng.exponential(scale=scale, size=blockSize))
+            blocks.append(block)
+            lastArrival = block[-1]
 
-        return arrivalTimes
+        arrivalTimes = np.concatenate(blocks) if blocks else np.empty(0)
+
+        # Trim everything after the first arrival that passed maxTime
+        end = int(np.searchsorted(arrivalTimes, t_max, side="left")) + 1
+        return arrivalTimes[:end]
     
     """
         Generates burst times for "numProcesses" processes
@@ -73,9 +163,8 @@ class ProcessGenerator:
         Burst times follow an exponencial distribution where most processes having 
         short burst and some with longer bursts
     """    
-    def generate_burstTimes(self, lam, numProcesses):
+    def generate_burstTimes(self, lam, numProcesses, rng: np.random.Generator):
         scale = 1 / lam
-        rng = np.random.default_rng(seed=self.config.seed)
         burstTimes = rng.exponential(scale=scale, size=numProcesses)
 
         return burstTimes  
@@ -88,14 +177,17 @@ class ProcessGenerator:
 
         that way, lower priorities are more likely
     """
-    def generate_priorities(self, priorities, weights, numProcesses):
-        return random.choices(priorities, weights=weights, k=numProcesses)
-    
-    def generate_periods(self, periods, weights, numProcesses):
-        return random.choices(periods, weights=weights, k=numProcesses)
+    def generate_priorities(self, priorities, weights, numProcesses, rng: np.random.Generator):
+        return self.weighted_choices(priorities, weights, numProcesses, rng)
     
-    def generate_deadline(self, deadlines, weights, numProcesses):
-        return random.choices(deadlines, weights=weights, k=numProcesses)
+    def generate_periods(self, periods, weights, numProcesses, rng: np.random.Generator):
+        return self.weighted_choices(periods, weights, numProcesses, rng)
+
+
+    # NumPy array of numValues values drawn with replacement, weights don't need to sum to 1
+    def weighted_choices(self, values, weights, numValues, rng: np.random.Generator):
+        weights = np.asarray(weights, dtype=np.float64)
+        return rng.choice(np.asarray(values), size=numValues, p=weights / weights.sum())
 
     """
         Generates an PID (Process ID) from the previous ID
@@ -0,0 +1,81 @@
+import numpy as np
+
+from typing import List
+
+from .process import Process
+
+"""
+    Compact struct-of-arrays storage for a workload.
+
+    Each process attribute is a NumPy column and a process is addressed by its row index,
+    so millions of processes cost a few dozen bytes each instead of one Python object each.
+    Process objects are only materialized (process(index)) when they enter the scheduler,
+    and their results can be written back to the table (store(index, process)).
+
+    Unset first scheduling and completion times are NaN.
+"""
+class ProcessTable:
+    def __init__(self, size, firstPid=1):
+        self.pid = np.arange(firstPid, firstPid + size, dtype=np.int64)
+        self.arrival = np.zeros(size, dtype=np.float64)
+        self.burst = np.zeros(size, dtype=np.float64)
+        self.remaining = np.zeros(size, dtype=np.float64)
+        self.priority = np.zeros(size, dtype=np.int32)
+        self.period = np.zeros(size, dtype=np.int32)
+        self.deadline = np.zeros(size, dtype=np.float64)
+        self.firstScheduling = np.full(size, np.nan, dtype=np.float64)
+        self.completion = np.full(size, np.nan, dtype=np.float64)
+
+    @classmethod
+    def fromColumns(cls, arrival, burst, priority, period, deadline, firstPid=1):
+        table = cls(len(arrival), firstPid)
+        table.arrival[:] = arrival
+        table.burst[:] = burst
+        table.remaining[:] = burst
+        table.priority[:] = priority
+        table.period[:] = period
+        table.deadline[:] = deadline
+
+        return table
+
+    @classmethod
+    def fromProcesses(cls, processList: List[Process]):
+        table = cls(len(processList))
+
+        for index, process in enumerate(processList):
+            table.pid[index] = process.pid
+            table.store(index, process)
+            table.arrival[index] = process.arrivalTime
+            table.burst[index] = process.burstTime
+            table.priority[index] = process.priority
+            table.period[index] = process.period
+            table.deadline[index] = process.deadline
+
+        return table
+
+    def __len__(self):
+        return len(self.pid)
+
+    # Builds the Process object for a row
+    def process(self, index) -> Process:
+        process = Process(int(self.pid[index]), float(self.arrival[index]), float(self.burst[index]),
+                          int(self.priority[index]), int(self.period[index]), float(self.deadline[index]),
+                          randomDeadline=False)
+        process.remaining_time = float(self.remaining[index])
+
+        if not np.isnan(self.firstScheduling[index]):
+            process.firstScheduling = float(self.firstScheduling[index])
+
+        return process
+
+    # Writes the execution state of a process back to its row
+    def store(self, index, process: Process) -> None:
+        self.remaining[index] = process.remaining_time
+
+        if process.firstScheduling is not None:
+            self.firstScheduling[index] = process.firstScheduling
+        if process.completionTime:
+            self.completion[index] = process.completionTime
+
+    def toProcesses(self) -> List[Process]:
+        return [self.process(index) for index in range(len(self))]
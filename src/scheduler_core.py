@@ -0,0 +1,265 @@
+from algorithms.algorithm import Algorithm
+from algorithms.algorithm_factory import create_algorithm
+from config.types.scheduling import SchedulingConfig
+from processes.process import Process
+from metrics import CompletionMetrics
+from event_trace import TraceRecorder
+
+from typing import Callable, List, NamedTuple, Optional
+
+# Tolerance used when comparing accumulated float times (remaining burst, quantum usage)
+TIME_EPSILON = 1e-9
+
+# Kinds of the events published to the scheduler listeners
+PROCESS_ARRIVED = 0
+PROCESS_DISPATCHED = 1
+PROCESS_PREEMPTED = 2
+PROCESS_COMPLETED = 3
+# A periodic process finished a job and was released again, it stays in the system
+PROCESS_RELEASED = 4
+DEADLINE_MISSED = 5
+# A waiting process moved to the run queue of another CPU (multi-core load balancing)
+PROCESS_MIGRATED = 6
+
+class SchedulerEvent(NamedTuple):
+    kind: int
+    time: float
+    process: Process
+    reason: Optional[str]
+    # CPU running the process, or whose run queue it joined
+    cpu: int = 0
+
+"""
+    Decides which process runs, independently of any UI.
+
+    Doesn't depend on PyQt6, SchedulerWorker adds the Qt signals on top of it for the GUI
+    while the headless runner and benchmarks drive it directly.
+
+    Every change to the set of processes is published to the listeners as a small event,
+    listener(kind, time, process, reason, cpu), nothing is published when there are no listeners.
+    The single CPU scheduler is CPU 0, MultiCoreScheduler runs several of them.
+"""
+class Scheduler:
+    def __init__(self, schedulingConfig: SchedulingConfig):
+        self.schedulingConfig = schedulingConfig
+        self.algorithm = create_algorithm(schedulingConfig)
+        # Processes in the system that didn't complete yet, indexed by PID
+        self.readyProcesses = {}
+        # Completed processes are only folded into the metrics, none is kept
+        self.metrics = CompletionMetrics()
+        self.currentProcess = None
+        self.current_time = 0
+        self.updateUITime = 0
+        self.processSwitchCount = 0
+        self.deadlineMissCount = 0
+        # Preemption only needs to be re-evaluated when a new process joins the ready set
+        self.readySetChanged = False
+        self.listeners = []
+        self.trace = None
+        # Next time the periodic boost of the algorithm is due, for tick based simulations
+        self.nextBoost = self.algorithm.boost_interval
+
+    def addListener(self, listener: Callable[[int, float, Process, Optional[str], int], None]):
+        self.listeners.append(listener)
+
+    def _publish(self, kind, process: Process, reason: Optional[str] = None, cpu=0):
+        for listener in self.listeners:
+            listener(kind, self.current_time, process, reason, cpu)
+
+    # Records every event from now on into a binary trace file, see TraceRecorder
+    def recordTrace(self, path):
+        self.trace = TraceRecorder(path)
+        self.addListener(self.trace.record)
+
+    # Called once the simulation is over
+    def finish(self):
+        if self.trace:
+            self.trace.close()
+
+    def receiveNewProcess(self, newProcess: Process):
+        self.receiveNewProcesses([newProcess])
+
+    # Admits every process that arrived at the same time in one go
+    def receiveNewProcesses(self, newProcesses: List[Process]):
+        # Add new processes to our list and notify algorithm
+        for newProcess in newProcesses:
+            self.readyProcesses[newProcess.pid] = newProcess
+            self.algorithm.process_arrival(newProcess)
+            if self.listeners:
+                self._publish(PROCESS_ARRIVED, newProcess)
+        self.readySetChanged = True
+
+        # Check if we need to schedule something
+        self._checkScheduling()
+
+    # Tick-based step: executes the current process for one time unit
+    # and then reacts to whatever happened to it
+    def runSchedulingCycle(self, elapsed=1):
+        self.advanceTime(elapsed)
+        self.updateUITime += elapsed
+
+        if self.currentProcess:
+            self.handleCurrentProcess()
+        else:
+            self._checkScheduling()
+
+        if self.nextBoost is not None and self.current_time >= self.nextBoost:
+            self.boostPriorities()
+            self.nextBoost += self.algorithm.boost_interval
+
+        if self.updateUITime >= 1:
+            self.emitUpdateUISignals()
+            self.updateUITime = 0
+
+    # Moves the scheduler virtual time forward, executing the current process meanwhile
+    def advanceTime(self, elapsed):
+        self.current_time += elapsed
+
+        if self.currentProcess:
+            self.currentProcess.remaining_time -= elapsed
+            self.currentProcess.time_in_current_quantum += elapsed
+
+    """
+        Reacts to the state of the running process:
+
+        - completes it if it has no remaining time left
+        - preempts it if its time quantum expired (Round Robin)
+        - preempts it if a better candidate is waiting (preemptive algorithms)
+    """
+    def handleCurrentProcess(self):
+        if not self.currentProcess:
+            return
+
+        if self.currentProcess.remaining_time <= TIME_EPSILON:
+            self._completeCurrentProcess()
+
+        # Check if the process current time quantuam is greater or equal to the desired time quantum
+        # if it is we need to stop running that process and run the next one in the queue
+        elif self.quantumTimeLeft() is not None and self.quantumTimeLeft() <= TIME_EPSILON:
+            self._preemptCurrentProcess("quantum")
+
+        else:
+            self.checkPreemption()
+
+    # Check if there is any process with higher priority than the currenty being processed
+    # if there is then we stop running that process and run the next the one in queue.
+    # The algorithm decides using its own best candidate, only when the ready set changed
+    def checkPreemption(self):
+        if not self.readySetChanged:
+            return
+        self.readySetChanged = False
+
+        if not self.currentProcess or self.currentProcess.remaining_time <= 0:
+            return
+
+        if self.algorithm.should_preempt(self.currentProcess):
+            self._preemptCurrentProcess(self.algorithm.preemption_reason)
+
+    # Time left in the current quantum of the running process, None if the algorithm isn't quantum based
+    def quantumTimeLeft(self) -> Optional[float]:
+        if not self.currentProcess:
+            return None
+
+        quantum = self.algorithm.quantum_for(self.currentProcess)
+        if quantum is None:
+            return None
+
+        return quantum - self.currentProcess.time_in_current_quantum
+
+    def _completeCurrentProcess(self):
+        completed_process = self.currentProcess
+        completed_process.remaining_time = 0
+        completed_process.completionTime = self.current_time
+        completed_process.turnaroundTime = completed_process.completionTime - completed_process.arrivalTime
+        completed_process.waitingTime = completed_process.turnaroundTime - completed_process.burstTime
+
+        self.currentProcess = None
+
+        completed = self.algorithm.process_completion(completed_process)
+
+        if completed == 1:
+            self.metrics.addProcess(completed_process)
+            if self.listeners:
+                self._publish(PROCESS_COMPLETED, completed_process)
+        elif completed == 0:
+            # Periodic process still has executions left, it is released again
+            completed_process.remaining_time = completed_process.burstTime
+            completed_process.time_in_current_quantum = 0
+            if self.listeners:
+                self._publish(PROCESS_RELEASED, completed_process)
+        else:
+            self.deadlineMissCount += 1
+            if self.listeners:
+                self._publish(DEADLINE_MISSED, completed_process)
+
+        if completed != 0:
+            self.readyProcesses.pop(completed_process.pid, None)
+
+        self._checkScheduling()
+
+    def _preemptCurrentProcess(self, reason: str):
+        preempted_process = self.currentProcess
+        preempted_process.time_in_current_quantum = 0
+        self.currentProcess = None
+        self.algorithm.process_preemption(preempted_process, reason)
+        if self.listeners:
+            self._publish(PROCESS_PREEMPTED, preempted_process, reason)
+        self._checkScheduling()
+
+    # Periodic boost of the algorithm, the boosted processes may now beat the running one
+    def boostPriorities(self):
+        self.algorithm.boost()
+        self.readySetChanged = True
+        self.checkPreemption()
+
+    # Called when a process deadline is reached, algorithms that work with deadlines
+    # drop the process if it didn't complete in time
+    def deadlineExpired(self, process: Process):
+        if not self.algorithm.uses_deadlines or process.remaining_time <= 0:
+            return
+
+        if process is self.currentProcess:
+            self.currentProcess = None
+
+        self.algorithm.deadline_miss(process)
+        del self.readyProcesses[process.pid]
+        self.deadlineMissCount += 1
+        if self.listeners:
+            self._publish(DEADLINE_MISSED, process)
+
+        self._checkScheduling()
+
+    # Hook called whenever the UI should be refreshed, there's no UI by default.
+    # force is set for the last refresh of a simulation, which must never be skipped
+    def emitUpdateUISignals(self, force=False):
+        pass
+
+    def hasRunningProcesses(self):
+        return self.currentProcess is not None or len(self.readyProcesses) > 0
+
+    def _checkScheduling(self):
+        if not self.currentProcess:
+            next_process = self.algorithm.schedule()
+            if next_process:
+                if next_process.firstScheduling is None:
+                    next_process.firstScheduling = self.current_time * 1000
+
+                self.processSwitchCount += 1
+                self.currentProcess = next_process
+                if self.listeners:
+                    self._publish(PROCESS_DISPATCHED, next_process)
+
+    def getAllProcesses(self):
+        # Combine todas as listas de processos relevantes
+        all_processes = []
+
+        # Adicionar processos prontos
+        if self.readyProcesses:
+            all_processes.extend(self.readyProcesses.values())
+
+        # Adicionar processo em execução se existir
+        if self.currentProcess is not None:
+            all_processes.append(self.currentProcess)
+
+        return all_processes
+
@@ -1,11 +1,21 @@
+import argparse
+import json
+
 from config.config import Config
 
-from clock import ClockWorker
-from scheduler import SchedulerWorker
 from processes.process_generation import ProcessGenerator
+from headless import HeadlessSimulation, printMetrics
+from event_trace import TraceReader
+from trace_replay import TraceReplay
+from sweep import runSweep
 
 class Simulation:
     def __init__(self, config):
+        # Qt workers are only imported by the GUI simulation, so running this module
+        # headless (python -m simulation run ...) never loads PyQt6
+        from clock import ClockWorker
+        from scheduler import createSchedulerWorker
+
         # Initializes our simulation configuration
         config = Config(config)
         processGenConfig = config.processGenerationConfig
@@ -14,13 +24,79 @@ class Simulation:
 
         # Responsible for generate processes using probabilistics distributions
         processGenerator = ProcessGenerator(processGenConfig)
+        processList = processGenerator.generate_processes()
 
-        processList = (processGenerator.generate_random_processes()
-                       if processGenConfig.useProcessGeneration
-                       else processGenerator.get_static_processes())
+        self.config = config
 
         # Responsible to decide which process to execute
-        self.schedulerWorker = SchedulerWorker(schedulingConfig, clockConfig)
+        self.schedulerWorker = createSchedulerWorker(schedulingConfig, clockConfig)
+        if config.tracePath:
+            self.schedulerWorker.recordTrace(config.tracePath)
 
         # Responsible for feading the Scheduler with a process when it arrives
-        self.clockWorker = ClockWorker(clockConfig, self.schedulerWorker, processList)
\ No newline at end of file
+        self.clockWorker = ClockWorker(clockConfig, self.schedulerWorker, processList)
+
+"""
+    Command line entry point for running simulations without the GUI:
+
+    - run: one simulation, prints its aggregate metrics
+    - sweep: a grid of simulations in parallel, streamed into a CSV table
+    - replay: the state of a recorded trace at a given time
+"""
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="simulation", description="Scheduling simulator without the GUI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    runParser = subparsers.add_parser("run", help="run one simulation and print its aggregate metrics")
+    runParser.add_argument("config", help="path to a config.json file")
+    runParser.add_argument("--out", help="also write the metrics to this JSON file")
+    runParser.add_argument("--trace", help="record every scheduler event into this binary trace file")
+
+    sweepParser = subparsers.add_parser("sweep", help="run every combination of a parameter grid in parallel")
+    sweepParser.add_argument("spec", help="path to a grid spec JSON file")
+    sweepParser.add_argument("--out", default="sweep.csv", help="CSV file the results are streamed to")
+    sweepParser.add_argument("--workers", type=int, help="number of worker processes (default: all cores)")
+
+    replayParser = subparsers.add_parser("replay", help="print the state of a recorded trace at a given time")
+    replayParser.add_argument("trace", help="path to a trace recorded with run --trace")
+    replayParser.add_argument("--at", type=float, required=True, help="virtual time, in seconds")
+    replayParser.add_argument("--until", type=float, help="also list every process waiting between --at and this time")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        printReplay(TraceReplay(TraceReader(args.trace)), args.at, args.until)
+        return
+
+    if args.command == "sweep":
+        with open(args.spec, 'r') as file:
+            spec = json.load(file)
+
+        runSweep(spec, args.out, args.workers)
+        return
+
+    with open(args.config, 'r') as file:
+        configData = json.load(file)
+
+    metrics = HeadlessSimulation(configData, args.trace).run()
+    printMetrics(metrics)
+
+    if args.out:
+        with open(args.out, 'w') as file:
+            json.dump(metrics, file, indent=2)
+
+def printReplay(replay: TraceReplay, time, until=None):
+    state = replay.stateAt(time)
+
+    print(f"Events: {len(replay)} ({replay.startTime:.2f} to {replay.endTime:.2f})")
+    print(f"At {time:.2f}: running {state.describeRunning(replay.cpus)}, "
+          f"{state.completed} completed, {state.deadlineMisses} deadline misses, {state.processSwitchCount} switches"
+          + (f", {state.migrations} migrations" if state.migrations else ""))
+    print(f"Waiting ({len(state.waiting)}): {' '.join(map(str, state.waiting))}")
+
+    if until is not None:
+        waiting = replay.waitingBetween(time, until)
+        print(f"Waiting between {time:.2f} and {until:.2f} ({len(waiting)}): {' '.join(map(str, waiting))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import copy
+import csv
+import itertools
+import json
+import os
+import signal
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from headless import HeadlessSimulation
+
+# Metrics written for every cell, after the grid parameters
+METRIC_COLUMNS = [
+    "status", "error", "elapsedSeconds", "simulatedTime", "completedProcesses", "deadlineMisses",
+    "processSwitchCount", "avgTurnaround", "turnaroundVariance", "p95Turnaround", "p99Turnaround",
+    "avgWaiting", "p95Waiting", "avgResponse", "p95Response", "utilization", "migrations"
+]
+
+"""
+    Expands a grid spec into one config per combination.
+
+    A grid spec looks like:
+    {
+        "base": "config.json",                 (path or config object)
+        "grid": {
+            "scheduling.schedulingAlgorithm": ["Round Robin", "Shortest Job First"],
+            "scheduling.timeQuantum": [1, 2, 4],
+            "scheduling.cpus": [1, 4, 16],
+            "processGeneration.arrival.lambda": [2, 4],
+            "processGeneration.seed": [1, 2, 3]
+        },
+        "timeout": 60                          (optional, seconds per cell)
+    }
+
+    Keys are dotted paths into the config, every combination of values becomes a cell.
+"""
+def expandGrid(spec):
+    base = spec["base"]
+    if isinstance(base, str):
+        with open(base, 'r') as file:
+            base = json.load(file)
+
+    keys = list(spec["grid"].keys())
+    cells = []
+
+    for values in itertools.product(*(spec["grid"][key] for key in keys)):
+        config = copy.deepcopy(base)
+        for key, value in zip(keys, values):
+            setByPath(config, key, value)
+        cells.append((dict(zip(keys, values)), config))
+
+    return keys, cells
+
+def setByPath(config, path, value):
+    *parents, last = path.split(".")
+    for parent in parents:
+        config = config.setdefault(parent, {})
+    config[last] = value
+
+def _onTimeout(signum, frame):
+    raise TimeoutError("cell exceeded its time limit")
+
+# Runs one cell inside a worker process, failures are reported in the row instead of raised
+def runCell(params, config, timeout=None):
+    row = dict(params)
+    start = time.perf_counter()
+
+    if timeout:
+        signal.signal(signal.SIGALRM, _onTimeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        metrics = HeadlessSimulation(config).run()
+        row.update({
+            "status": "ok",
+            "error": "",
+            "simulatedTime": metrics["simulatedTime"],
+            "completedProcesses": metrics["completedProcesses"],
+            "deadlineMisses": metrics["deadlineMisses"],
+            "processSwitchCount": metrics["processSwitchCount"],
+            "avgTurnaround": metrics["turnaroundTime"]["avg"],
+            "turnaroundVariance": metrics["turnaroundTime"]["variance"],
+            "p95Turnaround": metrics["turnaroundTime"]["p95"],
+            "p99Turnaround": metrics["turnaroundTime"]["p99"],
+            "avgWaiting": metrics["waitingTime"]["avg"],
+            "p95Waiting": metrics["waitingTime"]["p95"],
+            "avgResponse": metrics["responseTime"]["avg"],
+            "p95Response": metrics["responseTime"]["p95"],
+            # Only multi-core simulations report them
+            "utilization": metrics.get("utilization", ""),
+            "migrations": metrics.get("migrations", ""),
+        })
+    except TimeoutError as e:
+        row.update({"status": "timeout", "error": str(e)})
+    except Exception as e:
+        row.update({"status": "failed", "error": f"{type(e).__name__}: {e}"})
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    row["elapsedSeconds"] = time.perf_counter() - start
+    return row
+
+"""
+    Runs every cell of the grid in a process pool spread across all cores.
+
+    Rows are written to the CSV file as soon as each cell finishes, in completion order,
+    so failed or slow cells never hold back the others.
+"""
+def runSweep(spec, outPath, workers=None):
+    keys, cells = expandGrid(spec)
+    timeout = spec.get("timeout")
+    workers = workers or os.cpu_count()
+
+    with open(outPath, 'w', newline='') as file, ProcessPoolExecutor(max_workers=workers) as executor:
+        writer = csv.DictWriter(file, fieldnames=keys + METRIC_COLUMNS)
+        writer.writeheader()
+
+        futures = {executor.submit(runCell, params, config, timeout): params for params, config in cells}
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                row = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed for using too much memory)
+                row = dict(futures[future], status="failed", error=f"{type(e).__name__}: {e}", elapsedSeconds=0.0)
+
+            writer.writerow(row)
+            file.flush()
+            print(f"[{done}/{len(cells)}] {row['status']} {row['elapsedSeconds']:.2f}s", file=sys.stderr)
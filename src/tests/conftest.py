@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+from processes.process import Process
+
+# Processes with whole second arrivals and bursts, sorted by arrival, with fixed deadlines
+# deadlineRange after their arrival (None puts them out of reach)
+def integerWorkload(seed, size=30, deadlineRange=(5, 60)):
+    rng = random.Random(seed)
+    processes = []
+
+    for pid in range(1, size + 1):
+        arrival = float(rng.randint(0, 40))
+        deadline = arrival + rng.randint(*deadlineRange) if deadlineRange else 1e9
+        processes.append(Process(pid, arrival, float(rng.randint(1, 8)), rng.randint(0, 9), rng.randint(1, 3),
+                                 deadline, randomDeadline=False))
+
+    return sorted(processes, key=lambda process: (process.arrivalTime, process.pid))
+
+@pytest.fixture
+def workload():
+    return integerWorkload
@@ -0,0 +1,56 @@
+import pytest
+
+from algorithms.completely_fair import priorityWeight
+from config.types.scheduling import SchedulingConfig
+from multicore import createScheduler, createEventEngine
+from processes.process import Process
+
+def schedulingConfig(cpus, timeQuantum=0.5):
+    return SchedulingConfig({"schedulingAlgorithm": "CFS", "timeQuantum": timeQuantum, "cpus": cpus})
+
+def preemptions(scheduler):
+    recorded = []
+    scheduler.addListener(lambda kind, time, process, reason, cpu: reason and recorded.append((time, process.pid, reason)))
+    return recorded
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_cpu_time_is_shared_by_weight(cpus):
+    scheduler = createScheduler(schedulingConfig(cpus))
+    processes = [Process(pid, 0.0, 10000.0, pid % 10, 1, 0, randomDeadline=False) for pid in range(20)]
+    engine = createEventEngine(scheduler, processes)
+    while engine.now < 500:
+        engine.step()
+
+    # Running processes are charged lazily on several CPUs
+    for cpu in getattr(scheduler, "cpus", []):
+        if cpu.current:
+            scheduler._account(cpu)
+
+    used = [process.burstTime - process.remaining_time for process in processes]
+    totalWeight = sum(priorityWeight(process.priority) for process in processes)
+    for process, time in zip(processes, used):
+        share = priorityWeight(process.priority) / totalWeight
+        assert time / sum(used) == pytest.approx(share, rel=0.01)
+
+def test_slice_doesnt_grow_when_another_process_leaves():
+    scheduler = createScheduler(schedulingConfig(2, timeQuantum=2))
+    recorded = preemptions(scheduler)
+    processes = [Process(pid, 0.0, burst, 0, 1, 0, randomDeadline=False)
+                 for pid, burst in zip((1, 2, 3, 4), (20, 0.3, 20, 20))]
+    createEventEngine(scheduler, processes).run()
+
+    # Four processes share a 2 second latency: 0.5 second slices, fixed when dispatched
+    assert (0.5, 1, "quantum") in recorded
+    assert processes[0].completionTime > 25
+
+def test_waking_process_preempts_the_one_ahead():
+    scheduler = createScheduler(schedulingConfig(1, timeQuantum=4))
+    recorded = preemptions(scheduler)
+    processes = [Process(1, 0.0, 10.0, 0, 1, 0, randomDeadline=False), Process(2, 0.0, 10.0, 0, 1, 0, randomDeadline=False),
+                 Process(3, 1.0, 1.0, 0, 1, 0, randomDeadline=False)]
+    createEventEngine(scheduler, processes).run()
+
+    # Process 2 never ran and is first in line, the newcomer follows before process 1 runs again
+    assert recorded[0] == (1.0, 1, "wakeup")
+    assert recorded[1] == (pytest.approx(1.0 + 4 / 3), 2, "quantum")
+    assert processes[2].completionTime == pytest.approx(2.0 + 4 / 3)
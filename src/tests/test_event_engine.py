@@ -0,0 +1,77 @@
+import pytest
+
+from algorithms.algorithm_factory import AVAILABLE_ALGORITHMS
+from algorithms.multilevel_queue import MultilevelQueueScheduling
+from config.types.scheduling import SchedulingConfig
+from event_engine import EventEngine
+from processes.arrival_cursor import createArrivalCursor
+from processes.process import Process
+from scheduler_core import Scheduler
+
+# CFS slices are fractions of the latency, which one second ticks can't follow
+TICK_ALGORITHMS = [name for name in AVAILABLE_ALGORITHMS if name != "Completely Fair Scheduler"]
+
+def createScheduler(algorithm, boostInterval=0):
+    return Scheduler(SchedulingConfig({"schedulingAlgorithm": algorithm, "timeQuantum": 2, "boostInterval": boostInterval}))
+
+# Tick loop handing the arrivals of every second to the scheduler once it ran up to it
+def runTicks(scheduler, processes):
+    arrivals = createArrivalCursor(processes)
+    currentTime = 0
+
+    scheduler.receiveNewProcesses(arrivals.popDue(currentTime))
+    while not arrivals.isExhausted() or scheduler.hasRunningProcesses():
+        currentTime += 1
+        scheduler.runSchedulingCycle()
+
+        newProcesses = arrivals.popDue(currentTime)
+        if newProcesses:
+            scheduler.receiveNewProcesses(newProcesses)
+            scheduler.checkPreemption()
+
+def outcome(scheduler, processes):
+    return ({process.pid: process.completionTime for process in processes},
+            scheduler.processSwitchCount, scheduler.deadlineMissCount, scheduler.metrics.count)
+
+@pytest.mark.parametrize("boostInterval", [0, 5, 13])
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("algorithm", TICK_ALGORITHMS)
+def test_event_engine_matches_tick_loop(workload, algorithm, seed, boostInterval):
+    # Deadlines are out of reach, a miss is only noticed at the next tick by the tick loop
+    eventScheduler = createScheduler(algorithm, boostInterval)
+    eventProcesses = workload(seed, deadlineRange=None)
+    EventEngine(eventScheduler, eventProcesses).run()
+
+    tickScheduler = createScheduler(algorithm, boostInterval)
+    tickProcesses = workload(seed, deadlineRange=None)
+    runTicks(tickScheduler, tickProcesses)
+
+    assert outcome(eventScheduler, eventProcesses) == outcome(tickScheduler, tickProcesses)
+
+def test_boost_keeps_the_quantum_of_the_running_process():
+    algorithm = MultilevelQueueScheduling(2, boost_interval=10)
+    process = Process(1, 0.0, 20.0, 0, 1, 1e9, randomDeadline=False)
+    algorithm.process_arrival(process)
+    algorithm.process_preemption(algorithm.schedule(), "quantum")
+
+    # Dispatched on level 1, boosted while running: the expiry already scheduled still holds
+    assert algorithm.schedule() is process
+    algorithm.boost()
+    assert algorithm.quantum_for(process) == 4
+
+    # Back to level 0 rather than demoted for the level 1 quantum
+    algorithm.process_preemption(process, "quantum")
+    assert algorithm.levelOf(process) == 0
+    assert algorithm.schedule() is process
+    assert algorithm.quantum_for(process) == 2
+
+@pytest.mark.parametrize("algorithm", AVAILABLE_ALGORITHMS)
+def test_every_process_finishes(workload, algorithm):
+    scheduler = createScheduler(algorithm)
+    processes = workload(7)
+    engine = EventEngine(scheduler, processes)
+    engine.run()
+
+    assert scheduler.metrics.count + scheduler.deadlineMissCount == len(processes)
+    assert not scheduler.hasRunningProcesses()
+    assert engine.now >= max(process.arrivalTime for process in processes)
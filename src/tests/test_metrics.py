@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from metrics import BATCH_SIZE, QUANTILES, RELATIVE_ACCURACY, CompletionMetrics, RunningStatistic
+from processes.process import Process
+
+DISTRIBUTIONS = {
+    "exponential": lambda rng: rng.exponential(3.0, 50000),
+    "normal": lambda rng: rng.normal(0.0, 5.0, 50000),
+    "lognormal": lambda rng: rng.lognormal(1.0, 2.0, 50000),
+    "with zeros": lambda rng: np.concatenate((np.zeros(5000), rng.uniform(0, 10, 5000))),
+}
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_statistic_matches_numpy(distribution):
+    values = DISTRIBUTIONS[distribution](np.random.default_rng(1))
+    statistic = RunningStatistic()
+    for batch in np.array_split(values, 13):
+        statistic.addMany(batch)
+
+    snapshot = statistic.snapshot()
+    assert snapshot.count == len(values)
+    assert snapshot.mean == pytest.approx(values.mean())
+    assert snapshot.variance == pytest.approx(values.var())
+    assert (snapshot.min, snapshot.max) == (values.min(), values.max())
+
+    # Relative accuracy, plus the gap between the neighbouring values numpy interpolates
+    for p in QUANTILES:
+        expected = np.percentile(values, p * 100)
+        assert snapshot.quantiles[p] == pytest.approx(expected, rel=2 * RELATIVE_ACCURACY, abs=1e-6)
+
+def test_small_samples_interpolate_like_numpy():
+    values = np.array([1.0, 2.0, 3.0, 10.0])
+    statistic = RunningStatistic()
+    statistic.addMany(values)
+
+    for p, value in statistic.snapshot().quantiles.items():
+        assert value == pytest.approx(np.percentile(values, p * 100), rel=RELATIVE_ACCURACY)
+
+def test_completion_metrics_count_pending_completions():
+    metrics = CompletionMetrics()
+    for pid in range(BATCH_SIZE + 10):
+        process = Process(pid, 1.0, 2.0, 0, 1, 0, randomDeadline=False)
+        process.firstScheduling = 1500.0
+        process.completionTime = 4.0
+        process.turnaroundTime = 3.0
+        process.waitingTime = 1.0
+        metrics.addProcess(process)
+
+    assert metrics.count == BATCH_SIZE + 10
+    snapshot = metrics.snapshot()
+    assert snapshot["turnaroundTime"].count == BATCH_SIZE + 10
+    assert snapshot["responseTime"].mean == pytest.approx(0.5)
+    assert snapshot["waitingTime"].quantiles[0.5] == pytest.approx(1.0)
+
+def test_empty_snapshot():
+    snapshot = CompletionMetrics().snapshot()["waitingTime"]
+    assert snapshot.count == 0
+    assert snapshot.quantiles == {p: 0.0 for p in QUANTILES}
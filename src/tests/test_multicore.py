@@ -0,0 +1,42 @@
+import pytest
+
+from algorithms.algorithm_factory import AVAILABLE_ALGORITHMS
+from config.types.scheduling import SchedulingConfig
+from event_engine import EventEngine
+from multicore import MultiCoreScheduler, MultiCoreEventEngine, createScheduler, createEventEngine
+from scheduler_core import Scheduler
+
+def schedulingConfig(algorithm, cpus=1, cpuScheduling="global"):
+    return SchedulingConfig({"schedulingAlgorithm": algorithm, "timeQuantum": 2, "boostInterval": 10,
+                             "cpus": cpus, "cpuScheduling": cpuScheduling, "loadBalanceInterval": 1})
+
+def events(scheduler):
+    recorded = []
+    scheduler.addListener(lambda kind, time, process, reason, cpu: recorded.append((kind, time, process.pid, reason)))
+    return recorded
+
+@pytest.mark.parametrize("cpuScheduling", ["global", "partitioned"])
+@pytest.mark.parametrize("algorithm", AVAILABLE_ALGORITHMS)
+def test_one_cpu_matches_single_cpu_scheduler(workload, algorithm, cpuScheduling):
+    single = Scheduler(schedulingConfig(algorithm))
+    singleEvents = events(single)
+    EventEngine(single, workload(3)).run()
+
+    multi = MultiCoreScheduler(schedulingConfig(algorithm, 1, cpuScheduling))
+    multiEvents = events(multi)
+    MultiCoreEventEngine(multi, workload(3)).run()
+
+    assert multiEvents == singleEvents
+    assert multi.metrics.snapshot() == single.metrics.snapshot()
+
+@pytest.mark.parametrize("cpuScheduling", ["global", "partitioned"])
+@pytest.mark.parametrize("algorithm", AVAILABLE_ALGORITHMS)
+def test_every_process_finishes_on_several_cpus(workload, algorithm, cpuScheduling):
+    scheduler = createScheduler(schedulingConfig(algorithm, 4, cpuScheduling))
+    processes = workload(5, size=80)
+    engine = createEventEngine(scheduler, processes)
+    engine.run()
+
+    assert scheduler.metrics.count + scheduler.deadlineMissCount == len(processes)
+    assert all(cpu.current is None for cpu in scheduler.cpus)
+    assert 0 < scheduler.utilization(engine.now) <= 1
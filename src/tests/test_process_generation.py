@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+import pytest
+
+from config.types.process_generation import ProcessGenerationConfig
+from config.types.scheduling import SchedulingConfig
+from event_engine import EventEngine
+from processes.process_generation import ProcessGenerator
+from scheduler_core import Scheduler
+
+def generationConfig(seed=57, **options):
+    weights = [0.25, 0.2, 0.15, 0.1, 0.08, 0.07, 0.05, 0.04, 0.02, 0.01]
+    return ProcessGenerationConfig({
+        "useProcessGeneration": True, "seed": seed, "maxTime": 200, "arrival": {"lambda": 4}, "burst": {"lambda": 0.5},
+        "priorities": {"values": list(range(10)), "weights": weights},
+        "periods": {"values": list(range(1, 11)), "weights": weights},
+        **options,
+    })
+
+def columns(processes):
+    return [(process.pid, process.arrivalTime, process.burstTime, process.priority, process.period, process.deadline)
+            for process in processes]
+
+def generate(seed=57, **options):
+    processes = ProcessGenerator(generationConfig(seed, **options)).generate_processes()
+    if options.get("streamProcesses"):
+        return [process for table in processes for process in table.toProcesses()]
+    if options.get("useProcessTable"):
+        return processes.toProcesses()
+    return processes
+
+def test_list_mode_only_depends_on_the_seed():
+    random.seed(1)
+    first = columns(generate())
+    random.seed(2)
+    assert columns(generate()) == first
+    assert columns(generate(seed=58)) != first
+
+@pytest.mark.parametrize("options", [{"useProcessTable": True}, {"streamProcesses": True, "streamChunkSize": 64}])
+def test_every_generation_path_gives_the_same_workload(options):
+    # Streamed arrivals are summed chunk by chunk, they only differ by rounding
+    assert np.allclose(columns(generate(**options)), columns(generate()), rtol=1e-12)
+
+def test_same_seed_same_edf_results():
+    results = []
+    for options in ({}, {}, {"useProcessTable": True}):
+        random.seed(len(results))
+        scheduler = Scheduler(SchedulingConfig({"schedulingAlgorithm": "Earliest Deadline First", "timeQuantum": 2}))
+        EventEngine(scheduler, generate(**options)).run()
+        results.append((scheduler.deadlineMissCount, scheduler.metrics.snapshot()["turnaroundTime"].mean))
+
+    assert results[0] == results[1] == results[2]
+
+def test_generation_leaves_the_global_random_state_alone():
+    state = random.getstate()
+    generate()
+    generate(useProcessTable=True)
+    assert random.getstate() == state
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from processes.process import Process
+from ui.custom.process_list_model import ProcessListModel
+
+def processes(first, last):
+    return [Process(pid, 0.0, 1.0, 0, 1, 1e9, randomDeadline=False) for pid in range(first, last + 1)]
+
+def pids(model):
+    return [model.process(row).pid for row in range(model.rowCount())]
+
+def test_capacity_keeps_the_last_processes():
+    model = ProcessListModel(capacity=5)
+    model.appendProcesses(processes(1, 4))
+    model.appendProcesses(processes(5, 7))
+    assert pids(model) == [3, 4, 5, 6, 7]
+
+    # A batch larger than the capacity only keeps its end
+    model.appendProcesses(processes(8, 20))
+    assert pids(model) == [16, 17, 18, 19, 20]
+    assert set(model.sequenceByPid) == {16, 17, 18, 19, 20}
+
+    # Rows are still found after the oldest ones were dropped
+    model.removeProcesses([17, 19])
+    assert pids(model) == [16, 18, 20]
+
+def test_no_capacity_keeps_everything():
+    model = ProcessListModel()
+    for first in range(1, 100, 10):
+        model.appendProcesses(processes(first, first + 9))
+
+    assert pids(model) == list(range(1, 101))
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from config.types.scheduling import SchedulingConfig
+from event_trace import BUFFER_RECORDS, GROWTH_RECORDS, TraceReader, TraceRecord, TraceRecorder
+from multicore import createScheduler, createEventEngine
+from processes.process import Process
+from trace_replay import ReplayState, TraceReplay
+
+def test_recorder_round_trip(tmp_path):
+    path = tmp_path / "round_trip.trace"
+    reasons = [None, "quantum", "higher priority", "wakeup"]
+    expected = [TraceRecord(index * 0.25, index % 1000, index % 7, reasons[index % 4], index % 3)
+                for index in range(GROWTH_RECORDS + BUFFER_RECORDS + 5)]
+
+    recorder = TraceRecorder(path)
+    for record in expected:
+        recorder.record(record.kind, record.time, Process(record.pid, 0.0, 1.0, 0, 1, 0, randomDeadline=False),
+                        record.reason, record.cpu)
+    recorder.close()
+
+    reader = TraceReader(path)
+    assert len(reader) == len(expected)
+    assert list(reader) == expected
+    assert reader[-1] == expected[-1]
+    reader.close()
+
+def recordSimulation(path, algorithm, cpus):
+    scheduler = createScheduler(SchedulingConfig({"schedulingAlgorithm": algorithm, "timeQuantum": 2, "cpus": cpus}))
+    scheduler.recordTrace(path)
+    rng = np.random.default_rng(4)
+    processes = [Process(pid, pid / (1.5 * cpus), float(rng.uniform(0.5, 3)), int(rng.integers(0, 10)), 1, 1e9,
+                         randomDeadline=False) for pid in range(1, 1500)]
+    createEventEngine(scheduler, processes).run()
+    scheduler.finish()
+
+def linearReplay(replay: TraceReplay, events) -> ReplayState:
+    state = ReplayState()
+    for kind, pid, cpu in zip(replay.kinds[:events].tolist(), replay.pids[:events].tolist(), replay.cpuIndexes[:events].tolist()):
+        state.apply(kind, pid, cpu)
+    return state
+
+@pytest.fixture(params=[("Round Robin", 1), ("Completely Fair Scheduler", 4), ("Priority Scheduling (Preemptive)", 4)])
+def replay(request, tmp_path):
+    path = tmp_path / "simulation.trace"
+    recordSimulation(path, *request.param)
+    # Small checkpoint interval, so most states start from a checkpoint with waiting processes
+    return TraceReplay(TraceReader(path), checkpointInterval=64)
+
+def test_state_matches_linear_replay(replay):
+    times = np.concatenate((np.linspace(replay.startTime - 1, replay.endTime + 1, 40), replay.times[::97]))
+    for time in times:
+        state = replay.stateAt(time)
+        expected = linearReplay(replay, replay.eventsUntil(time))
+
+        assert list(state.waiting) == list(expected.waiting)
+        assert state.running == expected.running
+        assert state.counts == expected.counts
+
+def test_waiting_between_adds_the_processes_that_started_waiting(replay):
+    start, end = replay.startTime + 100, replay.startTime + 130
+    waiting = linearReplay(replay, replay.eventsUntil(start)).waiting
+    for index in range(replay.eventsUntil(start), replay.eventsUntil(end)):
+        state = ReplayState()
+        state.apply(int(replay.kinds[index]), int(replay.pids[index]))
+        waiting.update(state.waiting)
+
+    assert replay.waitingBetween(start, end) == list(waiting)
+
+def test_index_is_proportional_to_the_trace(replay):
+    assert len(replay.intervalStarts) <= len(replay)
+    assert all(len(checkpoint.running) <= replay.cpus for checkpoint in replay.checkpoints)
+
+# Intervals a lookup at the checkpoint looks at: the ones of its snapshot and the ones started since
+def examinedIntervals(replay: TraceReplay, checkpoint) -> int:
+    started = np.searchsorted(replay.intervalStarts, [checkpoint.snapshotEvent, checkpoint.eventIndex], side="left")
+    return len(checkpoint.snapshotIntervals) + int(started[1] - started[0])
+
+def test_lookups_dont_scan_past_a_starving_process(tmp_path):
+    path = tmp_path / "starving.trace"
+    scheduler = createScheduler(SchedulingConfig({"schedulingAlgorithm": "Shortest Job First", "timeQuantum": 2}))
+    scheduler.recordTrace(path)
+    # Process 1 is the longest and waits behind back to back short processes, one of them always queued
+    processes = [Process(1, 0.0, 5.0, 0, 1, 1e9, randomDeadline=False)]
+    processes += [Process(pid, max(pid - 3, 0) * 0.5, 0.5, 0, 1, 1e9, randomDeadline=False) for pid in range(2, 20000)]
+    createEventEngine(scheduler, processes).run()
+    scheduler.finish()
+
+    replay = TraceReplay(TraceReader(path), checkpointInterval=64)
+    assert len(replay.checkpoints) > 500
+    assert max(examinedIntervals(replay, checkpoint) for checkpoint in replay.checkpoints) <= 2 * replay.checkpointInterval
+
+    for time in np.linspace(replay.startTime, replay.endTime, 25):
+        state = replay.stateAt(time)
+        expected = linearReplay(replay, replay.eventsUntil(time))
+        assert list(state.waiting) == list(expected.waiting)
+        assert 1 in state.waiting or time >= processes[-1].arrivalTime
@@ -0,0 +1,220 @@
+import numpy as np
+
+from array import array
+from typing import Dict, List, NamedTuple
+
+from event_trace import TraceReader
+from scheduler_core import (PROCESS_ARRIVED, PROCESS_DISPATCHED, PROCESS_PREEMPTED,
+                            PROCESS_COMPLETED, PROCESS_RELEASED, DEADLINE_MISSED, PROCESS_MIGRATED)
+
+# Number of event kinds counted by the replay
+EVENT_KINDS = PROCESS_MIGRATED + 1
+
+class Checkpoint(NamedTuple):
+    # Events applied to reach it
+    eventIndex: int
+    # Last snapshot of the open wait intervals at or before it: its event and the intervals,
+    # in the order they started. Checkpoints share snapshots, they aren't copies
+    snapshotEvent: int
+    snapshotIntervals: np.ndarray
+    # (CPU, PID) of the running processes
+    running: tuple
+    counts: tuple
+
+"""
+    State of the simulation after some events of a trace:
+    the waiting processes, the running one of each CPU and how many events of each kind happened.
+"""
+class ReplayState:
+    def __init__(self, time=0.0, waiting: Dict[int, None] = None, running: Dict[int, int] = None, counts=None):
+        self.time = time
+        # Used as an insertion ordered set
+        self.waiting = waiting if waiting is not None else {}
+        # PID running on each busy CPU
+        self.running = running if running is not None else {}
+        self.counts = counts if counts is not None else [0] * EVENT_KINDS
+
+    def apply(self, kind, pid, cpu=0):
+        self.counts[kind] += 1
+
+        if kind == PROCESS_ARRIVED:
+            self.waiting[pid] = None
+        elif kind == PROCESS_DISPATCHED:
+            self.waiting.pop(pid, None)
+            self.running[cpu] = pid
+        elif kind == PROCESS_PREEMPTED or kind == PROCESS_RELEASED:
+            # A released periodic process waits for its next job
+            if self.running.get(cpu) == pid:
+                del self.running[cpu]
+            self.waiting[pid] = None
+        elif kind != PROCESS_MIGRATED:
+            # Completed or missed its deadline, it leaves the system.
+            # A migrated process keeps waiting, only its CPU changed
+            if self.running.get(cpu) == pid:
+                del self.running[cpu]
+            self.waiting.pop(pid, None)
+
+    def checkpoint(self, eventIndex, snapshotEvent, snapshotIntervals) -> Checkpoint:
+        return Checkpoint(eventIndex, snapshotEvent, snapshotIntervals, tuple(self.running.items()), tuple(self.counts))
+
+    @staticmethod
+    def fromCheckpoint(checkpoint: Checkpoint, waiting: List[int], time) -> "ReplayState":
+        return ReplayState(time, dict.fromkeys(waiting), dict(checkpoint.running), list(checkpoint.counts))
+
+    @property
+    def completed(self):
+        return self.counts[PROCESS_COMPLETED]
+
+    @property
+    def deadlineMisses(self):
+        return self.counts[DEADLINE_MISSED]
+
+    @property
+    def processSwitchCount(self):
+        return self.counts[PROCESS_DISPATCHED]
+
+    @property
+    def migrations(self):
+        return self.counts[PROCESS_MIGRATED]
+
+    # "PID 3" on one CPU, "CPU 0: PID 3, CPU 2: PID 7" on several (the first `limit` busy CPUs),
+    # "none" when every CPU is idle
+    def describeRunning(self, cpus=1, limit=None):
+        if not self.running:
+            return "none"
+        if cpus == 1:
+            return f"PID {self.running[0]}"
+
+        running = sorted(self.running.items())
+        text = ", ".join(f"CPU {cpu}: PID {pid}" for cpu, pid in running[:limit])
+        if limit is not None and len(running) > limit:
+            text += f" (+{len(running) - limit} more)"
+        return text
+
+"""
+    Random access replay of a recorded trace.
+
+    One pass over the trace builds an index proportional to the trace:
+    - the wait intervals of every process, (first event, last event, PID) in the order they start
+    - every `checkpointInterval` (K) events, the running processes and the event counters
+    - sparse snapshots of the open wait intervals: one is only taken at a checkpoint once at least
+      as many events as there are open intervals went by since the last one, so all snapshots
+      together hold at most one interval per event
+
+    The state at any virtual time is the closest checkpoint before it plus at most K events, found
+    with a binary search over the event times. The waiting set of the checkpoint is the intervals of
+    its snapshot still open, plus the intervals started since the snapshot (a binary search over
+    their starts) still open. Snapshots are at most max(K, open intervals) events apart, so only
+    O(queue length + K) intervals are looked at, wherever the checkpoint is in the trace.
+
+    Times are virtual seconds, the state at a time includes the events happening at that time.
+"""
+class TraceReplay:
+    def __init__(self, reader: TraceReader, checkpointInterval=1024):
+        self.reader = reader
+        self.checkpointInterval = checkpointInterval
+        self.times = reader.records["time"]
+        self.kinds = reader.records["kind"]
+        self.pids = reader.records["pid"]
+        self.cpuIndexes = reader.records["cpu"]
+        # Number of CPUs of the simulation, as far as the trace shows
+        self.cpus = int(self.cpuIndexes.max()) + 1 if len(self.cpuIndexes) else 1
+        self.checkpoints: List[Checkpoint] = []
+        # Wait intervals: waiting after the event at intervalStarts until the one at intervalEnds,
+        # which is len(self) while still waiting at the end of the trace
+        self.intervalStarts = np.zeros(0, dtype=np.int64)
+        self.intervalEnds = np.zeros(0, dtype=np.int64)
+        self.intervalPids = np.zeros(0, dtype=np.uint32)
+
+        self._buildIndex()
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def startTime(self):
+        return float(self.times[0]) if len(self.times) else 0.0
+
+    @property
+    def endTime(self):
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+    def _buildIndex(self):
+        state = ReplayState()
+        waiting = state.waiting
+        interval = self.checkpointInterval
+        events = len(self)
+
+        # Typed arrays, a Python int per interval would take most of the memory of the build
+        starts, ends, pids = array("q"), array("q"), array("I")
+        # Wait interval of each waiting PID, in the order they started
+        openIntervals: Dict[int, int] = {}
+        snapshotEvent, snapshot = 0, np.zeros(0, dtype=np.int64)
+
+        # Plain lists are much faster than NumPy scalars in the replay loop
+        for index, (kind, pid, cpu) in enumerate(zip(self.kinds.tolist(), self.pids.tolist(), self.cpuIndexes.tolist())):
+            if index % interval == 0:
+                if index - snapshotEvent >= len(openIntervals):
+                    snapshotEvent = index
+                    snapshot = np.fromiter(openIntervals.values(), dtype=np.int64, count=len(openIntervals))
+                self.checkpoints.append(state.checkpoint(index, snapshotEvent, snapshot))
+
+            wasWaiting = pid in waiting
+            state.apply(kind, pid, cpu)
+            if wasWaiting != (pid in waiting):
+                if wasWaiting:
+                    ends[openIntervals.pop(pid)] = index
+                else:
+                    openIntervals[pid] = len(starts)
+                    starts.append(index)
+                    ends.append(events)
+                    pids.append(pid)
+
+        if not self.checkpoints:
+            self.checkpoints.append(state.checkpoint(0, 0, snapshot))
+
+        self.intervalStarts = np.frombuffer(starts, dtype=np.int64)
+        self.intervalEnds = np.frombuffer(ends, dtype=np.int64)
+        self.intervalPids = np.frombuffer(pids, dtype=np.uint32)
+
+    # Number of events happening at or before time
+    def eventsUntil(self, time) -> int:
+        return int(np.searchsorted(self.times, time, side="right"))
+
+    def _checkpointBefore(self, eventIndex) -> Checkpoint:
+        return self.checkpoints[min(eventIndex // self.checkpointInterval, len(self.checkpoints) - 1)]
+
+    # PIDs of the wait intervals started before the event at `until` and still open after
+    # the first `after` events, in the order they started
+    def _openIntervals(self, after, until) -> np.ndarray:
+        checkpoint = self._checkpointBefore(after)
+        snapshot = checkpoint.snapshotIntervals
+        snapshot = snapshot[self.intervalEnds[snapshot] >= after]
+
+        first = int(np.searchsorted(self.intervalStarts, checkpoint.snapshotEvent, side="left"))
+        last = int(np.searchsorted(self.intervalStarts, until, side="left"))
+        started = np.arange(first, last)[self.intervalEnds[first:last] >= after]
+
+        return self.intervalPids[np.concatenate((snapshot, started))]
+
+    def stateAt(self, time) -> ReplayState:
+        end = self.eventsUntil(time)
+        checkpoint = self._checkpointBefore(end)
+
+        waiting = self._openIntervals(checkpoint.eventIndex, checkpoint.eventIndex).tolist()
+        state = ReplayState.fromCheckpoint(checkpoint, waiting, time)
+        events = slice(checkpoint.eventIndex, end)
+        for kind, pid, cpu in zip(self.kinds[events].tolist(), self.pids[events].tolist(), self.cpuIndexes[events].tolist()):
+            state.apply(kind, pid, cpu)
+
+        return state
+
+    # PIDs waiting in the ready queue at time, in the order they started waiting
+    def waitingAt(self, time) -> List[int]:
+        return list(self.stateAt(time).waiting)
+
+    # PIDs waiting at any moment between start and end: the ones waiting at start
+    # plus the ones that started waiting afterwards, up to end
+    def waitingBetween(self, start, end) -> List[int]:
+        first, last = self.eventsUntil(start), self.eventsUntil(end)
+        return list(dict.fromkeys(self._openIntervals(first, max(first, last)).tolist()))
@@ -43,6 +43,8 @@ class ConfigWindow(QMainWindow):
         self.pgPanel = PGConfigPanel(config["processGeneration"] if config else None)
         self.clockPanel = ClockConfigPanel(config["clock"] if config else None)
         self.schedulingPanel = SchedulingConfigPanel(config["scheduling"] if config else None)
+        # Not editable in the panels, kept as loaded from the config file
+        self.tracePath = config.get("trace") if config else None
 
         # Add Load Config File Button
         btnLoadConfig = QPushButton("Load config from file")
@@ -94,6 +96,8 @@ class ConfigWindow(QMainWindow):
             "clock": self.clockPanel.getClockConfig(),
             "scheduling": self.schedulingPanel.getSchedulingConfig()
         }
+        if self.tracePath:
+            config["trace"] = self.tracePath
         
         return config
 
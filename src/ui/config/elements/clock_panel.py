@@ -1,4 +1,6 @@
-from PyQt6.QtWidgets import QGroupBox, QFormLayout, QCheckBox, QDoubleSpinBox
+from PyQt6.QtWidgets import QGroupBox, QFormLayout, QCheckBox, QDoubleSpinBox, QComboBox, QSpinBox
+
+from ui.graphs.slidingRate import SMOOTHING_KERNELS
 
 """
     Initializes the Clock configuration panel:
@@ -24,12 +26,44 @@ class ClockConfigPanel(QGroupBox):
         
         tickDuration.setValue(1)
 
+        rateWindow = QDoubleSpinBox()
+        rateWindow.setToolTip("Sliding window (seconds) the dN/dt lines of the graphs are computed over.")
+        rateWindow.setRange(0.5, 600.0)
+        rateWindow.setSingleStep(0.5)
+        rateWindow.setValue(7.5)
+
+        rateSmoothing = QComboBox()
+        rateSmoothing.setToolTip("Smoothing applied to successive dN/dt values.")
+        rateSmoothing.addItems(SMOOTHING_KERNELS)
+
+        rateSmoothingSpan = QSpinBox()
+        rateSmoothingSpan.setToolTip("Number of dN/dt values the smoothing spans.")
+        rateSmoothingSpan.setRange(1, 100)
+        rateSmoothingSpan.setValue(5)
+
+        maxSpeed = QCheckBox()
+        maxSpeed.setToolTip("Runs the simulation as fast as possible, the UI samples it at a capped frame rate.")
+
+        self.clockConfig = clockConfig or {}
+
         if clockConfig:
             tickDuration.setValue(clockConfig.get("tick", 0.1))
+            rateWindow.setValue(clockConfig.get("rateWindow", 7.5))
+            rateSmoothing.setCurrentText(clockConfig.get("rateSmoothing", "none"))
+            rateSmoothingSpan.setValue(clockConfig.get("rateSmoothingSpan", 5))
+            maxSpeed.setChecked(clockConfig.get("maxSpeed", False))
 
         self.layout().addRow("Tick:", tickDuration)
+        self.layout().addRow("Max speed:", maxSpeed)
+        self.layout().addRow("Rate window (s):", rateWindow)
+        self.layout().addRow("Rate smoothing:", rateSmoothing)
+        self.layout().addRow("Smoothing span:", rateSmoothingSpan)
 
         self.tickDuration = tickDuration
+        self.maxSpeed = maxSpeed
+        self.rateWindow = rateWindow
+        self.rateSmoothing = rateSmoothing
+        self.rateSmoothingSpan = rateSmoothingSpan
 
     def getClockConfig(self):
         tickDuration = self.tickDuration.value()
@@ -37,6 +71,12 @@ class ClockConfigPanel(QGroupBox):
         if tickDuration <= 0:
             raise ValueError("Tick duration must be greater than zero.")
         
+        # Settings without a field in the panel (e.g. engine) are kept as loaded
         return {
-            "tick": tickDuration
+            **self.clockConfig,
+            "tick": tickDuration,
+            "maxSpeed": self.maxSpeed.isChecked(),
+            "rateWindow": self.rateWindow.value(),
+            "rateSmoothing": self.rateSmoothing.currentText(),
+            "rateSmoothingSpan": self.rateSmoothingSpan.value(),
         }
\ No newline at end of file
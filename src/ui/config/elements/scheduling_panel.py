@@ -1,4 +1,5 @@
-from PyQt6.QtWidgets import QGroupBox, QFormLayout, QDoubleSpinBox, QComboBox
+from PyQt6.QtWidgets import QGroupBox, QFormLayout, QDoubleSpinBox, QComboBox, QSpinBox
+from algorithms.algorithm_factory import AVAILABLE_ALGORITHMS
 
 """
     Initializes the Scheduling configuration panel:
@@ -17,40 +18,80 @@ class SchedulingConfigPanel(QGroupBox):
         
         algorithmCombo = QComboBox()
         algorithmCombo.setObjectName("algorithmCombo")
-        self.algorithms = [
-            "First-Come, First-Served",
-            "Shortest Job First",
-            "Round Robin",
-            "Priority Scheduling (Non-Preemptive)",
-            "Priority Scheduling (Preemptive)",
-            "Multilevel Queue Scheduling",
-            "Earliest Deadline First",
-            "Rate Monotonic",
-            "Lottery Scheduling"
-        ]
+        # Only the algorithms the factory can build
+        self.algorithms = list(AVAILABLE_ALGORITHMS)
         algorithmCombo.addItems(self.algorithms)
         algorithmCombo.setToolTip("Select the scheduling algorithm for the simulation.")
 
         timeQuantum = QDoubleSpinBox()
-        timeQuantum.setToolTip("Time quantum for algorithms like Round Robin.")
+        timeQuantum.setToolTip("Time quantum for algorithms like Round Robin,\nscheduling latency of the Completely Fair Scheduler.")
         timeQuantum.setRange(0.1, 100.0)  
         timeQuantum.setSingleStep(0.1)
         timeQuantum.setObjectName("timeQuantum")
         
+        cpus = QSpinBox()
+        cpus.setToolTip("Number of simulated CPUs.")
+        cpus.setRange(1, 256)
+        cpus.setObjectName("cpus")
+
+        cpuScheduling = QComboBox()
+        cpuScheduling.addItems(["global", "partitioned"])
+        cpuScheduling.setToolTip("With several CPUs: one run queue shared by every CPU (global)\n"
+                                 "or one run queue per CPU with load balancing (partitioned).")
+        cpuScheduling.setObjectName("cpuScheduling")
+
+        loadBalanceInterval = QDoubleSpinBox()
+        loadBalanceInterval.setToolTip("Seconds between two load balancing passes of partitioned scheduling, 0 disables them.")
+        loadBalanceInterval.setRange(0.0, 1000.0)
+        loadBalanceInterval.setSingleStep(0.5)
+        loadBalanceInterval.setObjectName("loadBalanceInterval")
+
+        queueLevels = QSpinBox()
+        queueLevels.setToolTip("Levels of Multilevel Queue Scheduling, the quantum doubles at every level.")
+        queueLevels.setRange(1, 32)
+        queueLevels.setObjectName("queueLevels")
+
+        boostInterval = QDoubleSpinBox()
+        boostInterval.setToolTip("Seconds between two boosts of every process back to the highest level\n"
+                                 "(Multilevel Queue Scheduling), 0 never boosts.")
+        boostInterval.setRange(0.0, 10000.0)
+        boostInterval.setSingleStep(10.0)
+        boostInterval.setObjectName("boostInterval")
+
         algorithmCombo.setCurrentText("First-Come, First-Served")
         timeQuantum.setValue(2.0)
+        queueLevels.setValue(8)
+        boostInterval.setValue(50.0)
+        cpus.setValue(1)
+        cpuScheduling.setCurrentText("global")
+        loadBalanceInterval.setValue(0.0)
 
         if schedulingConfig:
             algorithm = schedulingConfig.get("schedulingAlgorithm", "First-Come, First-Served")
             algorithmCombo.setCurrentText(algorithm)
             
             timeQuantum.setValue(schedulingConfig.get("timeQuantum", 2.0))
+            queueLevels.setValue(schedulingConfig.get("queueLevels", 8))
+            boostInterval.setValue(schedulingConfig.get("boostInterval", 50.0))
+            cpus.setValue(schedulingConfig.get("cpus", 1))
+            cpuScheduling.setCurrentText(schedulingConfig.get("cpuScheduling", "global"))
+            loadBalanceInterval.setValue(schedulingConfig.get("loadBalanceInterval", 0.0))
 
         self.layout().addRow("Algorithm:", algorithmCombo)
         self.layout().addRow("Time Quantum:", timeQuantum)
+        self.layout().addRow("Queue Levels:", queueLevels)
+        self.layout().addRow("Boost Interval:", boostInterval)
+        self.layout().addRow("CPUs:", cpus)
+        self.layout().addRow("CPU Scheduling:", cpuScheduling)
+        self.layout().addRow("Load Balance Interval:", loadBalanceInterval)
 
         self.algorithmCombo = algorithmCombo
         self.timeQuantum = timeQuantum
+        self.queueLevels = queueLevels
+        self.boostInterval = boostInterval
+        self.cpus = cpus
+        self.cpuScheduling = cpuScheduling
+        self.loadBalanceInterval = loadBalanceInterval
 
     def getSchedulingConfig(self):
         algorithm = self.algorithmCombo.currentText()
@@ -61,5 +102,10 @@ class SchedulingConfigPanel(QGroupBox):
         
         return {
             "schedulingAlgorithm": algorithm,
-            "timeQuantum": timeQuantum
+            "timeQuantum": timeQuantum,
+            "queueLevels": self.queueLevels.value(),
+            "boostInterval": self.boostInterval.value(),
+            "cpus": self.cpus.value(),
+            "cpuScheduling": self.cpuScheduling.currentText(),
+            "loadBalanceInterval": self.loadBalanceInterval.value()
         }
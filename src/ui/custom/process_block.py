@@ -24,9 +24,15 @@ class ProcessBlock(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        layout.addWidget(QLabel(f"Process\n  ID: {process.pid if process else 0}"))
+        self.label = QLabel()
+        layout.addWidget(self.label)
         self.setLayout(layout)
 
+        self.setProcess(process)
+
+    # Shows another process in the same block
+    def setProcess(self, process: Process=None):
+        self.label.setText(f"Process\n  ID: {process.pid if process else 0}")
         self.process = process
 
     def mousePressEvent(self, event):
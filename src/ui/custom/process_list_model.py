@@ -0,0 +1,151 @@
+import itertools
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QListView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PyQt6.QtGui import QColor, QPen
+
+from processes.process import Process
+
+"""
+    List model of processes (ready queue, completed processes), in the order they were added.
+
+    Rows are only inserted or removed for the processes that changed, with the matching
+    begin/end notifications, so the view never rebuilds the whole queue.
+
+    Each process gets an increasing insertion number, kept in a list parallel to the rows: it stays
+    sorted, so the row of a PID is a binary search away and removals never scan the queue.
+
+    With a capacity, only the last `capacity` processes are kept: the oldest rows are dropped
+    as new ones come in, so a model fed for a whole simulation stays the same size.
+"""
+class ProcessListModel(QAbstractListModel):
+    ProcessRole = Qt.ItemDataRole.UserRole + 1
+
+    processes: List[Process]
+    # Insertion number of each row, and of each PID
+    sequences: List[int]
+    sequenceByPid: Dict[int, int]
+
+    def __init__(self, capacity: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self.processes = []
+        self.sequences = []
+        self.sequenceByPid = {}
+        self.nextSequence = itertools.count()
+        self.capacity = capacity
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.processes)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.processes):
+            return None
+
+        process = self.processes[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Process\n  ID: {process.pid}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"PID {process.pid}, priority {process.priority}, remaining {process.remaining_time:.2f}"
+        if role == ProcessListModel.ProcessRole:
+            return process
+
+        return None
+
+    def process(self, row) -> Process:
+        return self.processes[row]
+
+    # Appends the new processes at the end of the queue, dropping the oldest ones past the capacity
+    def appendProcesses(self, processList: Iterable[Process]):
+        newProcesses = [process for process in processList if process.pid not in self.sequenceByPid]
+        if self.capacity is not None:
+            newProcesses = newProcesses[max(len(newProcesses) - self.capacity, 0):]
+        if not newProcesses:
+            return
+
+        if self.capacity is not None:
+            self.removeOldest(len(self.processes) + len(newProcesses) - self.capacity)
+
+        first = len(self.processes)
+        self.beginInsertRows(QModelIndex(), first, first + len(newProcesses) - 1)
+        self.processes.extend(newProcesses)
+        for process in newProcesses:
+            sequence = next(self.nextSequence)
+            self.sequences.append(sequence)
+            self.sequenceByPid[process.pid] = sequence
+        self.endInsertRows()
+
+    # Removes the first count rows, if there are any
+    def removeOldest(self, count):
+        count = min(count, len(self.processes))
+        if count <= 0:
+            return
+
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        for process in self.processes[:count]:
+            del self.sequenceByPid[process.pid]
+        del self.processes[:count]
+        del self.sequences[:count]
+        self.endRemoveRows()
+
+    # Removes the given processes, consecutive rows are removed together
+    def removeProcesses(self, pids: Iterable[int]):
+        sequences = self.sequences
+        removed = [self.sequenceByPid.pop(pid) for pid in pids if pid in self.sequenceByPid]
+        rows = sorted((bisect_left(sequences, sequence) for sequence in removed), reverse=True)
+
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.processes[first:last + 1]
+            del sequences[first:last + 1]
+            self.endRemoveRows()
+
+"""
+    Paints a process like a ProcessBlock, only for the rows the view shows.
+"""
+class ProcessBlockDelegate(QStyledItemDelegate):
+    SIZE = QSize(100, 50)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(1, 1, -1, -1)
+        background = QColor("#B2EBF2") if option.state & QStyle.StateFlag.State_Selected else QColor("#E0F7FA")
+
+        painter.setPen(QPen(QColor("#4682B4"), 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 5, 5)
+
+        painter.setPen(QColor("#000000"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data(Qt.ItemDataRole.DisplayRole))
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return ProcessBlockDelegate.SIZE
+
+"""
+    Horizontal strip of ProcessBlocks over a ProcessListModel, only the visible rows are painted.
+"""
+class ProcessListView(QListView):
+    def __init__(self, model: ProcessListModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(ProcessBlockDelegate(self))
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setSpacing(5)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
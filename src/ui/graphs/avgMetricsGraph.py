@@ -1,22 +1,18 @@
 # ui/graphs/metricsGraph.py
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PyQt6.QtCore    import pyqtSlot
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure               import Figure
 from global_clock import GlobalClock
-
-class AvgMetricsGraph(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Holds (time, avg_turnaround, avg_waiting) samples
-        self.data = []
-
-        self.fig = Figure(dpi=100)
-        self.canvas = FigureCanvas(self.fig)
-        self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding,
-                                  QSizePolicy.Policy.Expanding)
-
-        self.ax = self.fig.add_subplot(111)
+from ui.graphs.chartRenderer import ChartRenderer, ChartView
+from ui.graphs.downsampledSeries import DownsampledSeries
+
+class AvgMetricsGraph(ChartView):
+    def __init__(self, renderer: ChartRenderer, parent=None):
+        super().__init__(renderer, parent)
+        # Holds (time, avg_turnaround), (time, avg_waiting) and (time, avg_response) samples
+        self.turnaroundSeries = DownsampledSeries()
+        self.waitingSeries = DownsampledSeries()
+        self.responseSeries = DownsampledSeries()
+
+        self.ax = self.figure.add_subplot(111)
         self.ax.set_title("Completition Metrics Average")
         self.ax.set_xlabel("Time (ms)")
         self.ax.set_ylabel("Units")
@@ -27,30 +23,29 @@ class AvgMetricsGraph(QWidget):
         self.line_response, = self.ax.plot([], [], label="Avg Response Time")
 
         self.ax.legend()
-        # Layout
-        layout = QVBoxLayout(self)
-        layout.addWidget(self.canvas)
 
-    # Receives current a list of completed processes and calculates averages .
+    # Receives a snapshot of the scheduler completion metrics, averages are already computed
     @pyqtSlot(object)
-    def updateGraph(self, completed):
-        if completed:
-            avg_turnaround = sum(p.turnaroundTime for p in completed) / len(completed)
-            avg_waiting    = sum(p.waitingTime    for p in completed) / len(completed)
-            avg_responseTime  = sum(((p.firstScheduling / 1000) - p.arrivalTime) for p in completed) / len(completed)
-        else:
-            avg_turnaround = avg_waiting = avg_responseTime = 0.0
-
-        self.data.append((GlobalClock.getTime(), avg_turnaround, avg_waiting, avg_responseTime))
+    def updateGraph(self, metrics):
+        currentTime = GlobalClock.getTime()
+        self.turnaroundSeries.append(currentTime, metrics["turnaroundTime"].mean)
+        self.waitingSeries.append(currentTime, metrics["waitingTime"].mean)
+        self.responseSeries.append(currentTime, metrics["responseTime"].mean)
+
         self.redraw()
 
     def redraw(self):
-        times, turns, waits, response = zip(*self.data)
+        self.requestRender((self.turnaroundSeries.arrays(), self.waitingSeries.arrays(), self.responseSeries.arrays()))
+
+    # Render thread
+    def draw(self, state, resized):
+        if state is not None:
+            turnaround, waiting, response = state
+            self.line_turn.set_data(*turnaround)
+            self.line_wait.set_data(*waiting)
+            self.line_response.set_data(*response)
 
-        self.line_turn.set_data(times, turns)
-        self.line_wait.set_data(times, waits)
-        self.line_response.set_data(times, response)
+            self.ax.relim()
+            self.ax.autoscale_view()
 
-        self.ax.relim()
-        self.ax.autoscale_view()
         self.canvas.draw()
@@ -1,50 +1,57 @@
 # ui/graphs/boxPlotMetricsGraph.py
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel
 from PyQt6.QtCore    import pyqtSlot
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure               import Figure
+from ui.graphs.chartRenderer import ChartRenderer, ChartView
 
-class BoxMetricsGraph(QWidget):
+class BoxMetricsGraph(ChartView):
     """
     Displays distributions of completion metrics (turnaround, waiting, response times) as
     box-and-whisker plots. Ideal for summarizing algorithm performance at simulation end.
+
+    Boxes are drawn from the quantile sketches of the scheduler metrics, so memory and
+    redraw cost stay constant however many processes complete.
     """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.turnaround_times = []
-        self.waiting_times = []
-        self.response_times = []
-
-        # Set up figure and canvas
-        self.layout = QVBoxLayout(self)
-        self.fig = Figure(dpi=100)
-        self.canvas = FigureCanvas(self.fig)
-        self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding,
-                                  QSizePolicy.Policy.Expanding)
-        self.layout.addWidget(self.canvas)
-
-        self.ax = self.fig.add_subplot(111)
+    SERIES = ["turnaroundTime", "waitingTime", "responseTime"]
+
+    def __init__(self, renderer: ChartRenderer, parent=None):
+        super().__init__(renderer, parent)
+
+        self.ax = self.figure.add_subplot(111)
         self.ax.set_title("Completion Metrics Distribution")
         self.ax.set_ylabel("Time (ms)")
 
 
     @pyqtSlot(object)
-    def updateGraph(self, completed):
+    def updateGraph(self, metrics):
         """
-        Receive list of completed processes at simulation end.
-        Each process has attributes: turnaroundTime, waitingTime, firstScheduling, arrivalTime.
+        Receive a snapshot of the scheduler completion metrics.
+        Each series has its count, min, max and quantiles (0.25, 0.5, 0.75, ...).
         """
-        if not completed:
+        if metrics["turnaroundTime"].count == 0:
             return
 
-        # Gather metrics
-        self.turnaround_times = [p.turnaroundTime for p in completed]
-        self.waiting_times    = [p.waitingTime    for p in completed]
-        self.response_times   = [ (p.firstScheduling / 1000.0) - p.arrivalTime for p in completed ]
-
-        self.redraw()
+        self.requestRender(metrics)
+
+    # Box stats for a series, whiskers at 1.5 IQR clamped to the observed range like boxplot does
+    def boxStats(self, statistic, label):
+        q1, median, q3 = statistic.quantiles[0.25], statistic.quantiles[0.5], statistic.quantiles[0.75]
+        iqr = q3 - q1
+
+        return {
+            "label": label,
+            "med": median,
+            "q1": q1,
+            "q3": q3,
+            "whislo": max(statistic.min, q1 - 1.5 * iqr),
+            "whishi": min(statistic.max, q3 + 1.5 * iqr),
+            "fliers": [],
+        }
+
+    # Render thread
+    def draw(self, metrics, resized):
+        if metrics is None:
+            self.canvas.draw()
+            return
 
-    def redraw(self):
         # Clear previous
         self.ax.clear()
 
@@ -52,10 +59,10 @@ class BoxMetricsGraph(QWidget):
         self.ax.set_title("Completion Metrics Distribution")
         self.ax.set_ylabel("Time (ms)")
 
-        data = [self.turnaround_times, self.waiting_times, self.response_times]
+        stats = [self.boxStats(metrics[name], str(index)) for index, name in enumerate(self.SERIES, start=1)]
 
         # Boxplot
-        bp = self.ax.boxplot(data, patch_artist=True)
+        bp = self.ax.bxp(stats, patch_artist=True)
 
         # Color the boxes
         colors = ['lightcoral', 'lightblue', 'lightgreen']
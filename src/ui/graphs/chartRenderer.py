@@ -0,0 +1,116 @@
+import threading
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QPainter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+"""
+    Renders charts with the Agg backend on its own thread.
+
+    Views post their latest state with request(), only the newest request of each view is kept,
+    so when rendering falls behind the intermediate frames are dropped instead of queued.
+    Finished frames come back to the GUI thread as QImages through frameReady.
+
+    Lives on the render thread (moveToThread), request() is the only method called from the GUI thread.
+"""
+class ChartRenderer(QObject):
+    frameReady = pyqtSignal(object, object)
+    wake = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.wakeQueued = False
+        self.droppedFrames = 0
+
+        self.wake.connect(self.renderPending)
+
+    def request(self, view, state, width, height):
+        with self.lock:
+            if view in self.pending:
+                self.droppedFrames += 1
+            self.pending[view] = (state, width, height)
+
+            if self.wakeQueued:
+                return
+            self.wakeQueued = True
+
+        self.wake.emit()
+
+    @pyqtSlot()
+    def renderPending(self):
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+            self.wakeQueued = False
+
+        for view, (state, width, height) in pending.items():
+            self.frameReady.emit(view, view.render(state, width, height))
+
+"""
+    Widget showing the frames of a chart rendered by a ChartRenderer.
+
+    Subclasses build their artists on self.figure and implement draw(state, resized), which runs
+    on the render thread and is the only code touching the figure once the view is created.
+    The GUI thread only calls requestRender(state) and paints the last finished frame.
+"""
+class ChartView(QWidget):
+    def __init__(self, renderer: ChartRenderer, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMinimumSize(200, 200)
+
+        self.renderer = renderer
+        self.renderer.frameReady.connect(self.onFrameReady)
+        self.image = None
+        self.state = None
+
+        self.figure = Figure(dpi=100)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.renderedSize = None
+
+    def requestRender(self, state):
+        self.state = state
+        ratio = self.devicePixelRatioF()
+        self.renderer.request(self, state, int(self.width() * ratio), int(self.height() * ratio))
+
+    # The state is None until the first requestRender, draw() must handle it
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.requestRender(self.state)
+
+    @pyqtSlot(object, object)
+    def onFrameReady(self, view, image):
+        if view is not self:
+            return
+
+        image.setDevicePixelRatio(self.devicePixelRatioF())
+        self.image = image
+        self.update()
+
+    def paintEvent(self, event):
+        if self.image is None:
+            return
+
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self.image)
+        painter.end()
+
+    # Render thread: resizes the figure if needed, draws the state and returns the frame
+    def render(self, state, width, height) -> QImage:
+        resized = (width, height) != self.renderedSize
+        if resized:
+            self.figure.set_size_inches(max(width, 1) / self.figure.dpi, max(height, 1) / self.figure.dpi)
+            self.renderedSize = (width, height)
+
+        self.draw(state, resized)
+
+        buffer = self.canvas.buffer_rgba()
+        return QImage(buffer, buffer.shape[1], buffer.shape[0], QImage.Format.Format_RGBA8888).copy()
+
+    # Render thread: updates the artists for the state and draws the figure
+    def draw(self, state, resized):
+        self.canvas.draw()
@@ -0,0 +1,129 @@
+import numpy as np
+
+from typing import List, Tuple
+
+# Largest-Triangle-Three-Buckets: keeps `threshold` points of a line that preserve its visual shape.
+# The first and last points are always kept, every bucket in between keeps the point forming the
+# largest triangle with the point kept in the previous bucket and the average of the next one.
+def lttb(times: np.ndarray, values: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    size = len(times)
+    if threshold >= size or threshold < 3:
+        return times, values
+
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0] = 0
+    kept[-1] = size - 1
+
+    # Buckets for every point except the first and the last one
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        if bucket + 2 < len(edges):
+            nextStart, nextEnd = edges[bucket + 1], edges[bucket + 2]
+            nextTime = times[nextStart:nextEnd].mean()
+            nextValue = values[nextStart:nextEnd].mean()
+        else:
+            nextTime, nextValue = times[-1], values[-1]
+
+        # Twice the triangle areas, the constant factor doesn't change which one is the largest
+        areas = np.abs((times[previous] - nextTime) * (values[start:end] - values[previous]) -
+                       (times[previous] - times[start:end]) * (nextValue - values[previous]))
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+
+    return times[kept], values[kept]
+
+"""
+    Fixed capacity ring buffer of (time, value) points in preallocated NumPy arrays.
+"""
+class RingBuffer:
+    __slots__ = ("times", "values", "start", "count")
+
+    def __init__(self, capacity):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.start = 0
+        self.count = 0
+
+    @property
+    def capacity(self):
+        return len(self.times)
+
+    def isFull(self):
+        return self.count == self.capacity
+
+    def append(self, time, value):
+        index = (self.start + self.count) % self.capacity
+        self.times[index] = time
+        self.values[index] = value
+        self.count += 1
+
+    def extend(self, times, values):
+        for time, value in zip(times, values):
+            self.append(time, value)
+
+    # Removes and returns the n oldest points
+    def popOldest(self, n) -> Tuple[np.ndarray, np.ndarray]:
+        indexes = (self.start + np.arange(n)) % self.capacity
+        times, values = self.times[indexes], self.values[indexes]
+
+        self.start = (self.start + n) % self.capacity
+        self.count -= n
+
+        return times, values
+
+    # Copies of the points, oldest first
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        indexes = (self.start + np.arange(self.count)) % self.capacity
+        return self.times[indexes], self.values[indexes]
+
+"""
+    Time series with bounded memory and a bounded number of points to plot.
+
+    Points are appended to a full resolution ring buffer (level 0). When a level fills up,
+    its oldest half is downsampled with LTTB to half as many points and moved to the next level,
+    so each level covers older data at a lower resolution. The last level downsamples itself
+    when it fills up. However long the series grows, it never holds more than
+    levels * capacity points.
+"""
+class DownsampledSeries:
+    def __init__(self, capacity=1024, levels=4):
+        self.levels: List[RingBuffer] = [RingBuffer(capacity) for _ in range(levels)]
+        self.lastTime = None
+        # Downsampled levels only change on a cascade, their concatenation is cached until then
+        self.history = (np.empty(0), np.empty(0))
+
+    def __len__(self):
+        return sum(level.count for level in self.levels)
+
+    def append(self, time, value):
+        self.levels[0].append(time, value)
+        self.lastTime = time
+
+        if self.levels[0].isFull():
+            self._cascade(0)
+
+    def _cascade(self, index):
+        level = self.levels[index]
+
+        if index + 1 < len(self.levels):
+            times, values = level.popOldest(level.capacity // 2)
+            self.levels[index + 1].extend(*lttb(times, values, level.capacity // 4))
+
+            if self.levels[index + 1].isFull():
+                self._cascade(index + 1)
+        else:
+            times, values = level.popOldest(level.count)
+            level.extend(*lttb(times, values, level.capacity // 2))
+
+        # Older levels first
+        parts = [level.ordered() for level in reversed(self.levels[1:])]
+        self.history = (np.concatenate([times for times, _ in parts]), np.concatenate([values for _, values in parts]))
+
+    # Every point kept, oldest first
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        times, values = self.levels[0].ordered()
+        return np.concatenate((self.history[0], times)), np.concatenate((self.history[1], values))
@@ -0,0 +1,157 @@
+import numpy as np
+
+from typing import List, Optional, Tuple
+
+from scheduler_core import (PROCESS_DISPATCHED, PROCESS_PREEMPTED, PROCESS_COMPLETED,
+                            PROCESS_RELEASED, DEADLINE_MISSED)
+
+# Kinds of the events that take the running process off the CPU
+SLICE_END_KINDS = (PROCESS_PREEMPTED, PROCESS_COMPLETED, PROCESS_RELEASED, DEADLINE_MISSED)
+
+"""
+    Append-only (start, end, pid) segments in growable NumPy arrays, ordered by time.
+"""
+class SegmentLevel:
+    def __init__(self, resolution, capacity=1024):
+        # Shortest segment of the level (seconds), 0 for the raw executions
+        self.resolution = resolution
+        self.starts = np.empty(capacity, dtype=np.float64)
+        self.ends = np.empty(capacity, dtype=np.float64)
+        self.pids = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, start, end, pid):
+        if self.count == len(self.starts):
+            self.starts = np.resize(self.starts, 2 * self.count)
+            self.ends = np.resize(self.ends, 2 * self.count)
+            self.pids = np.resize(self.pids, 2 * self.count)
+
+        self.starts[self.count] = start
+        self.ends[self.count] = end
+        self.pids[self.count] = pid
+        self.count += 1
+
+    # Segments overlapping [start, end]
+    def visible(self, start, end) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        first = np.searchsorted(self.ends[:self.count], start, side="right")
+        last = np.searchsorted(self.starts[:self.count], end, side="left")
+        return self.starts[first:last], self.ends[first:last], self.pids[first:last]
+
+"""
+    Merges the segments of the level below into segments of at least `resolution` seconds.
+
+    Segments are added to the open one until it spans the resolution, or until an idle gap at
+    least as long as the resolution shows up. A closed segment is attributed to the process
+    that ran the most inside it and is passed on to the next (coarser) level.
+"""
+class Coalescer:
+    def __init__(self, level: SegmentLevel, next: Optional["Coalescer"] = None):
+        self.level = level
+        self.next = next
+        self.start = None
+        self.end = None
+        self.runTimes = {}
+
+    def add(self, start, end, pid):
+        if self.start is not None and (start - self.end >= self.level.resolution or
+                                       self.end - self.start >= self.level.resolution):
+            self.close()
+
+        if self.start is None:
+            self.start = start
+        self.end = end
+        self.runTimes[pid] = self.runTimes.get(pid, 0) + end - start
+
+    def close(self):
+        pid = max(self.runTimes, key=self.runTimes.get)
+        self.level.append(self.start, self.end, pid)
+        if self.next:
+            self.next.add(self.start, self.end, pid)
+
+        self.start = None
+        self.runTimes = {}
+
+    # The segment still being merged, shown after the closed ones
+    def openSegment(self) -> Optional[Tuple[float, float, int]]:
+        if self.start is None:
+            return None
+        return self.start, self.end, max(self.runTimes, key=self.runTimes.get)
+
+"""
+    Executions of the processes on one CPU, pre-aggregated into levels of detail.
+
+    Level 0 keeps every execution slice (dispatch to preemption/completion). Each following level
+    merges the previous one into segments at least FACTOR times longer, so whatever the zoom the
+    view picks the level whose segments are about a pixel wide and draws a number of
+    rectangles bounded by its width, not by the number of slices.
+
+    Slices are built incrementally from scheduler events (live delta events or a recorded trace).
+"""
+class ExecutionTiles:
+    FACTOR = 4
+    # Shortest segment of level 1, in seconds
+    BASE_RESOLUTION = 0.01
+
+    def __init__(self, levels=10):
+        self.levels: List[SegmentLevel] = [SegmentLevel(0)]
+        self.levels += [SegmentLevel(ExecutionTiles.BASE_RESOLUTION * ExecutionTiles.FACTOR ** level) for level in range(levels - 1)]
+
+        self.coalescers: List[Coalescer] = []
+        next = None
+        for level in reversed(self.levels[1:]):
+            next = Coalescer(level, next)
+            self.coalescers.insert(0, next)
+
+        # Process on the CPU and since when, its slice isn't closed yet
+        self.running: Optional[Tuple[int, float]] = None
+        self.endTime = 0.0
+
+    def addEvent(self, kind, time, pid):
+        self.endTime = max(self.endTime, time)
+
+        if kind == PROCESS_DISPATCHED:
+            self.running = (pid, time)
+        elif kind in SLICE_END_KINDS and self.running and self.running[0] == pid:
+            self.addSlice(self.running[1], time, pid)
+            self.running = None
+
+    def addSlice(self, start, end, pid):
+        if end <= start:
+            return
+
+        self.levels[0].append(start, end, pid)
+        self.coalescers[0].add(start, end, pid)
+
+    # Replays the executions of one CPU of a trace recorded with TraceRecorder
+    def addTrace(self, reader, cpu=0):
+        records = reader.records[reader.records["cpu"] == cpu]
+        for kind, time, pid in zip(records["kind"].tolist(), records["time"].tolist(), records["pid"].tolist()):
+            self.addEvent(kind, time, pid)
+
+    # Coarsest level whose segments are still no longer than `resolution` seconds
+    def levelFor(self, resolution) -> int:
+        index = 0
+        while index + 1 < len(self.levels) and self.levels[index + 1].resolution <= resolution:
+            index += 1
+        return index
+
+    # Segments of the level overlapping [start, end], including the ones not closed yet
+    def segments(self, level, start, end, currentTime=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        starts, ends, pids = self.levels[level].visible(start, end)
+
+        # The open segment of each finer level continues the one of the level above it, oldest first
+        pending = [self.coalescers[index].openSegment() for index in range(level - 1, -1, -1)]
+        pending = [segment for segment in pending if segment]
+        if self.running:
+            pending.append((self.running[1], max(currentTime or self.endTime, self.running[1]), self.running[0]))
+
+        pending = [segment for segment in pending if segment[1] > start and segment[0] < end]
+        if pending:
+            starts = np.concatenate((starts, [segment[0] for segment in pending]))
+            ends = np.concatenate((ends, [segment[1] for segment in pending]))
+            pids = np.concatenate((pids, [segment[2] for segment in pending]))
+
+        return starts, ends, pids
@@ -0,0 +1,184 @@
+import math
+
+from typing import List, Optional
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QColor, QPainter, QPen
+
+from scheduler_core import SchedulerEvent
+from ui.graphs.executionTiles import ExecutionTiles
+
+# Colors of the processes, by PID
+PROCESS_COLORS = [QColor(color) for color in [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b",
+    "#e377c2", "#7f7f7f", "#bcbd22", "#17becf", "#4682B4", "#F08080"
+]]
+
+"""
+    Gantt timeline of the processes holding the CPUs, one lane per CPU.
+
+    Painted directly with QPainter from an ExecutionTiles per lane: every paint asks for the level of detail
+    whose segments are about a pixel wide, so it draws at most a few rectangles per pixel of width
+    whatever the zoom, batched in one drawRects() call per color.
+
+    - wheel: zooms around the mouse (around the latest time while following)
+    - drag: pans, which stops following the simulation
+    - double click: shows the whole run and follows the simulation again
+
+    While following, the view keeps its span and slides with the latest time.
+    Lanes get thinner with the number of CPUs, so 64 of them still fit in LANES_HEIGHT.
+"""
+class GanttChart(QWidget):
+    LANE_HEIGHT = 36
+    LANES_HEIGHT = 256
+    AXIS_HEIGHT = 20
+    MARGIN = 10
+    # Rectangles at least this wide (px) show the PID of their process
+    LABEL_WIDTH = 40
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setMinimumWidth(200)
+        self.setLanes(1)
+        # Visible window, in virtual seconds
+        self.viewStart = 0.0
+        self.viewSpan = 60.0
+        self.following = True
+        self.currentTime = 0.0
+        self.cursorTime: Optional[float] = None
+        self.dragX: Optional[float] = None
+
+    # One lane per CPU, clears the timeline
+    def setLanes(self, count):
+        self.lanes = [ExecutionTiles() for _ in range(count)]
+        self.laneHeight = max(1, min(GanttChart.LANE_HEIGHT, GanttChart.LANES_HEIGHT // count))
+        self.setFixedHeight(count * self.laneHeight + GanttChart.AXIS_HEIGHT + 2 * GanttChart.MARGIN)
+        self.update()
+
+    # Applies the scheduler delta events of one frame
+    def applyEvents(self, events: List[SchedulerEvent]):
+        for event in events:
+            self.lanes[event.cpu].addEvent(event.kind, event.time, event.process.pid)
+
+    # Moves the live edge of the timeline, repainted only while it is in view
+    def setCurrentTime(self, time):
+        self.currentTime = max(self.currentTime, time, max(lane.endTime for lane in self.lanes))
+
+        if self.following:
+            self.viewStart = max(0.0, self.currentTime - self.viewSpan)
+            self.update()
+        elif self.viewStart <= self.currentTime <= self.viewStart + self.viewSpan:
+            self.update()
+
+    # Marks a time of interest (the replay position), None removes the mark
+    def setCursorTime(self, time: Optional[float]):
+        self.cursorTime = time
+        self.update()
+
+    def plotWidth(self):
+        return max(1, self.width() - 2 * GanttChart.MARGIN)
+
+    def timeToX(self, time):
+        return GanttChart.MARGIN + (time - self.viewStart) / self.viewSpan * self.plotWidth()
+
+    def xToTime(self, x):
+        return self.viewStart + (x - GanttChart.MARGIN) / self.plotWidth() * self.viewSpan
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#FFFFFF"))
+
+        top = GanttChart.MARGIN
+        lanesHeight = len(self.lanes) * self.laneHeight
+        viewEnd = self.viewStart + self.viewSpan
+        level = self.lanes[0].levelFor(self.viewSpan / self.plotWidth())
+
+        rectangles = [[] for _ in PROCESS_COLORS]
+        labels = []
+        for index, lane in enumerate(self.lanes):
+            laneTop = top + index * self.laneHeight
+            starts, ends, pids = lane.segments(level, self.viewStart, viewEnd, self.currentTime)
+
+            # Clipped to the plot, at least a pixel wide
+            left = self.timeToX(starts.clip(self.viewStart, viewEnd))
+            right = self.timeToX(ends.clip(self.viewStart, viewEnd))
+            widths = (right - left).clip(1, None)
+
+            for x, width, pid in zip(left.tolist(), widths.tolist(), pids.tolist()):
+                rectangle = QRectF(x, laneTop, width, self.laneHeight)
+                rectangles[pid % len(PROCESS_COLORS)].append(rectangle)
+                if width >= GanttChart.LABEL_WIDTH and self.laneHeight >= 16:
+                    labels.append((rectangle, pid))
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color, colorRectangles in zip(PROCESS_COLORS, rectangles):
+            if colorRectangles:
+                painter.setBrush(color)
+                painter.drawRects(colorRectangles)
+
+        painter.setPen(QColor("#FFFFFF"))
+        for rectangle, pid in labels:
+            painter.drawText(rectangle, Qt.AlignmentFlag.AlignCenter, str(pid))
+
+        painter.setPen(QPen(QColor("#4682B4"), 1))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(QRectF(GanttChart.MARGIN, top, self.plotWidth(), lanesHeight))
+
+        self.paintAxis(painter, top + lanesHeight)
+
+        if self.cursorTime is not None and self.viewStart <= self.cursorTime <= viewEnd:
+            x = self.timeToX(self.cursorTime)
+            painter.setPen(QPen(QColor("#d62728"), 2))
+            painter.drawLine(QPointF(x, top - 4), QPointF(x, top + lanesHeight + 4))
+
+        painter.end()
+
+    # Ticks every 1, 2 or 5 times a power of ten seconds, about one per 100px
+    def paintAxis(self, painter, top):
+        rawStep = self.viewSpan / max(1, self.plotWidth() / 100)
+        magnitude = 10 ** math.floor(math.log10(rawStep))
+        step = next(factor * magnitude for factor in (1, 2, 5, 10) if factor * magnitude >= rawStep)
+
+        painter.setPen(QColor("#000000"))
+        for index in range(math.ceil(self.viewStart / step), math.floor((self.viewStart + self.viewSpan) / step) + 1):
+            tick = index * step
+            x = self.timeToX(tick)
+            painter.drawLine(QPointF(x, top), QPointF(x, top + 4))
+            painter.drawText(QRectF(x - 50, top + 4, 100, GanttChart.AXIS_HEIGHT - 4),
+                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, f"{tick:g} s")
+
+    def wheelEvent(self, event):
+        factor = 0.8 ** (event.angleDelta().y() / 120)
+        # While following, zooming keeps the live edge in place instead of the point under the mouse
+        anchor = self.currentTime if self.following else self.xToTime(event.position().x())
+
+        # Anywhere from a millisecond to ten times the whole run
+        span = min(max(self.viewSpan * factor, 0.001), 10 * max(self.currentTime, 60.0))
+        self.viewStart = max(0.0, anchor - (anchor - self.viewStart) * span / self.viewSpan)
+        self.viewSpan = span
+        self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.dragX = event.position().x()
+
+    def mouseMoveEvent(self, event):
+        if self.dragX is None:
+            return
+
+        x = event.position().x()
+        self.viewStart = max(0.0, self.viewStart - (x - self.dragX) / self.plotWidth() * self.viewSpan)
+        self.dragX = x
+        self.following = False
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self.dragX = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.viewStart = 0.0
+        self.viewSpan = max(self.currentTime, 1.0)
+        self.following = True
+        self.update()
@@ -0,0 +1,130 @@
+from global_clock import GlobalClock
+from ui.graphs.chartRenderer import ChartRenderer, ChartView
+from ui.graphs.downsampledSeries import DownsampledSeries
+from ui.graphs.slidingRate import SlidingRate
+
+"""
+    Line graph of a process count over time, with its rate of change on a second axis.
+
+    Frames are rendered by the ChartRenderer thread and blitted: the axes, grid and legend are
+    rendered once into a cached background and each frame only restores it and draws the two
+    lines on top. A frame without new data isn't requested at all, and a full draw only happens
+    when the data outgrows the axis limits (or the view is resized).
+
+    The history is a DownsampledSeries, so however long the simulation runs the graph
+    keeps a bounded number of points in memory and on screen. The rate line comes from a
+    SlidingRate estimator configured by the clock config (rateWindow, rateSmoothing).
+"""
+class OverTimeGraph(ChartView):
+    # An axis limit that has to grow grows by at least this factor, so it doesn't grow on every frame
+    GROWTH = 1.5
+
+    def __init__(self, renderer: ChartRenderer, title, ylabel, rateLabel, lineLabel, lineColor, rateColor, clockConfig=None, parent=None):
+        super().__init__(renderer, parent)
+        self.series = DownsampledSeries()
+        if clockConfig:
+            self.rate = SlidingRate(clockConfig.rateWindow * 1000, clockConfig.rateSmoothing, clockConfig.rateSmoothingSpan)
+        else:
+            self.rate = SlidingRate()
+        self.derivativeTimes = []
+        self.derivativeRates = []
+        # Highest values added so far, the limits never need to fit more than these
+        self.maxCount = 0
+        self.maxRate = 0
+        self.dirty = False
+        # Only used on the render thread
+        self.background = None
+
+        # Primary axis
+        self.axes = self.figure.add_subplot(111)
+        self.axes.set_title(title)
+        self.axes.set_xlabel('Time')
+        self.axes.set_ylabel(ylabel)
+        self.axes.grid(True)
+        self.axes.set_xlim(0, 12000)  # ms
+        self.axes.set_ylim(0, 6)
+
+        # Secondary axis for derivative
+        self.derivateAxes = self.axes.twinx()
+        self.derivateAxes.set_ylabel(rateLabel, color='blue')
+        self.derivateAxes.set_ylim(0, 1.2)
+
+        # Plot lines with labels, animated lines are left out of full draws and blitted instead
+        self.line, = self.axes.plot([], [], linestyle='-', color=lineColor, label=lineLabel, animated=True)
+        self.derivative_line, = self.derivateAxes.plot([], [], linestyle='-', color=rateColor, label=r'$\mathrm{d}N/\mathrm{d}t$', animated=True)
+
+        # Single combined legend
+        lines, labels = self.axes.get_legend_handles_labels()
+        dlines, dlabels = self.derivateAxes.get_legend_handles_labels()
+        self.axes.legend(lines + dlines, labels + dlabels, loc='upper left')
+
+    def drawLines(self):
+        self.axes.draw_artist(self.line)
+        self.derivateAxes.draw_artist(self.derivative_line)
+
+    # Requests a frame with the data added since the last one, if any
+    def redraw(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+
+        times, counts = self.series.arrays()
+        self.requestRender((times, counts, list(self.derivativeTimes), list(self.derivativeRates),
+                            self.maxCount, self.maxRate))
+
+    # Render thread: a full draw caches the background, otherwise only the lines are drawn over it
+    def draw(self, state, resized):
+        if state is None:
+            state = ([], [], [], [], 0, 0)
+        times, counts, derivativeTimes, derivativeRates, maxCount, maxRate = state
+
+        self.line.set_data(times, counts)
+        self.derivative_line.set_data(derivativeTimes, derivativeRates)
+
+        if self.growLimits(times[-1] if len(times) else 0, maxCount, maxRate) or resized or self.background is None:
+            self.canvas.draw()
+            self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        else:
+            self.canvas.restore_region(self.background)
+
+        self.drawLines()
+
+    # Grows the axis limits the data no longer fits in, returns whether any of them changed
+    def growLimits(self, lastTime, maxCount, maxRate):
+        grown = self.growLimit(self.axes.get_xlim, self.axes.set_xlim, lastTime)
+        grown |= self.growLimit(self.axes.get_ylim, self.axes.set_ylim, maxCount)
+        grown |= self.growLimit(self.derivateAxes.get_ylim, self.derivateAxes.set_ylim, maxRate)
+
+        return grown
+
+    def growLimit(self, getLimits, setLimits, value):
+        upper = getLimits()[1]
+        if value <= upper:
+            return False
+
+        setLimits(0, value * OverTimeGraph.GROWTH)
+        return True
+
+    def addNewPoint(self, count):
+        currentTime = GlobalClock.getTime()
+        if self.series.lastTime is not None and currentTime <= self.series.lastTime:
+            return
+
+        self.series.append(currentTime, count)
+        self.rate.addPoint(currentTime, count)
+        self.maxCount = max(self.maxCount, count)
+        self.dirty = True
+
+    def addNewDerivatePoint(self):
+        current_time = GlobalClock.getTime()
+        rate = self.rate.rate(current_time)
+        if rate is None:
+            return
+
+        self.derivativeTimes.append(current_time)
+        self.derivativeRates.append(rate)
+        self.maxRate = max(self.maxRate, rate)
+        if len(self.derivativeTimes) > 200:
+            self.derivativeTimes = self.derivativeTimes[-100:]
+            self.derivativeRates = self.derivativeRates[-100:]
+        self.dirty = True
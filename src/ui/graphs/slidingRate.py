@@ -0,0 +1,72 @@
+from collections import deque
+
+# Smoothing kernels applied to successive rate estimates
+SMOOTHING_KERNELS = ["none", "mean", "ema"]
+
+"""
+    Rate of change (dN/dt, per second) of a count over a sliding time window.
+
+    Points enter at the tail of a deque and leave from its head once they fall out of the window,
+    so every point is pushed and popped once and each estimate is O(1) amortized.
+
+    Successive estimates can be smoothed with a kernel over the last `span` estimates:
+    - none: the raw estimate
+    - mean: moving average, with a running sum
+    - ema: exponential moving average with alpha = 2 / (span + 1)
+"""
+class SlidingRate:
+    def __init__(self, window=7500, smoothing="none", span=5, minimumInterval=100, maximumRate=5.0):
+        if smoothing not in SMOOTHING_KERNELS:
+            raise ValueError(f"Unknown rate smoothing kernel: {smoothing}")
+
+        self.window = window
+        self.smoothing = smoothing
+        self.span = span
+        # Windows shorter than this (ms) give too noisy estimates, none is reported
+        self.minimumInterval = minimumInterval
+        self.maximumRate = maximumRate
+
+        self.points = deque()
+        self.recentRates = deque()
+        self.recentRatesSum = 0.0
+        self.smoothedRate = None
+
+    def addPoint(self, time, count):
+        self.points.append((time, count))
+        self._evict(time)
+
+    def _evict(self, currentTime):
+        while self.points and currentTime - self.points[0][0] > self.window:
+            self.points.popleft()
+
+    # Smoothed rate at currentTime, None if the window doesn't span enough time yet
+    def rate(self, currentTime):
+        self._evict(currentTime)
+        if len(self.points) < 2:
+            return None
+
+        t0, c0 = self.points[0]
+        t1, c1 = self.points[-1]
+        dt = t1 - t0
+        if dt <= self.minimumInterval:
+            return None
+
+        rate = (c1 - c0) / (dt / 1000.0)
+        rate = min(max(rate, 0), self.maximumRate)
+
+        return self._smooth(rate)
+
+    def _smooth(self, rate):
+        if self.smoothing == "mean":
+            self.recentRates.append(rate)
+            self.recentRatesSum += rate
+            if len(self.recentRates) > self.span:
+                self.recentRatesSum -= self.recentRates.popleft()
+            return self.recentRatesSum / len(self.recentRates)
+
+        if self.smoothing == "ema":
+            alpha = 2 / (self.span + 1)
+            self.smoothedRate = rate if self.smoothedRate is None else alpha * rate + (1 - alpha) * self.smoothedRate
+            return self.smoothedRate
+
+        return rate
@@ -11,7 +11,7 @@ from ui.graphs.waitingOverTimeGraph import WaitingOverTimeGraph
 
 from global_clock import GlobalClock
 class ClockPanel(QGroupBox):
-    def __init__(self, parent=None):
+    def __init__(self, renderer, clockConfig=None, parent=None):
         super().__init__("Time Panel", parent)
         self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(0, 0, 0, 0)  
@@ -54,8 +54,8 @@ class ClockPanel(QGroupBox):
         graph_layout = QHBoxLayout()
 
         # Initialize the graphs
-        self.completionOverTimeGraph = CompletionOverTimeGraph()
-        self.waitingOverTimeGraph = WaitingOverTimeGraph()
+        self.completionOverTimeGraph = CompletionOverTimeGraph(renderer, clockConfig)
+        self.waitingOverTimeGraph = WaitingOverTimeGraph(renderer, clockConfig)
 
         # Add the graphs to the horizontal layout
         graph_layout.addWidget(self.completionOverTimeGraph)
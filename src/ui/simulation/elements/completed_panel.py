@@ -1,16 +1,19 @@
 from typing import Dict, List
 from PyQt6.QtWidgets import (
     QWidget, QGroupBox, QLabel, QVBoxLayout, QHBoxLayout, 
-    QSizePolicy, QScrollArea, QGridLayout, QFrame
+    QSizePolicy, QGridLayout, QFrame
 )
 from PyQt6.QtCore import Qt, pyqtSlot
-from ui.custom.process_block import ProcessBlock
-from processes.process import Process
+from ui.custom.process_list_model import ProcessListModel, ProcessListView
+from scheduler_core import SchedulerEvent, PROCESS_COMPLETED
 
-import math
+# Completed processes shown in the queue, the oldest ones are dropped past it
+COMPLETED_QUEUE_ROWS = 500
 
 class CompletedPanel(QGroupBox):
-    completedProcessBlocks: Dict[int, ProcessBlock]
+    completedProcessesModel: ProcessListModel
+    # Processes completed since the simulation started, including the ones no longer shown
+    completedCount: int
     prioritiesLabels: Dict[int, QLabel]
     statisticsLabels: List[QLabel]
 
@@ -22,7 +25,8 @@ class CompletedPanel(QGroupBox):
         self.setLayout(self.mainLayout)
 
         self.config = config 
-        self.readyProcessBlocks = {}
+        self.completedProcessesModel = ProcessListModel(COMPLETED_QUEUE_ROWS)
+        self.completedCount = 0
         self.prioritiesLabels = {}
         
         self.completedProcessSection()
@@ -30,63 +34,38 @@ class CompletedPanel(QGroupBox):
         self.statisticsSection()
         self.mainLayout.addStretch(1)
 
-    @pyqtSlot(object, int)
-    def updateCompletedProcesses(self, processList: List[Process], processSwitchCount):
-        newPIDs = {process.pid for process in processList}
-        oldPIDs = set(self.readyProcessBlocks.keys())
-
-        removedPIDs = oldPIDs - newPIDs
-
-        for pid in removedPIDs:
-            removedBlock = self.readyProcessBlocks.pop(pid)
-            self.completedLayout.removeWidget(removedBlock)
-            removedBlock.setParent(None)
-            removedBlock.deleteLater()            
-
-        for process in processList:
-            pid = process.pid
-            if pid not in self.readyProcessBlocks:
-                newProcessBlock = ProcessBlock(process)
-                newProcessBlock.clicked.connect(self.updateCompletedProcessInformation)
-
-                self.readyProcessBlocks[pid] = newProcessBlock
-                self.completedLayout.addWidget(newProcessBlock)
-
-        #self.updatePrioritiesSection(processList)
-        self.updateStatistics(processList, processSwitchCount)
+    # Applies the scheduler delta events of one frame, only completions matter here
+    def applyEvents(self, events: List[SchedulerEvent]):
+        completed = [event.process for event in events if event.kind == PROCESS_COMPLETED]
+        self.completedCount += len(completed)
+        self.completedProcessesModel.appendProcesses(completed)
 
-    def updateStatistics(self, processList: List[Process], processSwitchCount):
-        numProcesses = len(processList)
+    # Receives a snapshot of the scheduler completion metrics, already aggregated
+    @pyqtSlot(object, int)
+    def updateStatistics(self, metrics, processSwitchCount):
+        completion = metrics["completionTime"]
         
-        if numProcesses == 0:
+        if completion.count == 0:
             return  
         
-        self.statisticsLabels["totalProcessCompleted"].setText(f"Total processes completed: {numProcesses}")
-
-        completionTimes = [process.completionTime for process in processList if process.completionTime is not None]
-        if completionTimes:
-            avgCompletionTime = sum(completionTimes) / len(completionTimes)
-            self.statisticsLabels["averageCompletitionTime"].setText(f"Average Completion time: {avgCompletionTime:.2f} (min: {min(completionTimes):.2f}, max: {max(completionTimes):.2f})")
-
-        # Calculate turnaround time statistics
-        turnaroundTimes = [process.turnaroundTime for process in processList if process.turnaroundTime > 0]
-        if turnaroundTimes:
-            avgTurnaroundTime = sum(turnaroundTimes) / len(turnaroundTimes)
-            self.statisticsLabels["averageTurnaroundTime"].setText(f"Average Turnaround time: {avgTurnaroundTime:.2f} (min: {min(turnaroundTimes):.2f}, max: {max(turnaroundTimes):.2f})")
-        
-            # Calculate turnaround variance
-            turnaroundVariance = sum((t - avgTurnaroundTime) ** 2 for t in turnaroundTimes) / len(turnaroundTimes)
-            self.statisticsLabels["turnaroundVariance"].setText(f"Turnaround variance: {turnaroundVariance:.2f}")
+        self.statisticsLabels["totalProcessCompleted"].setText(f"Total processes completed: {completion.count}")
+        self.statisticsLabels["averageCompletitionTime"].setText(f"Average Completion time: {completion.mean:.2f} (min: {completion.min:.2f}, max: {completion.max:.2f})")
+
+        # Turnaround time statistics
+        turnaround = metrics["turnaroundTime"]
+        self.statisticsLabels["averageTurnaroundTime"].setText(f"Average Turnaround time: {turnaround.mean:.2f} (min: {turnaround.min:.2f}, max: {turnaround.max:.2f})")
+        self.statisticsLabels["turnaroundVariance"].setText(f"Turnaround variance: {turnaround.variance:.2f}")
 
-        # Calculate waiting time statistics
-        waitingTimes = [process.waitingTime for process in processList if process.waitingTime >= 0]
-        if waitingTimes:
-            avgWaitingTime = sum(waitingTimes) / len(waitingTimes)
-            self.statisticsLabels["averageWaitingTime"].setText(f"Average Waiting time: {avgWaitingTime:.2f} (min: {min(waitingTimes):.2f}, max: {max(waitingTimes):.2f})")
+        # Waiting time statistics
+        waiting = metrics["waitingTime"]
+        self.statisticsLabels["averageWaitingTime"].setText(f"Average Waiting time: {waiting.mean:.2f} (min: {waiting.min:.2f}, max: {waiting.max:.2f})")
 
         # Process Switch Count
         self.statisticsLabels["processSwitchCount"].setText(f"Process switch count: {processSwitchCount}")
 
+    def onCompletedProcessClicked(self, index):
+        self.updateCompletedProcessInformation(self.completedProcessesModel.process(index.row()))
+
     def updateCompletedProcessInformation(self, process):
         if not process:
             for key in self.processInformationLabels:
@@ -160,26 +139,16 @@ class CompletedPanel(QGroupBox):
         
         self.mainLayout.addWidget(containerGroup)
     
-    # Creates completed queue section, which contains a list of completed ProcessBlocks
+    # Creates completed queue section, a horizontal list view that only paints the visible ProcessBlocks
     def completedQueueSection(self):
-        completedQueueGroup = QGroupBox("Completed Process Queue")
+        completedQueueGroup = QGroupBox(f"Completed Process Queue (last {COMPLETED_QUEUE_ROWS})")
         completedQueueGroup.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         
-        scrollArea = QScrollArea()
-        scrollArea.setWidgetResizable(True)
-        scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        scrollWidget = QWidget()
-        completedLayout = QHBoxLayout(scrollWidget)
-        completedLayout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        completedLayout.setContentsMargins(0, 0, 0, 0)
-        completedLayout.setSpacing(10)  
-        
-        scrollArea.setWidget(scrollWidget)
+        completedView = ProcessListView(self.completedProcessesModel)
+        completedView.clicked.connect(self.onCompletedProcessClicked)
         
         completedQueueLayout = QVBoxLayout()
-        completedQueueLayout.addWidget(scrollArea)
+        completedQueueLayout.addWidget(completedView)
         completedQueueGroup.setLayout(completedQueueLayout)
         completedQueueGroup.setMaximumHeight(150)
         completedQueueLayout.setContentsMargins(0, 0, 0, 0)
@@ -187,7 +156,7 @@ class CompletedPanel(QGroupBox):
 
         self.mainLayout.addWidget(completedQueueGroup)
 
-        self.completedLayout = completedLayout
+        self.completedView = completedView
         self.completedQueueGroup = completedQueueGroup
     
     def statisticsSection(self):
@@ -1,17 +1,20 @@
 from typing import Dict, List
 from PyQt6.QtWidgets import (
     QWidget, QGroupBox, QLabel, QVBoxLayout, QHBoxLayout, 
-    QSizePolicy, QScrollArea, QGridLayout
+    QSizePolicy, QGridLayout
 )
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt, pyqtSlot
 from ui.custom.process_block import ProcessBlock
+from ui.custom.process_list_model import ProcessListModel, ProcessListView
+from algorithms.process_heap import ProcessHeap
 from processes.process import Process
+from scheduler_core import SchedulerEvent, PROCESS_ARRIVED, PROCESS_DISPATCHED, PROCESS_COMPLETED, DEADLINE_MISSED
 
 import math
 
 class ProcessesPanel(QGroupBox):
-    readyProcessBlocks: Dict[int, ProcessBlock]
+    readyProcessesModel: ProcessListModel
     prioritiesLabels: Dict[int, QLabel]
     statisticsLabels: List[QLabel]
 
@@ -23,8 +26,16 @@ class ProcessesPanel(QGroupBox):
         self.setLayout(self.mainLayout)
 
         self.config = config 
-        self.readyProcessBlocks = {}
+        self.readyProcessesModel = ProcessListModel()
         self.prioritiesLabels = {}
+        self.runningProcess = None
+
+        # Ready set statistics, kept up to date as processes arrive and leave
+        self.priorityCounts = {i: 0 for i in range(10)}
+        self.totalBurstTime = 0.0
+        self.totalSquaredBurstTime = 0.0
+        self.shortestBursts = ProcessHeap(key=lambda process: process.burstTime)
+        self.longestBursts = ProcessHeap(key=lambda process: -process.burstTime)
         
         self.runningProcessSection()
         self.readyQueueSection()
@@ -33,14 +44,47 @@ class ProcessesPanel(QGroupBox):
 
         self.mainLayout.addStretch(1)
 
+    # Applies the scheduler delta events of one frame, in order
+    def applyEvents(self, events: List[SchedulerEvent]):
+        if not events:
+            return
+
+        arrived = []
+        removed = []
+        runningProcess = self.runningProcess
+
+        for event in events:
+            if event.kind == PROCESS_ARRIVED:
+                arrived.append(event.process)
+            elif event.kind == PROCESS_DISPATCHED:
+                # With several CPUs the block follows the first one, the timeline shows them all
+                if event.cpu == 0:
+                    runningProcess = event.process
+            else:
+                # Preempted, completed, released or dropped, it isn't running anymore
+                if event.process is runningProcess:
+                    runningProcess = None
+                if event.kind == PROCESS_COMPLETED or event.kind == DEADLINE_MISSED:
+                    removed.append(event.process)
+
+        self.readyProcessesModel.appendProcesses(arrived)
+        self.readyProcessesModel.removeProcesses([process.pid for process in removed])
+
+        for process in arrived:
+            self.addToStatistics(process)
+        for process in removed:
+            self.removeFromStatistics(process)
+
+        self.updatePrioritiesSection()
+        self.updateStatistics()
+        self.updateRunningProcess(runningProcess)
+
     @pyqtSlot(object)
     def updateRunningProcess(self, process: Process):
-        if self.runningProcessBlock:
-            self.runningProcessLayout.removeWidget(self.runningProcessBlock)
-            self.runningProcessBlock.deleteLater()
-
-        self.runningProcessBlock = ProcessBlock(process)
-        self.runningProcessLayout.insertWidget(0, self.runningProcessBlock)
+        # The block only changes with the process, the information below is refreshed every time
+        if process is not self.runningProcess:
+            self.runningProcessBlock.setProcess(process)
+            self.runningProcess = process
 
         if not process:
             for key in self.runningInformationLabels:
@@ -60,30 +104,22 @@ class ProcessesPanel(QGroupBox):
         self.runningInformationLabels["completedTime"].setText(f"Completed Time: {completed}")
         self.runningInformationLabels["remainingTime"].setText(f"Remaining Time: {remaining}")
 
-    @pyqtSlot(object)
-    def updateReadyProcesses(self, processList: List[Process]):
-        newPIDs = {process.pid for process in processList}
-        oldPIDs = set(self.readyProcessBlocks.keys())
-
-        removedPIDs = oldPIDs - newPIDs
-
-        for pid in removedPIDs:
-            removedBlock = self.readyProcessBlocks.pop(pid)
-            self.readyLayout.removeWidget(removedBlock)
-            removedBlock.setParent(None)
-            removedBlock.deleteLater()            
+    def addToStatistics(self, process: Process):
+        self.priorityCounts[process.priority] += 1
+        self.totalBurstTime += process.burstTime
+        self.totalSquaredBurstTime += process.burstTime ** 2
+        self.shortestBursts.push(process)
+        self.longestBursts.push(process)
 
-        for process in processList:
-            pid = process.pid
-            if pid not in self.readyProcessBlocks:
-                newProcessBlock = ProcessBlock(process)
-                newProcessBlock.clicked.connect(self.updateProcessInformation)
+    def removeFromStatistics(self, process: Process):
+        self.priorityCounts[process.priority] -= 1
+        self.totalBurstTime -= process.burstTime
+        self.totalSquaredBurstTime -= process.burstTime ** 2
+        self.shortestBursts.discard(process)
+        self.longestBursts.discard(process)
 
-                self.readyProcessBlocks[pid] = newProcessBlock
-                self.readyLayout.addWidget(newProcessBlock)
-
-        self.updatePrioritiesSection(processList)
-        self.updateStatistics(processList)
+    def onReadyProcessClicked(self, index):
+        self.updateProcessInformation(self.readyProcessesModel.process(index.row()))
 
     def updateProcessInformation(self, process: Process):
         if not process:
@@ -116,41 +152,44 @@ class ProcessesPanel(QGroupBox):
         self.processInformationLabels["status"].setText(f"Status: {status}")
 
 
-    def updatePrioritiesSection(self, processList: List[Process]):
-        if len(processList) == 0:
-            return
-
-        priorityCounts = {i: 0 for i in range(10)}
-
-        for process in processList:
-            priorityCounts[process.priority] += 1
+    def updatePrioritiesSection(self):
+        numProcesses = self.readyProcessesModel.rowCount()
 
-        for priority, count in priorityCounts.items():
+        # Every count is back to zero once the ready queue is empty
+        for priority, count in self.priorityCounts.items():
+            share = (count / numProcesses) * 100 if numProcesses else 0.0
             self.prioritiesLabels.get(priority).setText(
-                f"Priority {priority} ({self.config['processGeneration']['priorities']['weights'][priority]:.2f}): {count} processes         ({(count / len(processList)) * 100:.2f}%)")
+                f"Priority {priority} ({self.config['processGeneration']['priorities']['weights'][priority]:.2f}): {count} processes         ({share:.2f}%)")
 
-    def updateStatistics(self, processList: List[Process]):
-        numProcesses = len(processList)
+    def updateStatistics(self):
+        numProcesses = self.readyProcessesModel.rowCount()
         
         if numProcesses == 0:
-            return  
+            # Nothing waiting, the running sums only hold rounding errors by now
+            self.totalBurstTime = 0.0
+            self.totalSquaredBurstTime = 0.0
+            self.statisticsLabels["totalExpectedTime"].setText("Total expected execution time: 0.00")
+            self.statisticsLabels["averageExecutionTime"].setText("Average Execution Time: 0.00   (min: 0.00, max: 0.00)")
+            self.statisticsLabels["standardDeviation"].setText("Standard Deviation of Burst Time: 0.00")
+            self.statisticsLabels["averageInterArrivalTime"].setText("Average Inter-Arrival Time: 0.00")
+            self.statisticsLabels["totalNumber"].setText("Total number of processes: 0")
+            return
 
-        totalBurstTimes = sum(process.burstTime for process in processList)
-        self.statisticsLabels["totalExpectedTime"].setText(f"Total expected execution time: {totalBurstTimes:.2f}")
+        self.statisticsLabels["totalExpectedTime"].setText(f"Total expected execution time: {self.totalBurstTime:.2f}")
         
         # Average execution time        
-        averageBurstTime = totalBurstTimes / numProcesses
-        minBurstTime = min(process.burstTime for process in processList)
-        maxBurstTime = max(process.burstTime for process in processList)
+        averageBurstTime = self.totalBurstTime / numProcesses
+        minBurstTime = self.shortestBursts.peek().burstTime
+        maxBurstTime = self.longestBursts.peek().burstTime
         self.statisticsLabels["averageExecutionTime"].setText(f"Average Execution Time: {averageBurstTime:.2f}   (min: {minBurstTime:.2f}, max: {maxBurstTime:.2f})")
         
         # Standard Deviation of burst time
-        standardDeviation = math.sqrt(sum((process.burstTime - averageBurstTime) ** 2 for process in processList) / numProcesses)
+        standardDeviation = math.sqrt(max(self.totalSquaredBurstTime / numProcesses - averageBurstTime ** 2, 0.0))
         self.statisticsLabels["standardDeviation"].setText(f"Standard Deviation of Burst Time: {standardDeviation:.2f}")
         
-        # Average inter-arrival time
-        sortedArrivalTimes = sorted(process.arrivalTime for process in processList)
-        averageInterArrivalTime = sum(sortedArrivalTimes[i+1] - sortedArrivalTimes[i] for i in range(len(sortedArrivalTimes) - 1)) / (numProcesses - 1) if numProcesses > 1 else 0
+        # Average inter-arrival time, rows are in arrival order so only the first and last are needed
+        processes = self.readyProcessesModel.processes
+        averageInterArrivalTime = (processes[-1].arrivalTime - processes[0].arrivalTime) / (numProcesses - 1) if numProcesses > 1 else 0
         self.statisticsLabels["averageInterArrivalTime"].setText(f"Average Inter-Arrival Time: {averageInterArrivalTime:.2f}")
         
         # Total number of processes
@@ -206,26 +245,16 @@ class ProcessesPanel(QGroupBox):
         self.mainLayout.addWidget(containerGroup)
         self.runningProcessLayout = runningProcessLayout
 
-    # Creates ready queue section, which contains a list of ProcessBlocks
+    # Creates ready queue section, a horizontal list view that only paints the visible ProcessBlocks
     def readyQueueSection(self):
         readyQueueGroup = QGroupBox("Ready Process Queue")
         readyQueueGroup.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         
-        scrollArea = QScrollArea()
-        scrollArea.setWidgetResizable(True)
-        scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        scrollWidget = QWidget()
-        readyLayout = QHBoxLayout(scrollWidget)
-        readyLayout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        readyLayout.setContentsMargins(0, 0, 0, 0)
-        readyLayout.setSpacing(10)  
-        
-        scrollArea.setWidget(scrollWidget)
+        readyView = ProcessListView(self.readyProcessesModel)
+        readyView.clicked.connect(self.onReadyProcessClicked)
         
         readyQueueLayout = QVBoxLayout()
-        readyQueueLayout.addWidget(scrollArea)
+        readyQueueLayout.addWidget(readyView)
         readyQueueGroup.setLayout(readyQueueLayout)
         readyQueueGroup.setMaximumHeight(150)
         readyQueueLayout.setContentsMargins(0, 0, 0, 0)
@@ -233,7 +262,7 @@ class ProcessesPanel(QGroupBox):
 
         self.mainLayout.addWidget(readyQueueGroup)
 
-        self.readyLayout = readyLayout
+        self.readyView = readyView
         self.readyQueueGroup = readyQueueGroup
 
     def processInformation(self):
@@ -0,0 +1,68 @@
+import math
+
+from PyQt6.QtWidgets import QGroupBox, QLabel, QVBoxLayout, QHBoxLayout, QSlider, QListView, QSizePolicy
+from PyQt6.QtCore import Qt, QStringListModel, pyqtSlot
+
+from ui.custom.process_list_model import ProcessBlockDelegate
+from trace_replay import TraceReplay
+
+"""
+    Scrubs through a recorded trace once the simulation is over.
+
+    Every slider position (virtual milliseconds) shows the state at that time from
+    TraceReplay.stateAt(): the running processes, the waiting processes and the counters.
+"""
+class ReplayPanel(QGroupBox):
+    def __init__(self, parent=None):
+        super().__init__("Replay", parent)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
+        self.replay = None
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        sliderLayout = QHBoxLayout()
+        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self.slider.valueChanged.connect(self.showTime)
+        self.timeLabel = QLabel("0.000 s")
+        sliderLayout.addWidget(self.slider, stretch=1)
+        sliderLayout.addWidget(self.timeLabel)
+        layout.addLayout(sliderLayout)
+
+        self.runningLabel = QLabel()
+        self.countersLabel = QLabel()
+        layout.addWidget(self.runningLabel)
+        layout.addWidget(self.countersLabel)
+
+        # Only PIDs are recorded, the blocks show them like the ready queue does
+        self.waitingModel = QStringListModel()
+        self.waitingView = QListView()
+        self.waitingView.setModel(self.waitingModel)
+        self.waitingView.setItemDelegate(ProcessBlockDelegate(self.waitingView))
+        self.waitingView.setFlow(QListView.Flow.LeftToRight)
+        self.waitingView.setWrapping(False)
+        self.waitingView.setUniformItemSizes(True)
+        self.waitingView.setSpacing(5)
+        self.waitingView.setFixedHeight(ProcessBlockDelegate.SIZE.height() + 30)
+        self.waitingView.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        layout.addWidget(self.waitingView)
+
+    def setReplay(self, replay: TraceReplay):
+        self.replay = replay
+        # Rounded outwards so both ends include the first and last events
+        self.slider.setRange(math.floor(replay.startTime * 1000), math.ceil(replay.endTime * 1000))
+        self.slider.setValue(self.slider.maximum())
+        self.showTime(self.slider.value())
+
+    @pyqtSlot(int)
+    def showTime(self, milliseconds):
+        if not self.replay:
+            return
+
+        state = self.replay.stateAt(milliseconds / 1000)
+
+        self.timeLabel.setText(f"{milliseconds / 1000:.3f} s")
+        self.runningLabel.setText(f"Running: {state.describeRunning(self.replay.cpus, limit=6)}")
+        self.countersLabel.setText(f"Waiting: {len(state.waiting)}   Completed: {state.completed}   "
+                                   f"Deadline misses: {state.deadlineMisses}   Switches: {state.processSwitchCount}")
+        self.waitingModel.setStringList([f"Process\n  ID: {pid}" for pid in state.waiting])
@@ -8,10 +8,15 @@ from ui.simulation.elements.process_panel import ProcessesPanel
 from ui.simulation.elements.completed_panel import CompletedPanel 
 from ui.simulation.elements.config_panel import ConfigPanel
 from ui.simulation.elements.clock_panel import ClockPanel
+from ui.simulation.elements.replay_panel import ReplayPanel
 from ui.graphs.avgMetricsGraph import AvgMetricsGraph
 from ui.graphs.boxMetricsGraph import BoxMetricsGraph
+from ui.graphs.chartRenderer import ChartRenderer
+from ui.graphs.ganttChart import GanttChart
 
 from simulation import Simulation
+from event_trace import TraceReader
+from trace_replay import TraceReplay
 from global_clock import GlobalClock
 
 class SimulationWindow(QMainWindow):
@@ -21,7 +26,10 @@ class SimulationWindow(QMainWindow):
 
         self.simulationConfig = simulationConfig
         self.simulation = Simulation(simulationConfig)
+        # Last metrics snapshot sent by the scheduler, the metrics themselves belong to the clock thread
+        self.latestMetrics = None
 
+        self.initializeRenderThread()
         self.buildSimulationWindow()
         self.initializeThreads()
         self.initializeUpdateTimer()
@@ -31,12 +39,25 @@ class SimulationWindow(QMainWindow):
 
     # Initialize our clock threads in order to not block main thread
     # which runs at simulation speed
-    #   - runTickBased() (from ClockWorker) runs on clockThread
+    #   - run() (from ClockWorker) runs on clockThread
     def initializeThreads(self):
         self.clockThread = QThread(self)
         self.simulation.clockWorker.moveToThread(self.clockThread)
-        self.clockThread.started.connect(self.simulation.clockWorker.runTickBased)        
+        self.clockThread.started.connect(self.simulation.clockWorker.run)        
     
+    # Charts are rasterized on their own thread, the main thread only paints finished frames
+    def initializeRenderThread(self):
+        self.renderThread = QThread(self)
+        self.chartRenderer = ChartRenderer()
+        self.chartRenderer.moveToThread(self.renderThread)
+        self.renderThread.start()
+
+    def closeEvent(self, event):
+        self.updateUITimer.stop()
+        self.renderThread.quit()
+        self.renderThread.wait()
+        super().closeEvent(event)
+
     # Initializes a clock which updates the time-related UI
     #   - updateGlobalTim and updateTimeRelatedUI run on mainThread
     #   - runs at 60fps
@@ -48,35 +69,61 @@ class SimulationWindow(QMainWindow):
 
     # Subscribe event's in other to update our GUI when some event occurs
     def subscribeUpdateEvents(self):
-        self.simulation.schedulerWorker.updateProcessesDisplay.connect(self.processesPanel.updateReadyProcesses)
-        self.simulation.schedulerWorker.updateRunningProcessDisplay.connect(self.processesPanel.updateRunningProcess)
-        self.simulation.schedulerWorker.updateCompletedProcessesDisplay.connect(self.completedPanel.updateCompletedProcesses)
+        self.simulation.schedulerWorker.updateMetricsDisplay.connect(self.completedPanel.updateStatistics)
+        self.simulation.schedulerWorker.updateMetricsDisplay.connect(self.cacheMetrics)
       
         self.simulation.clockWorker.updateSimulationTimeUI.connect(self.updateSimulationTimeUI)
+        self.simulation.clockWorker.simulationFinished.connect(self.enterReplayMode)
 
-    def updateSimulationTimeUI(self):
-        schedulerWorker = self.simulation.schedulerWorker
+    @pyqtSlot(object, int)
+    def cacheMetrics(self, metrics, processSwitchCount):
+        self.latestMetrics = metrics
 
+    def updateSimulationTimeUI(self):
         self.clockPanel.completionOverTimeGraph.addNewDerivatePoint()
         self.clockPanel.waitingOverTimeGraph.addNewDerivatePoint()
-        
-        self.boxMetricsGraph.updateGraph(schedulerWorker.completedProcesses)
-        self.avgMetricsGraph.updateGraph(schedulerWorker.completedProcesses)
+
+        # Refreshes the remaining time of the running process
+        self.processesPanel.updateRunningProcess(self.processesPanel.runningProcess)
+
+        if self.latestMetrics is not None:
+            self.boxMetricsGraph.updateGraph(self.latestMetrics)
+            self.avgMetricsGraph.updateGraph(self.latestMetrics)
 
     # At 60fps updates our time-related GUI 
+    # and applies the scheduler events of this frame to the panels
     def updateRealTimeUI(self):
-        schedulerWorker = self.simulation.schedulerWorker
+        events = self.simulation.schedulerWorker.takeEvents()
+        self.processesPanel.applyEvents(events)
+        self.completedPanel.applyEvents(events)
+        self.ganttChart.applyEvents(events)
+        self.ganttChart.setCurrentTime(GlobalClock.getTime() / 1000)
+
         self.clockPanel.updateClockDisplay()
 
-        self.clockPanel.completionOverTimeGraph.addNewPoint(len(schedulerWorker.completedProcesses))
-        self.clockPanel.waitingOverTimeGraph.addNewPoint(len(schedulerWorker.readyProcesses))
+        self.clockPanel.completionOverTimeGraph.addNewPoint(self.completedPanel.completedCount)
+        self.clockPanel.waitingOverTimeGraph.addNewPoint(self.processesPanel.readyProcessesModel.rowCount())
+        self.clockPanel.completionOverTimeGraph.redraw()
+        self.clockPanel.waitingOverTimeGraph.redraw()
+
+
+    # Once the simulation is over its trace, if it was recorded, can be scrubbed through
+    @pyqtSlot()
+    def enterReplayMode(self):
+        tracePath = self.simulation.config.tracePath
+        if not tracePath:
+            return
 
+        self.replayPanel.slider.valueChanged.connect(lambda milliseconds: self.ganttChart.setCursorTime(milliseconds / 1000))
+        self.replayPanel.setReplay(TraceReplay(TraceReader(tracePath)))
+        self.replayPanel.show()
 
     """
         Builds the simulation window in the following format:
         -----------------------------------------------------
         |   Processes Panel     |  Completed Process Panel  |
         |     Clock Panel       |         Graphs            |
+        |  Replay (when over)   |       CPU Timeline        |
         -----------------------------------------------------
     """
     def buildSimulationWindow(self):
@@ -97,12 +144,16 @@ class SimulationWindow(QMainWindow):
         leftColumn.setSpacing(0)
         leftColumn.addWidget(self.processesPanel)
         leftColumn.addWidget(self.bottomLeftPanel)
+        self.replayPanel = ReplayPanel()
+        self.replayPanel.hide()
+        leftColumn.addWidget(self.replayPanel)
         
         # Right column
         rightColumn = QVBoxLayout()
         rightColumn.setSpacing(0)
         rightColumn.addWidget(self.completedPanel)
         rightColumn.addWidget(self.bottomRightPanel)
+        rightColumn.addWidget(self.createTimelinePanel())
 
         contentLayout.addLayout(leftColumn)
         contentLayout.addLayout(rightColumn)
@@ -132,20 +183,30 @@ class SimulationWindow(QMainWindow):
         bottomLeftPanel = QWidget()
         bottomLeftLayout = QHBoxLayout(bottomLeftPanel)
 
-        self.clockPanel = ClockPanel()
+        self.clockPanel = ClockPanel(self.chartRenderer, self.simulation.config.clockConfig)
 
         bottomLeftLayout.addWidget(self.clockPanel, stretch=1)
 
         return bottomLeftPanel
     
+    def createTimelinePanel(self):
+        timelinePanel = QGroupBox("CPU Timeline")
+        layout = QVBoxLayout(timelinePanel)
+
+        self.ganttChart = GanttChart()
+        self.ganttChart.setLanes(self.simulation.config.schedulingConfig.cpus)
+        layout.addWidget(self.ganttChart)
+
+        return timelinePanel
+
     def createBottomRightPanel(self):
         bottom_right_panel = QGroupBox("Metrics Over Time")
         bottom_right_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
         layout = QVBoxLayout()
 
-        self.avgMetricsGraph = AvgMetricsGraph(parent=self)
-        self.boxMetricsGraph = BoxMetricsGraph(parent=self)
+        self.avgMetricsGraph = AvgMetricsGraph(self.chartRenderer, parent=self)
+        self.boxMetricsGraph = BoxMetricsGraph(self.chartRenderer, parent=self)
         layout.addWidget(self.avgMetricsGraph)
         layout.addWidget(self.boxMetricsGraph)
 